@@ -0,0 +1,34 @@
+import sqlite3
+
+from PySide6.QtCore import QObject, Signal
+
+
+class AnalyticsWorker(QObject):
+    """Adds the stored events to an OccupancyPortfolio in a worker thread.
+
+    Events that are already loaded are snapshotted into the portfolio on the
+    GUI thread before the worker starts; the worker only reads files.
+    """
+
+    finished = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, storage, portfolio, event_ids):
+        super().__init__()
+        self.storage = storage
+        self.portfolio = portfolio
+        self.event_ids = event_ids
+
+    def run(self):
+        try:
+            for event_id in self.event_ids:
+                snapshot = self.storage.open_snapshot(event_id)
+                if snapshot is not None:
+                    with snapshot:
+                        self.portfolio.add_snapshot(snapshot)
+                else:
+                    self.portfolio.add_event_data(self.storage.load_event_data(event_id))
+        except (OSError, ValueError, KeyError, sqlite3.Error) as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(self.portfolio)
@@ -0,0 +1,65 @@
+import threading
+
+from PySide6.QtCore import QObject, Signal
+
+from backend.guest_import import iter_guest_chunks
+
+
+class GuestImportWorker(QObject):
+    """Reads and validates a guest file in a worker thread.
+
+    Guests are handed to the GUI thread in chunks through `chunk_ready`, so
+    the event itself is only modified on the GUI thread. The next chunk is
+    only sent once the GUI has called `chunk_taken` for the previous one,
+    so a busy GUI thread never has more than one chunk waiting.
+
+    `run` blocks the worker thread's event loop, so `cancel` and
+    `chunk_taken` are plain thread-safe methods, called directly from the
+    GUI thread (not through queued signals).
+    """
+
+    chunk_ready = Signal(object)
+    progress = Signal(int)
+    finished = Signal(int, object)
+    failed = Signal(str)
+
+    CHUNK_SIZE = 5000
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self._cancelled = threading.Event()
+        self._chunk_slot = threading.Semaphore(1)
+        self._last_percent = -1
+
+    def cancel(self):
+        self._cancelled.set()
+        self._chunk_slot.release()  # wakes up run() if it waits for the GUI
+
+    def is_cancelled(self):
+        return self._cancelled.is_set()
+
+    def chunk_taken(self):
+        """Called by the GUI thread once it has added the last chunk"""
+        self._chunk_slot.release()
+
+    def _report_progress(self, done, total):
+        percent = done * 100 // total if total else 100
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.progress.emit(percent)
+
+    def run(self):
+        errors = []
+        imported = 0
+        try:
+            for chunk in iter_guest_chunks(self.path, self.CHUNK_SIZE, self._report_progress, errors):
+                self._chunk_slot.acquire()
+                if self._cancelled.is_set():
+                    break
+                imported += len(chunk)
+                self.chunk_ready.emit(chunk)
+        except (OSError, UnicodeDecodeError, ValueError) as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(imported, errors)
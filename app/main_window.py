@@ -1,36 +1,147 @@
+import functools
+import os
+import sqlite3
 from datetime import datetime
 import traceback
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QListWidget, QDialog,
+    QPushButton, QLabel, QListWidget, QListWidgetItem, QListView, QDialog,
     QMessageBox, QFrame,
-    QScrollArea, QSplitter, QGroupBox, QComboBox
+    QScrollArea, QSplitter, QGroupBox, QComboBox, QGridLayout, QStackedWidget, QSlider,
+    QFileDialog, QProgressDialog, QInputDialog, QLineEdit, QDockWidget
 )
-from PySide6.QtCore import Qt
-
+from PySide6.QtCore import Qt, QTimer, QThread, Signal
+
+from app.refresh_scheduler import RefreshScheduler
+from app.guest_import_worker import GuestImportWorker
+from app.analytics_worker import AnalyticsWorker
+from app.search_index_worker import SearchIndexWorker
+from backend.storage import EventStorage, EventHeader
+from backend.auto_seating import auto_assign, FRONT_TO_BACK, CENTER_OUT
+from backend.seating_transaction import SeatingConflict
+from backend.tracing import traced
 from ui.seat_widget import SeatWidget
-from ui.event_dialog import EventDialog
-from ui.guest_dialog import GuestDialog
+from ui.seat_canvas import SeatCanvas, MIN_ZOOM, MAX_ZOOM
+from ui.guest_list_model import GuestListModel
+
+STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ui", "resources.qss")
+
+
+@functools.lru_cache(maxsize=None)
+def load_stylesheet(path=STYLESHEET_PATH):
+    """Read a stylesheet once per process; returns an empty string if it is missing"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        print("resources.qss not found, default style will be used")
+        return ""
 
 
 class MainWindow(QMainWindow):
 
-    def __init__(self):
+    AUTOSAVE_INTERVAL_MS = 5000
+
+    first_frame_painted = Signal()
+    workspace_loaded = Signal()
+
+    def __init__(self, storage=None):
         super().__init__()
+        # Stored events are listed from their headers, read after the first frame
+        # is painted (load_workspace), and fully loaded when selected
+        self.storage = storage or EventStorage(EventStorage.default_directory(),
+                                               snapshots=EventStorage.default_snapshots(),
+                                               sqlite=EventStorage.default_sqlite())
         self.events = []
         self.current_event = None
-        self.guest_map = {} 
+        self._first_frame_painted = False
+        self._workspace_loaded = False
+
+        # Seating map state: widgets are kept between refreshes and pooled between events
+        self.seat_widgets = {}
+        self._seat_widget_pool = []
+        self._row_labels = []
+        self._row_label_pool = []
+        self._map_event = None
+        self._map_dims = None
+        self._highlighted_seat = None
+
+        # Created on first use, NumPy is only imported then
+        self.analytics_dock = None
+        self.analytics_panel = None
 
         self.setWindowTitle("Event Planner")
         self.setGeometry(100, 100, 1400, 800)
 
-        self.init_ui()
+        # Panels are refreshed at most once per event-loop iteration
+        self.refresh_scheduler = RefreshScheduler(self)
+        self.refresh_scheduler.register("events", self.update_events_list)
+        self.refresh_scheduler.register("info", self.update_event_info)
+        self.refresh_scheduler.register("seating", self.update_seating_map, self.refresh_seats)
+        self.refresh_scheduler.register("guests", self.update_unassigned_guests_list)
 
-        try:
-            with open("ui/resources.qss", "r") as f:
-                self.setStyleSheet(f.read())
-        except FileNotFoundError:
-            print("resources.qss not found, default style will be used")
+        self.init_ui()
+        self.setStyleSheet(load_stylesheet())
+
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setInterval(self.AUTOSAVE_INTERVAL_MS)
+        self.autosave_timer.timeout.connect(self.autosave)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._first_frame_painted:
+            self._first_frame_painted = True
+            self.first_frame_painted.emit()
+            # Runs once the first frame has been flushed to the screen
+            QTimer.singleShot(0, self.load_workspace)
+
+    @traced(category="startup")
+    def load_workspace(self):
+        """List the stored events and start autosaving (once)"""
+        if self._workspace_loaded:
+            return
+        self._workspace_loaded = True
+        self.events = self.storage.load_headers()
+        self.refresh_scheduler.mark_dirty("events")
+        self.autosave_timer.start()
+        self.workspace_loaded.emit()
+
+    @traced(category="ui")
+    def autosave(self):
+        """Write modified events in the background"""
+        for future in self.storage.save(self.events, wait=False):
+            future.add_done_callback(self._report_save_error)
+
+    @staticmethod
+    def _report_save_error(future):
+        # Runs on the storage thread; the failed event stays dirty and is retried
+        error = future.exception()
+        if error is not None:
+            print(f"ERROR saving events: {error}")
+
+    def closeEvent(self, event):
+        if getattr(self, "_analytics_thread", None):
+            self._analytics_thread.quit()
+            self._analytics_thread.wait()
+        if getattr(self, "_search_index_thread", None):
+            self._search_index_thread.quit()
+            self._search_index_thread.wait()
+        if getattr(self, "_import_thread", None):
+            # Closing cancels the import; chunks not yet added are dropped
+            self._import_worker.chunk_ready.disconnect(self._import_chunk)
+            self._import_worker.finished.disconnect(self._import_finished)
+            self._import_worker.failed.disconnect(self._import_failed)
+            self._import_worker.cancel()
+            self._import_thread.quit()
+            self._import_thread.wait()
+        # Nothing can have changed before the workspace was loaded
+        if self._workspace_loaded:
+            try:
+                self.storage.save(self.events)
+            except (OSError, sqlite3.Error) as e:
+                print(f"ERROR saving events: {e}")
+        self.storage.close()
+        super().closeEvent(event)
 
     def init_ui(self):
         central_widget = QWidget()
@@ -74,11 +185,19 @@ class MainWindow(QMainWindow):
         btn_new_event.clicked.connect(self.add_event)
         layout.addWidget(btn_new_event)
 
+        btn_edit_event = QPushButton("Edit Event")
+        btn_edit_event.clicked.connect(self.edit_event)
+        layout.addWidget(btn_edit_event)
+
         btn_delete_event = QPushButton("Delete Event")
         btn_delete_event.setStyleSheet("background-color: #F44336;")
         btn_delete_event.clicked.connect(self.delete_event)
         layout.addWidget(btn_delete_event)
 
+        btn_analytics = QPushButton("Analytics")
+        btn_analytics.clicked.connect(self.show_analytics)
+        layout.addWidget(btn_analytics)
+
         # Separator
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
@@ -89,7 +208,11 @@ class MainWindow(QMainWindow):
         guest_group = QGroupBox("Unassigned Guests")
         guest_layout = QVBoxLayout()
 
-        self.guests_list = QListWidget()
+        self.guest_model = GuestListModel(self)
+        self.guests_list = QListView()
+        self.guests_list.setModel(self.guest_model)
+        self.guests_list.setUniformItemSizes(True)
+        self.guests_list.setSelectionMode(QListView.ExtendedSelection)
         self.guests_list.setDragEnabled(True)
         self.guests_list.setDefaultDropAction(Qt.MoveAction)
         guest_layout.addWidget(self.guests_list)
@@ -98,6 +221,14 @@ class MainWindow(QMainWindow):
         btn_add_guest.clicked.connect(self.add_guest)
         guest_layout.addWidget(btn_add_guest)
 
+        btn_import_guests = QPushButton("Import Guests...")
+        btn_import_guests.clicked.connect(self.import_guests)
+        guest_layout.addWidget(btn_import_guests)
+
+        btn_auto_assign = QPushButton("Auto-assign Seats")
+        btn_auto_assign.clicked.connect(self.auto_assign_seats)
+        guest_layout.addWidget(btn_auto_assign)
+
         btn_remove_guest = QPushButton("Remove Guest")
         btn_remove_guest.setStyleSheet("background-color: #FF9800;")
         btn_remove_guest.clicked.connect(self.remove_guest)
@@ -126,14 +257,93 @@ class MainWindow(QMainWindow):
         self.event_info_label.setWordWrap(True)
         layout.addWidget(self.event_info_label)
 
+        # Guest search
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search guests by name, email or phone...")
+        self.search_input.setClearButtonEnabled(True)
+        layout.addWidget(self.search_input)
+
+        self.search_results = QListWidget()
+        self.search_results.setMaximumHeight(120)
+        self.search_results.setUniformItemSizes(True)
+        self.search_results.hide()
+        self.search_results.itemClicked.connect(self.show_search_result)
+        layout.addWidget(self.search_results)
+
+        # Typing only restarts the timer; the search runs once typing pauses
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(200)
+        self.search_timer.timeout.connect(self.run_search)
+        self.search_input.textChanged.connect(self.search_timer.start)
+
+        # Seating view mode
+        view_layout = QHBoxLayout()
+        view_layout.addWidget(QLabel("Seating view:"))
+        self.seat_view_combo = QComboBox()
+        self.seat_view_combo.addItems(["Seat widgets", "Canvas (large venues)"])
+        self.seat_view_combo.currentIndexChanged.connect(self.set_seat_view_mode)
+        view_layout.addWidget(self.seat_view_combo)
+        view_layout.addWidget(QLabel("Zoom:"))
+        self.zoom_slider = QSlider(Qt.Horizontal)
+        self.zoom_slider.setRange(round(MIN_ZOOM * 100), round(MAX_ZOOM * 100))
+        self.zoom_slider.setValue(100)
+        self.zoom_slider.setFixedWidth(150)
+        self.zoom_slider.setEnabled(False)
+        self.zoom_slider.valueChanged.connect(lambda value: self.set_canvas_zoom(value / 100))
+        view_layout.addWidget(self.zoom_slider)
+        self.zoom_label = QLabel("100%")
+        view_layout.addWidget(self.zoom_label)
+        view_layout.addStretch()
+        layout.addLayout(view_layout)
+
         # Seating map container
         self.seats_scroll = QScrollArea()
         self.seats_scroll.setWidgetResizable(True)
         self.seats_widget = QWidget()
         self.seats_layout = QVBoxLayout()
         self.seats_widget.setLayout(self.seats_layout)
+
+        self.no_event_label = QLabel("No event selected")
+        self.no_event_label.setAlignment(Qt.AlignCenter)
+        self.no_event_label.setStyleSheet("font-size: 14px; color: #757575; padding: 50px;")
+        self.no_event_label.hide()
+        self.seats_layout.addWidget(self.no_event_label)
+
+        self.stage_label = QLabel("Stage / Podium")
+        self.stage_label.setAlignment(Qt.AlignCenter)
+        self.stage_label.setStyleSheet("""
+            background-color: #212121;
+            color: white;
+            font-size: 14px;
+            font-weight: bold;
+            padding: 15px;
+            border-radius: 5px;
+            margin-bottom: 20px;
+        """)
+        self.stage_label.hide()
+        self.seats_layout.addWidget(self.stage_label)
+
+        self.seats_grid_widget = QWidget()
+        self.seats_grid = QGridLayout()
+        self.seats_grid.setHorizontalSpacing(5)
+        self.seats_grid.setVerticalSpacing(10)
+        self.seats_grid_widget.setLayout(self.seats_grid)
+        self.seats_layout.addWidget(self.seats_grid_widget, 0, Qt.AlignLeft)
+        self.seats_layout.addStretch()
         self.seats_scroll.setWidget(self.seats_widget)
-        layout.addWidget(self.seats_scroll)
+
+        # Painted alternative to the seat widgets
+        self.canvas_scroll = QScrollArea()
+        self.seat_canvas = SeatCanvas(controller=self)
+        self.seat_canvas.seat_clicked.connect(self.seat_clicked)
+        self.seat_canvas.zoom_requested.connect(self.set_canvas_zoom)
+        self.canvas_scroll.setWidget(self.seat_canvas)
+
+        self.seat_view_stack = QStackedWidget()
+        self.seat_view_stack.addWidget(self.seats_scroll)
+        self.seat_view_stack.addWidget(self.canvas_scroll)
+        layout.addWidget(self.seat_view_stack)
 
         # Legend
         legend = self.create_legend()
@@ -163,81 +373,180 @@ class MainWindow(QMainWindow):
         legend_group.setLayout(layout)
         return legend_group
 
+    @traced(category="ui")
     def update_events_list(self):
         self.events_list.clear()
         for event in self.events:
             date_str = event.date_time.strftime("%d.%m.%Y %H:%M") if isinstance(event.date_time, datetime) else str(event.date_time)
             self.events_list.addItem(f"{event.name} - {date_str}")
 
+    @traced(category="ui")
     def update_unassigned_guests_list(self):
-        self.guests_list.clear()
-        if self.current_event:
-            for guest in self.current_event.unassigned_guests:
-                self.guests_list.addItem(guest.get_full_name())
-
+        self.guest_model.set_event(self.current_event)
+
+    def set_seat_view_mode(self, index):
+        """Switch between the seat widget grid (0) and the painted canvas (1)"""
+        self.seat_view_stack.setCurrentIndex(index)
+        self.zoom_slider.setEnabled(self.is_canvas_mode())
+        if self.is_canvas_mode():
+            self._clear_seat_grid()
+        else:
+            self.seat_canvas.set_event(None)
+        self.refresh_scheduler.mark_dirty("seating")
+
+    def set_canvas_zoom(self, zoom, anchor=None):
+        """Zoom the canvas, keeping the canvas point `anchor` (default: the viewport center) in place"""
+        canvas = self.seat_canvas
+        viewport = self.canvas_scroll.viewport()
+        if anchor is None:
+            anchor = canvas.mapFrom(viewport, viewport.rect().center())
+        anchor_in_viewport = canvas.mapTo(viewport, anchor)
+        old_zoom = canvas.zoom
+        zoom = canvas.set_zoom(zoom)
+        if zoom != old_zoom:
+            target = anchor * (zoom / old_zoom)
+            self.canvas_scroll.horizontalScrollBar().setValue(target.x() - anchor_in_viewport.x())
+            self.canvas_scroll.verticalScrollBar().setValue(target.y() - anchor_in_viewport.y())
+        self.zoom_slider.blockSignals(True)
+        self.zoom_slider.setValue(round(zoom * 100))
+        self.zoom_slider.blockSignals(False)
+        self.zoom_label.setText(f"{zoom:.0%}")
+
+    def is_canvas_mode(self):
+        return self.seat_view_stack.currentWidget() is self.canvas_scroll
+
+    @traced(category="ui")
     def update_seating_map(self):
-        while self.seats_layout.count():
-            item = self.seats_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        """Refresh the seating map, rebuilding the grid only when the event or its size changed"""
+        if self.is_canvas_mode():
+            self.seat_canvas.set_event(self.current_event)
+            return
 
         if not self.current_event:
-            label = QLabel("No event selected")
-            label.setAlignment(Qt.AlignCenter)
-            label.setStyleSheet("font-size: 14px; color: #757575; padding: 50px;")
-            self.seats_layout.addWidget(label)
+            self._clear_seat_grid()
+            self.stage_label.hide()
+            self.no_event_label.show()
             return
 
-        self.guest_map.clear()
-        for seat in self.current_event.seats:
-            if seat.guest:
-                self.guest_map[str(id(seat.guest))] = seat.guest
+        self.no_event_label.hide()
+        self.stage_label.show()
 
-        stage_label = QLabel("Stage / Podium")
-        stage_label.setAlignment(Qt.AlignCenter)
-        stage_label.setStyleSheet("""
-            background-color: #212121;
-            color: white;
-            font-size: 14px;
-            font-weight: bold;
-            padding: 15px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-        """)
-        self.seats_layout.addWidget(stage_label)
-
-        # Organize seats by row
-        rows_dict = {}
-        for seat in self.current_event.seats:
-            if seat.row not in rows_dict:
-                rows_dict[seat.row] = []
-            rows_dict[seat.row].append(seat)
-
-        for row in sorted(rows_dict.keys()):
-            row_container = QWidget()
-            row_layout = QHBoxLayout()
-            row_layout.setSpacing(5)
-
-            # Row label
-            row_label = QLabel(f"R{row}")
+        dims = (self.current_event.num_rows, self.current_event.num_seats_per_row)
+        if self.current_event is not self._map_event or dims != self._map_dims:
+            self._rebuild_seat_grid()
+        else:
+            for seat_widget in self.seat_widgets.values():
+                seat_widget.refresh()
+
+    @traced(category="ui")
+    def refresh_seats(self, seats):
+        """Update only the widgets of the given seats"""
+        if self.is_canvas_mode():
+            self.seat_canvas.refresh_seats(seats)
+            return
+        for seat in seats:
+            seat_widget = self.seat_widgets.get((seat.row, seat.number))
+            if seat_widget:
+                seat_widget.refresh()
+
+    @traced(category="ui")
+    def _rebuild_seat_grid(self):
+        event = self.current_event
+        self.seats_grid_widget.setUpdatesEnabled(False)
+        self._clear_seat_grid()
+
+        for row in range(1, event.num_rows + 1):
+            row_label = self._take_row_label(row)
+            self.seats_grid.addWidget(row_label, row - 1, 0)
+            row_label.show()
+
+            for seat in event.get_row_seats(row):
+                if seat is None:
+                    continue
+                seat_widget = self._take_seat_widget(seat)
+                self.seats_grid.addWidget(seat_widget, row - 1, seat.number)
+                seat_widget.show()
+                self.seat_widgets[(seat.row, seat.number)] = seat_widget
+
+        self._map_event = event
+        self._map_dims = (event.num_rows, event.num_seats_per_row)
+        self.seats_grid_widget.setUpdatesEnabled(True)
+
+    def _resize_seat_grid(self, added, removed):
+        """Update the grid after the current event was resized, touching only the changed seats"""
+        event = self.current_event
+        if self.is_canvas_mode() or self._map_event is not event:
+            self.refresh_scheduler.mark_dirty("seating")
+            return
+
+        self.seats_grid_widget.setUpdatesEnabled(False)
+        for seat in removed:
+            if seat is self._highlighted_seat:
+                self._highlighted_seat = None
+            seat_widget = self.seat_widgets.pop((seat.row, seat.number), None)
+            if seat_widget:
+                self.seats_grid.removeWidget(seat_widget)
+                seat_widget.hide()
+                self._seat_widget_pool.append(seat_widget)
+
+        while len(self._row_labels) > event.num_rows:
+            row_label = self._row_labels.pop()
+            self.seats_grid.removeWidget(row_label)
+            row_label.hide()
+            self._row_label_pool.append(row_label)
+        for row in range(len(self._row_labels) + 1, event.num_rows + 1):
+            row_label = self._take_row_label(row)
+            self.seats_grid.addWidget(row_label, row - 1, 0)
+            row_label.show()
+
+        for seat in added:
+            seat_widget = self._take_seat_widget(seat)
+            self.seats_grid.addWidget(seat_widget, seat.row - 1, seat.number)
+            seat_widget.show()
+            self.seat_widgets[(seat.row, seat.number)] = seat_widget
+
+        self._map_dims = (event.num_rows, event.num_seats_per_row)
+        self.seats_grid_widget.setUpdatesEnabled(True)
+
+    def _clear_seat_grid(self):
+        """Move all grid widgets back to their pools"""
+        for seat_widget in self.seat_widgets.values():
+            self.seats_grid.removeWidget(seat_widget)
+            seat_widget.hide()
+            self._seat_widget_pool.append(seat_widget)
+        self.seat_widgets.clear()
+
+        for row_label in self._row_labels:
+            self.seats_grid.removeWidget(row_label)
+            row_label.hide()
+            self._row_label_pool.append(row_label)
+        self._row_labels.clear()
+
+        self._map_event = None
+        self._map_dims = None
+
+    def _take_seat_widget(self, seat):
+        if self._seat_widget_pool:
+            seat_widget = self._seat_widget_pool.pop()
+            seat_widget.set_seat(seat)
+        else:
+            seat_widget = SeatWidget(seat, controller=self)
+            seat_widget.seat_clicked.connect(self.seat_clicked)
+        return seat_widget
+
+    def _take_row_label(self, row):
+        if self._row_label_pool:
+            row_label = self._row_label_pool.pop()
+        else:
+            row_label = QLabel()
             row_label.setFixedWidth(40)
             row_label.setAlignment(Qt.AlignCenter)
             row_label.setStyleSheet("font-weight: bold; color: #424242;")
-            row_layout.addWidget(row_label)
-
-            # Seats in the row - PASS CONTROLLER (self) HERE
-            for seat in sorted(rows_dict[row], key=lambda s: s.number):
-                seat_widget = SeatWidget(seat, controller=self)  # <-- FIX: Added controller=self
-                seat_widget.seat_clicked.connect(self.seat_clicked)
-                row_layout.addWidget(seat_widget)
-
-            row_layout.addStretch()
-            row_container.setLayout(row_layout)
-            self.seats_layout.addWidget(row_container)
-
-        self.seats_layout.addStretch()
-
+        row_label.setText(f"R{row}")
+        self._row_labels.append(row_label)
+        return row_label
 
+    @traced(category="ui")
     def update_event_info(self):
         if not self.current_event:
             self.event_info_label.setText("Select an event to view details")
@@ -256,22 +565,77 @@ class MainWindow(QMainWindow):
         """
         self.event_info_label.setText(info_text)
 
+    @traced(category="ui")
+    def run_search(self):
+        self.search_results.clear()
+        query = self.search_input.text().strip()
+        if not self.current_event or not query:
+            self.search_results.hide()
+            self.highlight_seat(None)
+            return
+
+        if self._search_index_building(self.current_event):
+            # run_search is called again once the index is ready
+            self.search_results.addItem("Indexing guests...")
+            self.search_results.show()
+            return
+
+        for guest in self.current_event.search_guests(query):
+            seat = guest.assigned_seat
+            where = seat.get_identifier() if seat else "unassigned"
+            item = QListWidgetItem(f"{guest.get_full_name()} ({where})")
+            item.setData(Qt.UserRole, guest.guest_id)
+            self.search_results.addItem(item)
+        if not self.search_results.count():
+            self.search_results.addItem("No guests found")
+        self.search_results.show()
+
+    def show_search_result(self, item):
+        """Highlight the seat of the chosen guest, or select it in the unassigned list"""
+        guest = self.current_event.get_guest(item.data(Qt.UserRole)) if self.current_event else None
+        if not guest:
+            return
+        if guest.assigned_seat:
+            self.highlight_seat(guest.assigned_seat)
+        else:
+            self.highlight_seat(None)
+            row = self.current_event.unassigned_guests.index(guest)
+            while self.guest_model.rowCount() <= row and self.guest_model.canFetchMore():
+                self.guest_model.fetchMore()
+            index = self.guest_model.index(row)
+            self.guests_list.setCurrentIndex(index)
+            self.guests_list.scrollTo(index)
+
+    def highlight_seat(self, seat):
+        """Highlight one seat in the seating map and scroll to it (None clears it)"""
+        previous = self._highlighted_seat
+        self._highlighted_seat = seat
+        if self.is_canvas_mode():
+            self.seat_canvas.highlight_seat(seat)
+            if seat:
+                rect = self.seat_canvas.seat_rect(seat.row, seat.number)
+                self.canvas_scroll.ensureVisible(rect.center().x(), rect.center().y(), rect.width(), rect.height())
+            return
+        if previous:
+            previous_widget = self.seat_widgets.get((previous.row, previous.number))
+            if previous_widget and previous_widget.seat is previous:
+                previous_widget.set_highlighted(False)
+        if seat:
+            seat_widget = self.seat_widgets.get((seat.row, seat.number))
+            if seat_widget:
+                seat_widget.set_highlighted(True)
+                self.seats_scroll.ensureWidgetVisible(seat_widget)
+
+    @traced(category="ui")
     def add_event(self):
         try:
-            print("Opening EventDialog...")  # Debug
+            from ui.event_dialog import EventDialog
             dialog = EventDialog(self)
-            print("EventDialog created successfully")  # Debug
-            
-            result = dialog.exec()
-            print(f"Dialog result: {result}")  # Debug
-            
-            if result == QDialog.Accepted:
+            if dialog.exec() == QDialog.Accepted:
                 event = dialog.get_event()
-                print(f"Event received: {event}")  # Debug
-                
                 if event:
                     self.events.append(event)
-                    self.update_events_list()
+                    self.refresh_scheduler.mark_dirty("events")
                     QMessageBox.information(self, "Success", f"Event '{event.name}' was created successfully!")
                 else:
                     QMessageBox.warning(self, "Error", "All required fields must be filled!")
@@ -280,6 +644,7 @@ class MainWindow(QMainWindow):
             traceback.print_exc()
             QMessageBox.critical(self, "Error", f"Failed to create event: {str(e)}")
         
+    @traced(category="ui")
     def delete_event(self):
         index = self.events_list.currentRow()
         if index >= 0:
@@ -292,44 +657,284 @@ class MainWindow(QMainWindow):
             )
             if reply == QMessageBox.Yes:
                 self.events.pop(index)
+                self.storage.delete_event(event.event_id)
                 if self.current_event == event:
                     self.current_event = None
-                self.update_events_list()
-                self.update_event_info()
-                self.update_seating_map()
-                self.update_unassigned_guests_list()
+                self.refresh_scheduler.mark_dirty("events", "info", "seating", "guests")
         else:
             QMessageBox.warning(self, "Warning", "Please select an event to delete!")
 
+    @traced(category="ui")
+    def edit_event(self):
+        index = self.events_list.currentRow()
+        if index < 0:
+            QMessageBox.warning(self, "Warning", "Please select an event to edit!")
+            return
+        event = self._load_event_at(index)
+        if not event:
+            return
+
+        from ui.event_dialog import EventDialog
+        dialog = EventDialog(self, event)
+        if dialog.exec() != QDialog.Accepted:
+            return
+        values = dialog.get_values()
+        if not values:
+            QMessageBox.warning(self, "Error", "All required fields must be filled!")
+            return
+
+        num_rows, num_seats_per_row = values['num_rows'], values['num_seats_per_row']
+        seated = sum(1 for seat in event.get_seats_outside(num_rows, num_seats_per_row) if seat.guest)
+        if seated:
+            reply = QMessageBox.question(
+                self,
+                "Confirmation",
+                f"{seated} seated guests are outside the new layout and will become unassigned. Continue?",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                return
+
+        event.name = values['name']
+        event.date_time = values['date_time']
+        event.location = values['location']
+        event.mark_modified()
+        added, removed, displaced = event.resize(num_rows, num_seats_per_row)
+
+        if event is self.current_event:
+            self.guest_model.guests_appended(len(displaced))
+            self._resize_seat_grid(added, removed)
+            self.refresh_scheduler.mark_dirty("info")
+        self.refresh_scheduler.mark_dirty("events")
+
+    def _load_event_at(self, index):
+        """Return the event at a list index, reading it from storage if only its header is loaded"""
+        event = self.events[index]
+        if isinstance(event, EventHeader):
+            try:
+                event = self.storage.load_event(event.event_id)
+            except (OSError, ValueError, KeyError, sqlite3.Error) as e:
+                QMessageBox.critical(self, "Error", f"Failed to load event '{event.name}': {str(e)}")
+                return None
+            self.events[index] = event
+        return event
+
+    @traced(category="ui")
     def select_event(self, item):
-        index = self.events_list.row(item)
-        self.current_event = self.events[index]
-        self.update_event_info()
-        self.update_seating_map()
-        self.update_unassigned_guests_list()
+        event = self._load_event_at(self.events_list.row(item))
+        if not event:
+            return
+        self.current_event = event
+        self._highlighted_seat = None
+        self.search_input.clear()
+        self.refresh_scheduler.mark_dirty("info", "seating", "guests")
+        self._build_search_index()
+
+    def _search_index_building(self, event):
+        return getattr(self, "_search_index_thread", None) is not None and self._search_index_worker.indexed_event is event
+
+    def _build_search_index(self):
+        """Index the current event's guests in a worker thread, so the first search does not block"""
+        event = self.current_event
+        if event is None or event.has_search_index() or getattr(self, "_search_index_thread", None):
+            return
+        self._search_index_thread = QThread(self)
+        self._search_index_worker = SearchIndexWorker(event)
+        self._search_index_worker.moveToThread(self._search_index_thread)
+        self._search_index_thread.started.connect(self._search_index_worker.run)
+        self._search_index_worker.finished.connect(self._search_index_ready)
+        self._search_index_thread.start()
+
+    def _search_index_ready(self, event, index):
+        self._search_index_thread.quit()
+        self._search_index_thread.wait()
+        self._search_index_worker.deleteLater()
+        self._search_index_thread.deleteLater()
+        self._search_index_thread = None
+        event.install_search_index(index)
+        if event is self.current_event:
+            if self.search_input.text().strip():
+                self.run_search()
+        else:
+            # The selection changed while indexing
+            self._build_search_index()
 
+    @traced(category="ui")
     def add_guest(self):
         if not self.current_event:
             QMessageBox.warning(self, "Warning", "Please select an event first!")
             return
 
+        from ui.guest_dialog import GuestDialog
         dialog = GuestDialog(self)
         if dialog.exec() == QDialog.Accepted:
             guest = dialog.get_guest()
             if guest:
-                self.current_event.add_guest(guest)
-                self.update_unassigned_guests_list()
-                self.update_event_info()
+                self.guest_model.append_guest(guest)
+                self.refresh_scheduler.mark_dirty("info")
                 QMessageBox.information(self, "Success", f"Guest '{guest.get_full_name()}' was added!")
             else:
                 QMessageBox.warning(self, "Error", "First name and last name are required!")
 
+    @traced(category="ui")
+    def import_guests(self):
+        """Import guests from a CSV/JSONL file in a worker thread"""
+        if not self.current_event:
+            QMessageBox.warning(self, "Warning", "Please select an event first!")
+            return
+        if getattr(self, "_import_thread", None):
+            QMessageBox.information(self, "Info", "An import is already running!")
+            return
+
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Import Guests", "", "Guest lists (*.csv *.jsonl *.json);;All files (*)")
+        if not path:
+            return
+
+        self._import_event = self.current_event
+        self._import_added = 0
+        self._import_thread = QThread(self)
+        self._import_worker = GuestImportWorker(path)
+        self._import_worker.moveToThread(self._import_thread)
+
+        self._import_progress = QProgressDialog("Importing guests...", "Cancel", 0, 100, self)
+        self._import_progress.setWindowModality(Qt.WindowModal)
+        self._import_progress.setMinimumDuration(300)
+        # The worker thread is busy in run(), so a queued cancel would only arrive at the end
+        self._import_progress.canceled.connect(self._import_worker.cancel, Qt.DirectConnection)
+
+        self._import_thread.started.connect(self._import_worker.run)
+        self._import_worker.chunk_ready.connect(self._import_chunk)
+        self._import_worker.progress.connect(self._import_progress.setValue)
+        self._import_worker.finished.connect(self._import_finished)
+        self._import_worker.failed.connect(self._import_failed)
+        self._import_thread.start()
+
+    @traced(category="ui")
+    def _import_chunk(self, guests):
+        if not self._import_worker.is_cancelled():
+            self._import_added += self._import_event.add_guests(guests)
+        self._import_worker.chunk_taken()
+
+    def _end_import(self):
+        self._import_thread.quit()
+        self._import_thread.wait()
+        self._import_progress.close()
+        self._import_worker.deleteLater()
+        self._import_thread.deleteLater()
+        self._import_thread = None
+        if self._import_event is self.current_event:
+            self.refresh_scheduler.mark_dirty("guests", "info")
+
+    def _import_finished(self, imported, errors):
+        cancelled = self._import_worker.is_cancelled()  # closing the progress dialog cancels too
+        self._end_import()
+        message = f"{self._import_added} guests were imported."
+        if cancelled:
+            message = "The import was cancelled. " + message
+        if errors:
+            details = "\n".join(f"Line {line}: {error}" for line, error in errors[:10])
+            message += f"\n\n{len(errors)} rows were skipped:\n{details}"
+        QMessageBox.information(self, "Import", message)
+
+    def _import_failed(self, error):
+        self._end_import()
+        QMessageBox.critical(self, "Error", f"Failed to import guests: {error}")
+
+    @traced(category="ui")
+    def show_analytics(self):
+        """Open the occupancy dashboard for all events"""
+        if self.analytics_dock is None:
+            try:
+                from ui.analytics_panel import AnalyticsPanel
+            except ImportError:
+                QMessageBox.warning(self, "Warning", "The analytics dashboard needs NumPy (pip install numpy)!")
+                return
+            self.analytics_panel = AnalyticsPanel()
+            self.analytics_panel.refresh_requested.connect(self.refresh_analytics)
+            self.analytics_dock = QDockWidget("Analytics", self)
+            self.analytics_dock.setWidget(self.analytics_panel)
+            self.addDockWidget(Qt.BottomDockWidgetArea, self.analytics_dock)
+        self.analytics_dock.show()
+        self.analytics_dock.raise_()
+        self.refresh_analytics()
+
+    @traced(category="ui")
+    def refresh_analytics(self):
+        """Rebuild the dashboard statistics; stored events are read in a worker thread"""
+        if getattr(self, "_analytics_thread", None):
+            return
+        from backend.analytics import OccupancyPortfolio
+
+        # Loaded events may change on this thread, so they are snapshotted here
+        portfolio = OccupancyPortfolio()
+        stored_ids = []
+        for event in self.events:
+            if isinstance(event, EventHeader):
+                stored_ids.append(event.event_id)
+            else:
+                portfolio.add_event(event)
+
+        self.analytics_panel.set_busy(True)
+        self._analytics_thread = QThread(self)
+        self._analytics_worker = AnalyticsWorker(self.storage, portfolio, stored_ids)
+        self._analytics_worker.moveToThread(self._analytics_thread)
+        self._analytics_thread.started.connect(self._analytics_worker.run)
+        self._analytics_worker.finished.connect(self._analytics_finished)
+        self._analytics_worker.failed.connect(self._analytics_failed)
+        self._analytics_thread.start()
+
+    def _end_analytics(self):
+        self._analytics_thread.quit()
+        self._analytics_thread.wait()
+        self._analytics_worker.deleteLater()
+        self._analytics_thread.deleteLater()
+        self._analytics_thread = None
+
+    def _analytics_finished(self, portfolio):
+        self._end_analytics()
+        self.analytics_panel.set_portfolio(portfolio)
+
+    def _analytics_failed(self, error):
+        self._end_analytics()
+        self.analytics_panel.set_busy(False)
+        QMessageBox.critical(self, "Error", f"Failed to compute the statistics: {error}")
+
+    @traced(category="ui")
+    def auto_assign_seats(self):
+        """Seat all unassigned guests with the chosen strategy"""
+        if not self.current_event:
+            QMessageBox.warning(self, "Warning", "Please select an event first!")
+            return
+        if not self.current_event.unassigned_guests:
+            QMessageBox.information(self, "Info", "There are no unassigned guests!")
+            return
+
+        options = {
+            "Front to back": (FRONT_TO_BACK, None),
+            "Center out": (CENTER_OUT, None),
+            "Front to back, families together": (FRONT_TO_BACK, lambda g: g.last_name),
+            "Center out, families together": (CENTER_OUT, lambda g: g.last_name),
+        }
+        choice, ok = QInputDialog.getItem(self, "Auto-assign", "Seating strategy:", list(options), 0, False)
+        if not ok:
+            return
+
+        strategy, group_key = options[choice]
+        assignments, unplaced = auto_assign(self.current_event, strategy, group_key)
+        self.refresh_scheduler.mark_dirty("seating", "guests", "info")
+        message = f"{len(assignments)} guests were seated."
+        if unplaced:
+            message += f"\n{len(unplaced)} guests could not be seated (not enough available seats)."
+        QMessageBox.information(self, "Auto-assign", message)
+
+    @traced(category="ui")
     def remove_guest(self):
         if not self.current_event:
             QMessageBox.warning(self, "Warning", "Please select an event first!")
             return
 
-        index = self.guests_list.currentRow()
+        index = self.guests_list.currentIndex().row()
         if index >= 0:
             guest = self.current_event.unassigned_guests[index]
             reply = QMessageBox.question(
@@ -339,12 +944,13 @@ class MainWindow(QMainWindow):
                 QMessageBox.Yes | QMessageBox.No
             )
             if reply == QMessageBox.Yes:
-                self.current_event.unassigned_guests.pop(index)
-                self.update_unassigned_guests_list()
-                self.update_event_info()
+                self.guest_model.take_guest(index)
+                self.current_event.remove_guest(guest)
+                self.refresh_scheduler.mark_dirty("info")
         else:
             QMessageBox.warning(self, "Warning", "Please select a guest to remove!")
 
+    @traced(category="ui")
     def seat_clicked(self, seat):
         if not self.current_event:
             return
@@ -360,10 +966,9 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.Yes:
                 guest = seat.guest
                 seat.release()
-                self.current_event.unassigned_guests.append(guest)
-                self.update_seating_map()
-                self.update_unassigned_guests_list()
-                self.update_event_info()
+                self.guest_model.append_guest(guest)
+                self.refresh_scheduler.mark_items_dirty("seating", [seat])
+                self.refresh_scheduler.mark_dirty("info")
         else:
             # Seat is free - manual allocation
             if not self.current_event.unassigned_guests:
@@ -397,31 +1002,47 @@ class MainWindow(QMainWindow):
             if dialog.exec() == QDialog.Accepted:
                 index = combo.currentIndex()
                 if index >= 0:
-                    guest = self.current_event.unassigned_guests.pop(index)
+                    guest = self.guest_model.take_guest(index)
                     seat.assign_guest(guest)
-                    self.update_seating_map()
-                    self.update_unassigned_guests_list()
-                    self.update_event_info()
+                    self.refresh_scheduler.mark_items_dirty("seating", [seat])
+                    self.refresh_scheduler.mark_dirty("info")
 
-    def move_guest_to_seat(self, guest_id, target_seat):
+    @traced(category="ui")
+    def drop_guests(self, guest_ids, seat):
+        """Seat dragged guests along the row of the drop seat, starting at it, in one transaction"""
         if not self.current_event:
             return
+        guests = [g for g in map(self.current_event.get_guest, guest_ids) if g is not None]
+        if not guests:
+            return
 
-        # Find guest
-        guest = self.guest_map.get(guest_id)
-        if not guest:
+        # Seats to the right of the drop seat first, then the nearest ones to its left
+        row_seats = self.current_event.get_row_seats(seat.row)
+        start = seat.number - 1
+        free_seats = [s for s in row_seats[start:] + row_seats[:start][::-1] if s.is_available()]
+        if len(free_seats) < len(guests):
+            QMessageBox.warning(
+                self, "Warning",
+                f"Row {seat.row} has only {len(free_seats)} available seats for {len(guests)} guests!")
+            return
+
+        try:
+            with self.current_event.transaction() as transaction:
+                for guest, target in zip(guests, free_seats):
+                    if guest.assigned_seat:
+                        transaction.move(guest, target)
+                    else:
+                        transaction.assign(guest, target)
+        except SeatingConflict as e:
+            QMessageBox.warning(self, "Warning", f"The guests could not be seated:\n{e}")
             return
+        self.apply_changes(transaction.changes)
 
-        # Find source seat
-        source_seat = None
-        for seat in self.current_event.seats:
-            if seat.guest == guest:
-                source_seat = seat
-                break
-
-        if source_seat and target_seat.is_available():
-            # Move guest
-            source_seat.release()
-            target_seat.assign_guest(guest)
-            self.update_seating_map()
-            self.update_event_info()
+    def apply_changes(self, changes):
+        """Refresh only what a seating transaction changed"""
+        if not changes:
+            return
+        self.refresh_scheduler.mark_items_dirty("seating", changes.seats)
+        if changes.unassigned_changed:
+            self.refresh_scheduler.mark_dirty("guests")
+        self.refresh_scheduler.mark_dirty("info")
@@ -0,0 +1,67 @@
+from collections import Counter
+
+from PySide6.QtCore import QObject, QTimer
+
+from backend.tracing import traced
+
+
+class RefreshScheduler(QObject):
+    """Coalesces refresh requests for the main window panels.
+
+    Handlers only mark panels as stale; the stale panels are refreshed once,
+    in registration order, when control returns to the event loop. The
+    `requested` and `performed` counters (per panel) show how much work the
+    coalescing saved.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._handlers = {}
+        self._item_handlers = {}
+        self._dirty = set()
+        self._dirty_items = {}
+        self.requested = Counter()
+        self.performed = Counter()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+
+    def register(self, panel, handler, item_handler=None):
+        """Register the full refresh of a panel and, optionally, a refresh of some of its items"""
+        self._handlers[panel] = handler
+        if item_handler:
+            self._item_handlers[panel] = item_handler
+
+    def mark_dirty(self, *panels):
+        for panel in panels:
+            self.requested[panel] += 1
+            self._dirty.add(panel)
+        self._timer.start()
+
+    def mark_items_dirty(self, panel, items):
+        """Refresh only the given items of a panel, unless the whole panel is already stale"""
+        self.requested[panel] += 1
+        pending = self._dirty_items.setdefault(panel, {})
+        for item in items:
+            if item is not None:
+                pending[id(item)] = item
+        self._timer.start()
+
+    @traced(category="ui")
+    def flush(self):
+        """Run the pending refreshes now"""
+        self._timer.stop()
+        dirty, self._dirty = self._dirty, set()
+        dirty_items, self._dirty_items = self._dirty_items, {}
+        for panel, handler in self._handlers.items():
+            if panel in dirty:
+                handler()
+                self.performed[panel] += 1
+            elif dirty_items.get(panel) and panel in self._item_handlers:
+                self._item_handlers[panel](list(dirty_items[panel].values()))
+                self.performed[panel] += 1
+
+    def has_pending(self):
+        return bool(self._dirty or self._dirty_items)
@@ -0,0 +1,21 @@
+from PySide6.QtCore import QObject, Signal
+
+from backend.guest_search import GuestSearchIndex
+
+
+class SearchIndexWorker(QObject):
+    """Builds the guest search index of an event in a worker thread.
+
+    The guests are listed on the GUI thread when the worker is created; the
+    GUI thread installs the index with Event.install_search_index.
+    """
+
+    finished = Signal(object, object)
+
+    def __init__(self, event):
+        super().__init__()
+        self.indexed_event = event
+        self.guests = event.prepare_search_index()
+
+    def run(self):
+        self.finished.emit(self.indexed_event, GuestSearchIndex(self.guests))
@@ -0,0 +1,77 @@
+"""Startup timing for `main.py --startup-profile`.
+
+Kept free of Qt and app imports so it can be installed before them.
+"""
+import builtins
+import sys
+import time
+
+
+class ImportProfiler:
+    """Times module imports by wrapping builtins.__import__.
+
+    Each import statement that loads new modules is charged its own time,
+    excluding the imports it triggers in turn.
+    """
+
+    def __init__(self):
+        self.self_times = {}
+        self._children = []
+        self._original_import = None
+
+    def install(self):
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+        return self
+
+    def uninstall(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level == 0 and not fromlist and name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        loaded = len(sys.modules)
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._children.pop()
+            if self._children:
+                self._children[-1] += elapsed
+            if len(sys.modules) != loaded:
+                if level:
+                    name = "." * level + name + f" (in {(globals or {}).get('__package__')})"
+                self.self_times[name] = self.self_times.get(name, 0.0) + elapsed - children
+
+    def total(self):
+        return sum(self.self_times.values())
+
+    def slowest(self, limit=15):
+        return sorted(self.self_times.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+class StartupProfile:
+    """Milestones (seconds since `started`) plus the import costs"""
+
+    def __init__(self, started, import_profiler=None):
+        self.started = started
+        self.import_profiler = import_profiler
+        self.milestones = []
+
+    def mark(self, name):
+        self.milestones.append((name, time.perf_counter() - self.started))
+
+    def report(self, limit=15, file=None):
+        file = file or sys.stderr
+        print("Startup profile (seconds since main.py started):", file=file)
+        for name, elapsed in self.milestones:
+            print(f"  {name:<28} {elapsed * 1000:>9.1f} ms", file=file)
+        if self.import_profiler:
+            print(f"Imports: {self.import_profiler.total() * 1000:.1f} ms in total, slowest:", file=file)
+            for name, elapsed in self.import_profiler.slowest(limit):
+                print(f"  {name:<40} {elapsed * 1000:>9.1f} ms", file=file)
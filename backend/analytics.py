@@ -0,0 +1,159 @@
+"""Occupancy analytics across many events, computed with NumPy.
+
+Every event is reduced to a seat-state matrix (rows x seats per row, one
+byte per seat) and the aggregates are computed from those matrices.
+NumPy is an optional dependency: importing this module raises ImportError
+when it is missing, so the GUI can fall back gracefully.
+"""
+from datetime import datetime
+
+import numpy as np
+
+from .seat import AVAILABLE, OCCUPIED, RESERVED
+from .snapshot import OCCUPIED_FLAG, RESERVED_FLAG
+
+STATE_CODES = {AVAILABLE: 0, OCCUPIED: 1, RESERVED: 2}
+AVAILABLE_CODE, OCCUPIED_CODE, RESERVED_CODE = 0, 1, 2
+
+
+def seat_state_matrix(event):
+    """Seat states of a loaded Event as a uint8 matrix, placed by each seat's row and number"""
+    seats = event.seats
+    count = len(seats)
+    codes = STATE_CODES
+    matrix = np.zeros((event.num_rows, event.num_seats_per_row), dtype=np.uint8)
+    rows = np.fromiter((seat.row for seat in seats), dtype=np.intp, count=count)
+    numbers = np.fromiter((seat.number for seat in seats), dtype=np.intp, count=count)
+    states = np.fromiter((codes[seat.get_state()] for seat in seats), dtype=np.uint8, count=count)
+    matrix[rows - 1, numbers - 1] = states
+    return matrix
+
+
+def seat_state_matrix_from_dict(data):
+    """Seat states of a stored event dict (Event.to_dict format), without creating Seat objects"""
+    seats = data['seats']
+    count = len(seats)
+    matrix = np.zeros((data['num_rows'], data['num_seats_per_row']), dtype=np.uint8)
+    rows = np.fromiter((seat['row'] for seat in seats), dtype=np.intp, count=count)
+    numbers = np.fromiter((seat['number'] for seat in seats), dtype=np.intp, count=count)
+    states = np.fromiter((OCCUPIED_CODE if seat.get('guest') else RESERVED_CODE if seat.get('reserved') else AVAILABLE_CODE
+                          for seat in seats), dtype=np.uint8, count=count)
+    matrix[rows - 1, numbers - 1] = states
+    return matrix
+
+
+def seat_state_matrix_from_snapshot(snapshot):
+    """Seat states of an EventSnapshot, read from its state array without decoding any guest"""
+    flags = np.frombuffer(snapshot.seat_states(), dtype=np.uint8)
+    states = np.where(flags & OCCUPIED_FLAG, OCCUPIED_CODE,
+                      np.where(flags & RESERVED_FLAG, RESERVED_CODE, AVAILABLE_CODE)).astype(np.uint8)
+    return states.reshape(snapshot.num_rows, snapshot.num_seats_per_row)
+
+
+def _as_datetime(value):
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class OccupancyPortfolio:
+    """Seat-state matrices of many events and the aggregates computed from them"""
+
+    def __init__(self):
+        self.names = []
+        self.dates = []
+        self.matrices = []
+
+    def add_event(self, event):
+        self.add_matrix(event.name, event.date_time, seat_state_matrix(event))
+
+    def add_event_data(self, data):
+        self.add_matrix(data['name'], data['date_time'], seat_state_matrix_from_dict(data))
+
+    def add_snapshot(self, snapshot):
+        self.add_matrix(snapshot.name, snapshot.date_time, seat_state_matrix_from_snapshot(snapshot))
+
+    def add_matrix(self, name, date_time, matrix):
+        self.names.append(name)
+        self.dates.append(_as_datetime(date_time))
+        self.matrices.append(matrix)
+
+    def __len__(self):
+        return len(self.matrices)
+
+    def select(self, start=None, end=None):
+        """Return a portfolio with the events dated within [start, end] (either bound may be None)"""
+        selected = OccupancyPortfolio()
+        for name, date_time, matrix in zip(self.names, self.dates, self.matrices):
+            if date_time is None and (start or end):
+                continue
+            if (start and date_time < start) or (end and date_time > end):
+                continue
+            selected.add_matrix(name, date_time, matrix)
+        return selected
+
+    def event_totals(self):
+        """Per-event capacity, occupied and reserved counts and fill rate, as arrays"""
+        capacity = np.array([m.size for m in self.matrices], dtype=np.int64)
+        occupied = np.array([np.count_nonzero(m == OCCUPIED_CODE) for m in self.matrices], dtype=np.int64)
+        reserved = np.array([np.count_nonzero(m == RESERVED_CODE) for m in self.matrices], dtype=np.int64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            fill_rate = np.where(capacity > 0, occupied / capacity, 0.0)
+        return {'capacity': capacity, 'occupied': occupied, 'reserved': reserved, 'fill_rate': fill_rate}
+
+    def _position_counts(self):
+        """Per seat position: how many events have it occupied, reserved, and at all"""
+        rows = max((m.shape[0] for m in self.matrices), default=0)
+        seats = max((m.shape[1] for m in self.matrices), default=0)
+        occupied = np.zeros((rows, seats), dtype=np.int64)
+        reserved = np.zeros((rows, seats), dtype=np.int64)
+        halls = np.zeros((rows, seats), dtype=np.int64)
+        for matrix in self.matrices:
+            r, c = matrix.shape
+            occupied[:r, :c] += matrix == OCCUPIED_CODE
+            reserved[:r, :c] += matrix == RESERVED_CODE
+            halls[:r, :c] += 1
+        return occupied, reserved, halls
+
+    def heatmaps(self):
+        """Occupied and reserved rate of every seat position over the events that have it (NaN where none)"""
+        occupied, reserved, halls = self._position_counts()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return occupied / halls, reserved / halls
+
+    def row_fill_rates(self):
+        """Occupied rate per row number over all events (NaN for rows no hall has)"""
+        occupied, _, halls = self._position_counts()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return occupied.sum(axis=1) / halls.sum(axis=1)
+
+    def fill_rate_by_month(self):
+        """Seat-weighted fill rate per calendar month: (months as 'YYYY-MM', rates, event counts)"""
+        dated = [i for i, date_time in enumerate(self.dates) if date_time is not None]
+        if not dated:
+            return [], np.array([]), np.array([], dtype=np.int64)
+        totals = self.event_totals()
+        months = np.array([self.dates[i] for i in dated], dtype="datetime64[M]")
+        unique_months, inverse = np.unique(months, return_inverse=True)
+        occupied = np.bincount(inverse, weights=totals['occupied'][dated])
+        capacity = np.bincount(inverse, weights=totals['capacity'][dated])
+        counts = np.bincount(inverse)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rates = np.where(capacity > 0, occupied / capacity, 0.0)
+        return [str(month) for month in unique_months], rates, counts
+
+    def summary(self):
+        """Portfolio-wide totals as plain Python numbers"""
+        totals = self.event_totals()
+        capacity = int(totals['capacity'].sum())
+        occupied = int(totals['occupied'].sum())
+        return {
+            'events': len(self),
+            'capacity': capacity,
+            'occupied': occupied,
+            'reserved': int(totals['reserved'].sum()),
+            'fill_rate': occupied / capacity if capacity else 0.0,
+        }
@@ -0,0 +1,152 @@
+"""Automatic placement of unassigned guests on available seats."""
+from .seat import AVAILABLE
+from .tracing import traced
+
+FRONT_TO_BACK = "front_to_back"
+CENTER_OUT = "center_out"
+STRATEGIES = (FRONT_TO_BACK, CENTER_OUT)
+
+
+def _seat_numbers_order(num_seats_per_row, strategy):
+    """Order in which the seats of a row are filled"""
+    numbers = range(1, num_seats_per_row + 1)
+    if strategy == CENTER_OUT:
+        center = (num_seats_per_row + 1) / 2
+        return sorted(numbers, key=lambda n: (abs(n - center), n))
+    return list(numbers)
+
+
+def _available_seats(event, strategy):
+    """All available seats, front row first, each row in strategy order"""
+    order = _seat_numbers_order(event.num_seats_per_row, strategy)
+    seats = []
+    for row in range(1, event.num_rows + 1):
+        row_seats = event.get_row_seats(row)
+        for number in order:
+            seat = row_seats[number - 1]
+            if seat is not None and seat.get_state() == AVAILABLE:
+                seats.append(seat)
+    return seats
+
+
+def _free_segments(event, strategy):
+    """Runs of adjacent available seats as [row, start, end] lists, in fill order"""
+    center = (event.num_seats_per_row + 1) / 2
+    segments = []
+    for row in range(1, event.num_rows + 1):
+        row_segments = []
+        start = None
+        for seat in event.get_row_seats(row) + [None]:
+            if seat is not None and seat.get_state() == AVAILABLE:
+                if start is None:
+                    start = seat.number
+                end = seat.number
+            elif start is not None:
+                row_segments.append([row, start, end])
+                start = None
+        if strategy == CENTER_OUT:
+            row_segments.sort(key=lambda s: max(0, s[1] - center, center - s[2]))
+        segments.extend(row_segments)
+    return segments
+
+
+class _FirstFit:
+    """Max segment tree answering "leftmost segment with at least k free seats" in O(log n)"""
+
+    def __init__(self, capacities):
+        size = 1
+        while size < max(len(capacities), 1):
+            size *= 2
+        self.size = size
+        self.tree = [0] * (2 * size)
+        self.tree[size:size + len(capacities)] = capacities
+        for i in range(size - 1, 0, -1):
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+
+    def find(self, k):
+        tree = self.tree
+        if tree[1] < k:
+            return -1
+        i = 1
+        while i < self.size:
+            i = 2 * i if tree[2 * i] >= k else 2 * i + 1
+        return i - self.size
+
+    def set(self, index, value):
+        tree = self.tree
+        i = index + self.size
+        tree[i] = value
+        i //= 2
+        while i:
+            tree[i] = max(tree[2 * i], tree[2 * i + 1])
+            i //= 2
+
+
+def _group(guests, group_key):
+    groups = {}
+    for guest in guests:
+        groups.setdefault(group_key(guest), []).append(guest)
+    return list(groups.values())
+
+
+@traced(category="backend")
+def plan_seating(event, guests=None, strategy=FRONT_TO_BACK, group_key=None):
+    """Compute seats for guests without changing the event.
+
+    Guests default to event.unassigned_guests. With `group_key`, guests with
+    the same key form a party that is seated on adjacent seats of one row
+    when such a gap exists (largest parties first); parties that fit nowhere
+    and single guests then fill the remaining seats in strategy order.
+    Reserved and occupied seats are never used.
+
+    Returns (assignments, unplaced) where assignments is a list of
+    (guest, seat) pairs.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown seating strategy: {strategy}")
+    guests = list(event.unassigned_guests if guests is None else guests)
+    assignments = []
+    singles = guests
+
+    if group_key is not None:
+        singles = []
+        parties = []
+        for party in _group(guests, group_key):
+            (parties if len(party) > 1 else singles).append(party)
+        singles = [party[0] for party in singles]
+        parties.sort(key=len, reverse=True)
+
+        segments = _free_segments(event, strategy)
+        fit = _FirstFit([end - start + 1 for _, start, end in segments])
+        center = (event.num_seats_per_row + 1) / 2
+        for party in parties:
+            index = fit.find(len(party))
+            if index < 0:
+                singles.extend(party)
+                continue
+            row, start, end = segment = segments[index]
+            if strategy == CENTER_OUT and (start + end) / 2 < center:
+                # Pack against the side of the gap nearest the middle of the row
+                first = end - len(party) + 1
+                segment[2] = first - 1
+            else:
+                first = start
+                segment[1] = start + len(party)
+            for offset, guest in enumerate(party):
+                assignments.append((guest, event.get_seat(row, first + offset)))
+            fit.set(index, segment[2] - segment[1] + 1)
+
+    taken = {id(seat) for _, seat in assignments}
+    free_seats = (seat for seat in _available_seats(event, strategy) if id(seat) not in taken)
+    placed = len(assignments)
+    for guest, seat in zip(singles, free_seats):
+        assignments.append((guest, seat))
+    unplaced = singles[len(assignments) - placed:]
+    return assignments, unplaced
+
+
+def auto_assign(event, strategy=FRONT_TO_BACK, group_key=None):
+    """Seat all unassigned guests of an event; returns (assignments, unplaced)"""
+    assignments, unplaced = plan_seating(event, strategy=strategy, group_key=group_key)
+    event.assign_guests(assignments)
+    return assignments, unplaced
@@ -0,0 +1,239 @@
+"""Command line tools for event files (JSON or .evsnap snapshots), without Qt.
+
+Each file is processed in a worker process and results are printed as soon
+as they are ready (text, or one JSON object per line with --json):
+
+    python -m backend.cli validate exports/
+    python -m backend.cli stats --json ~/.event_planner/events
+    python -m backend.cli auto-seat --strategy center_out --families -o seated/ exports/
+    python -m backend.cli export --indent 2 -o pretty/ exports/*.json
+
+The exit status is 1 if any file failed to load or validate.
+"""
+import argparse
+import json
+import os
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .auto_seating import STRATEGIES, FRONT_TO_BACK, auto_assign
+from .event import Event
+from .seat import AVAILABLE
+from .snapshot import EventSnapshot
+from .storage import EventStorage
+
+COMMANDS = ("validate", "stats", "auto-seat", "export")
+
+
+def find_event_files(paths):
+    """Expand directories to the event files (JSON or .evsnap snapshots) below them.
+
+    Workspace index files are skipped.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                files.extend(os.path.join(root, name) for name in sorted(names)
+                             if name.endswith((".json", EventStorage.SNAPSHOT_EXTENSION)) and name != "index.json")
+        else:
+            files.append(path)
+    return files
+
+
+def validate_event_data(data):
+    """Return the problems found in an event dict (empty if it is consistent)"""
+    errors = []
+    for key in ('name', 'date_time', 'location', 'num_rows', 'num_seats_per_row', 'seats', 'unassigned_guests'):
+        if key not in data:
+            errors.append(f"missing field '{key}'")
+    if errors:
+        return errors
+
+    rows, seats_per_row = data['num_rows'], data['num_seats_per_row']
+    if not isinstance(rows, int) or not isinstance(seats_per_row, int) or rows < 1 or seats_per_row < 1:
+        return [f"invalid hall size {rows!r} x {seats_per_row!r}"]
+    if not isinstance(data['seats'], list) or not isinstance(data['unassigned_guests'], list):
+        return ["'seats' and 'unassigned_guests' must be lists"]
+    if len(data['seats']) != rows * seats_per_row:
+        errors.append(f"{len(data['seats'])} seats listed for a {rows}x{seats_per_row} hall")
+
+    positions = set()
+    guest_ids = set()
+
+    def check_guest(guest, where):
+        if not isinstance(guest, dict):
+            errors.append(f"{where}: guest is not an object")
+            return
+        if not guest.get('last_name') or not guest.get('first_name'):
+            errors.append(f"{where}: guest without a full name")
+        guest_id = guest.get('id')
+        if guest_id and not isinstance(guest_id, str):
+            errors.append(f"{where}: invalid guest id {guest_id!r}")
+        elif guest_id:
+            if guest_id in guest_ids:
+                errors.append(f"{where}: guest id {guest_id} appears more than once")
+            guest_ids.add(guest_id)
+
+    for index, seat in enumerate(data['seats']):
+        if not isinstance(seat, dict):
+            errors.append(f"seat #{index + 1}: not an object")
+            continue
+        position = (seat.get('row'), seat.get('number'))
+        where = f"R{position[0]}-S{position[1]}"
+        if not (isinstance(position[0], int) and isinstance(position[1], int)
+                and 1 <= position[0] <= rows and 1 <= position[1] <= seats_per_row):
+            errors.append(f"{where}: seat outside the hall")
+        elif position in positions:
+            errors.append(f"{where}: seat listed more than once")
+        else:
+            positions.add(position)
+        if seat.get('guest'):
+            check_guest(seat['guest'], where)
+    for guest in data['unassigned_guests']:
+        check_guest(guest, "unassigned guests")
+    return errors
+
+
+def event_stats(event):
+    seats = len(event.seats)
+    reserved = event.get_reserved_seats_count()
+    occupied = event.get_occupied_seats_count() - reserved
+    row_counts = [event.get_row_counts(row) for row in range(1, event.num_rows + 1)]
+    return {
+        'capacity': seats,
+        'occupied': occupied,
+        'reserved': reserved,
+        'available': event.get_available_seats_count(),
+        'unassigned_guests': len(event.unassigned_guests),
+        'occupancy': round(occupied / seats, 4) if seats else 0.0,
+        'full_rows': sum(1 for counts in row_counts if counts[AVAILABLE] == 0),
+    }
+
+
+def read_event_data(path):
+    """Read the event dict from a JSON file or a binary snapshot"""
+    if path.endswith(EventStorage.SNAPSHOT_EXTENSION):
+        with EventSnapshot(path) as snapshot:
+            return snapshot.to_dict()
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_event(event, output_dir, path, indent=None):
+    """Write the event as JSON, named after its source file (snapshots become .json)"""
+    name = os.path.splitext(os.path.basename(path))[0] + ".json"
+    out_path = os.path.join(output_dir, name)
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(event.to_dict(), f, ensure_ascii=False, indent=indent)
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+def process_file(command, path, options):
+    """Run one command on one event file; returns a JSON-serialisable result (runs in a worker process)"""
+    result = {'file': path, 'command': command, 'ok': True}
+    try:
+        data = read_event_data(path)
+    except (OSError, ValueError, LookupError, struct.error) as e:
+        result.update(ok=False, errors=[f"cannot be read: {e}"])
+        return result
+    if not isinstance(data, dict):
+        result.update(ok=False, errors=["not an event object"])
+        return result
+    result['event'] = data.get('name')
+
+    errors = validate_event_data(data)
+    if not errors:
+        try:
+            event = Event.from_dict(data)
+        except (KeyError, TypeError, ValueError, IndexError) as e:
+            errors.append(f"cannot be loaded: {e!r}")
+    if errors:
+        result.update(ok=False, errors=errors)
+        return result
+    if command == "validate":
+        return result
+
+    if command == "auto-seat":
+        group_key = (lambda guest: guest.last_name) if options.get('families') else None
+        assignments, unplaced = auto_assign(event, options.get('strategy', FRONT_TO_BACK), group_key)
+        result.update(seated=len(assignments), unplaced=len(unplaced))
+    result['stats'] = event_stats(event)
+
+    if options.get('output_dir') and command in ("auto-seat", "export"):
+        result['written'] = write_event(event, options['output_dir'], path, options.get('indent'))
+    return result
+
+
+def run(command, files, options, jobs=None):
+    """Yield the results as files finish; jobs=1 processes them in this process"""
+    if jobs == 1 or len(files) <= 1:
+        for path in files:
+            try:
+                result = process_file(command, path, options)
+            except Exception as e:  # one broken file must not stop the batch
+                result = {'file': path, 'command': command, 'ok': False, 'errors': [repr(e)]}
+            yield result
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(process_file, command, path, options): path for path in files}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:  # a crashed worker must not stop the batch
+                yield {'file': futures[future], 'command': command, 'ok': False, 'errors': [repr(e)]}
+
+
+def format_result(result):
+    status = "OK  " if result['ok'] else "FAIL"
+    line = f"{status} {result['file']}"
+    if result.get('event'):
+        line += f" ({result['event']})"
+    stats = result.get('stats')
+    if stats:
+        line += (f": {stats['occupied']}/{stats['capacity']} occupied, {stats['reserved']} reserved,"
+                 f" {stats['unassigned_guests']} unassigned")
+    if 'seated' in result:
+        line += f"; seated {result['seated']}, could not seat {result['unplaced']}"
+    if result.get('written'):
+        line += f" -> {result['written']}"
+    for error in result.get('errors', [])[:20]:
+        line += f"\n     {error}"
+    return line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m backend.cli", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=COMMANDS)
+    parser.add_argument("paths", nargs="+", help="event files or directories containing them")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per file")
+    parser.add_argument("-o", "--output-dir", help="auto-seat/export: write the resulting events here")
+    parser.add_argument("--indent", type=int, default=None, help="export: JSON indentation")
+    parser.add_argument("--strategy", choices=STRATEGIES, default=FRONT_TO_BACK, help="auto-seat strategy")
+    parser.add_argument("--families", action="store_true", help="auto-seat: keep guests with the same last name together")
+    args = parser.parse_args(argv)
+
+    files = find_event_files(args.paths)
+    if not files:
+        parser.error("no event files found")
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+    options = {'output_dir': args.output_dir, 'indent': args.indent,
+               'strategy': args.strategy, 'families': args.families}
+
+    failed = 0
+    for result in run(args.command, files, options, args.jobs):
+        failed += not result['ok']
+        print(json.dumps(result, ensure_ascii=False) if args.json else format_result(result), flush=True)
+    print(f"{len(files)} files, {failed} failed", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,48 +1,354 @@
+import uuid
 from datetime import datetime
-from .seat import Seat
+from .seat import Seat, AVAILABLE, OCCUPIED, RESERVED, SEAT_STATES
 from .guest import Guest
+from .guest_search import GuestSearchIndex
+from .seating_transaction import SeatingTransaction
+from .tracing import traced
 
 class Event:
     """Class representing an event"""
 
     def __init__(self, name, date_time, location, num_rows=10, num_seats_per_row=10):
+        self.event_id = uuid.uuid4().hex
+        self.revision = 0
         self.name = name
         self.date_time = date_time
         self.location = location
         self.num_rows = num_rows
         self.num_seats_per_row = num_seats_per_row
         self.seats = []
+        self._seat_grid = []
+        self._state_counts = {}
+        self._row_state_counts = []
         self.unassigned_guests = []
+        self.guests = {}
+        self._search_index = None
+        # Guests added (True) or removed (False) while an index is built elsewhere
+        self._search_journal = None
         self._initialize_seats()
 
     def _initialize_seats(self):
         """Create all seats for the event"""
         self.seats = []
+        self._seat_grid = []
+        # One int object per seat number, shared by all rows
+        numbers = list(range(1, self.num_seats_per_row + 1))
         for row in range(1, self.num_rows + 1):
-            for number in range(1, self.num_seats_per_row + 1):
-                self.seats.append(Seat(row, number))
+            row_seats = [Seat(row, number) for number in numbers]
+            for seat in row_seats:
+                seat.event = self
+            self._seat_grid.append(row_seats)
+            self.seats.extend(row_seats)
+        self._state_counts = {state: 0 for state in SEAT_STATES}
+        self._state_counts[AVAILABLE] = len(self.seats)
+        self._row_state_counts = [
+            {AVAILABLE: self.num_seats_per_row, OCCUPIED: 0, RESERVED: 0}
+            for _ in range(self.num_rows)
+        ]
+
+    def _build_seat_index(self):
+        """Rebuild the row/number grid and occupancy counters from the seat list.
+
+        The seat list is then rebuilt from the grid, so it is always complete
+        and in row-major order whatever the order it was given in. Positions
+        missing from the list get an available seat; seats outside the hall
+        or listed twice raise ValueError.
+        """
+        self._seat_grid = [[None] * self.num_seats_per_row for _ in range(self.num_rows)]
+        for seat in self.seats:
+            if not (1 <= seat.row <= self.num_rows and 1 <= seat.number <= self.num_seats_per_row):
+                raise ValueError(f"Seat {seat.get_identifier()} is outside the {self.num_rows}x{self.num_seats_per_row} hall")
+            if self._seat_grid[seat.row - 1][seat.number - 1] is not None:
+                raise ValueError(f"Seat {seat.get_identifier()} is listed more than once")
+            self._seat_grid[seat.row - 1][seat.number - 1] = seat
+        for row, row_seats in enumerate(self._seat_grid, start=1):
+            for index, seat in enumerate(row_seats):
+                if seat is None:
+                    row_seats[index] = Seat(row, index + 1)
+        self.seats = [seat for row_seats in self._seat_grid for seat in row_seats]
+
+        self._state_counts = {state: 0 for state in SEAT_STATES}
+        self._row_state_counts = [{state: 0 for state in SEAT_STATES} for _ in range(self.num_rows)]
+        for seat in self.seats:
+            seat.event = self
+            state = seat.get_state()
+            if seat.guest is not None:
+                self._register_guest(seat.guest)
+            self._state_counts[state] += 1
+            self._row_state_counts[seat.row - 1][state] += 1
+
+    @traced(category="backend")
+    def resize(self, num_rows, num_seats_per_row):
+        """Change the hall size, keeping the seats (and their guests) that still fit.
+
+        Only the added or removed rows/columns are touched. Guests of removed
+        seats go back to the unassigned guests. Returns (added_seats,
+        removed_seats, displaced_guests).
+        """
+        if num_rows < 1 or num_seats_per_row < 1:
+            raise ValueError("An event needs at least one row and one seat per row")
+        old_rows, old_seats_per_row = self.num_rows, self.num_seats_per_row
+        added, removed = [], []
+
+        # Columns of the rows that are kept
+        kept_rows = min(old_rows, num_rows)
+        for row_index in range(kept_rows):
+            row_seats = self._seat_grid[row_index]
+            if num_seats_per_row < old_seats_per_row:
+                removed.extend(row_seats[num_seats_per_row:])
+                del row_seats[num_seats_per_row:]
+            elif num_seats_per_row > old_seats_per_row:
+                new_seats = [Seat(row_index + 1, number)
+                             for number in range(old_seats_per_row + 1, num_seats_per_row + 1)]
+                row_seats.extend(new_seats)
+                added.extend(new_seats)
+
+        # Whole rows
+        if num_rows < old_rows:
+            for row_seats in self._seat_grid[num_rows:]:
+                removed.extend(row_seats)
+            del self._seat_grid[num_rows:]
+            del self._row_state_counts[num_rows:]
+        else:
+            numbers = list(range(1, num_seats_per_row + 1))
+            for row in range(old_rows + 1, num_rows + 1):
+                row_seats = [Seat(row, number) for number in numbers]
+                self._seat_grid.append(row_seats)
+                self._row_state_counts.append({state: 0 for state in SEAT_STATES})
+                added.extend(row_seats)
+
+        displaced = []
+        for seat in removed:
+            state = seat.get_state()
+            self._state_counts[state] -= 1
+            if seat.row <= num_rows:
+                self._row_state_counts[seat.row - 1][state] -= 1
+            seat.event = None
+            if seat.guest is not None:
+                guest = seat.guest
+                seat.guest = None
+                guest.assigned_seat = None
+                displaced.append(guest)
+        for seat in added:
+            seat.event = self
+            self._row_state_counts[seat.row - 1][AVAILABLE] += 1
+        self._state_counts[AVAILABLE] += len(added)
+
+        self.num_rows = num_rows
+        self.num_seats_per_row = num_seats_per_row
+        if num_seats_per_row == old_seats_per_row:
+            # Rows were only appended or truncated; `seats` is row-major (see
+            # _build_seat_index), so its tail holds exactly the last rows
+            if num_rows < old_rows:
+                del self.seats[num_rows * num_seats_per_row:]
+            else:
+                self.seats.extend(added)
+        elif added or removed:
+            self.seats = [seat for row_seats in self._seat_grid for seat in row_seats]
+        self.unassigned_guests.extend(displaced)
+        if added or removed:
+            self.revision += 1
+        return added, removed, displaced
+
+    def get_seats_outside(self, num_rows, num_seats_per_row):
+        """Return the seats a resize to the given size would remove"""
+        seats = []
+        for row_seats in self._seat_grid[:num_rows]:
+            seats.extend(row_seats[num_seats_per_row:])
+        for row_seats in self._seat_grid[num_rows:]:
+            seats.extend(row_seats)
+        return seats
+
+    def mark_modified(self):
+        """Bump the revision so storage knows the event must be saved again"""
+        self.revision += 1
+
+    def _seat_state_changed(self, seat, old_state):
+        """Update the revision and occupancy counters after a seat changed"""
+        # Reserving an occupied seat keeps it OCCUPIED but must still be saved
+        self.revision += 1
+        new_state = seat.get_state()
+        if new_state == old_state:
+            return
+        row_counts = self._row_state_counts[seat.row - 1]
+        self._state_counts[old_state] -= 1
+        self._state_counts[new_state] += 1
+        row_counts[old_state] -= 1
+        row_counts[new_state] += 1
+        if new_state == OCCUPIED and seat.guest.guest_id not in self.guests:
+            self._register_guest(seat.guest)
+
+    def _register_guest(self, guest):
+        # Imported lists may reuse ids already in the event; they get new ones
+        if self.guests.get(guest.guest_id, guest) is not guest:
+            guest.guest_id = uuid.uuid4().hex
+        self.guests[guest.guest_id] = guest
+        if self._search_index is not None:
+            self._search_index.add(guest)
+        elif self._search_journal is not None:
+            self._search_journal.append((guest, True))
 
     def add_guest(self, guest: Guest):
         """Add a guest to the list of unassigned guests"""
         self.unassigned_guests.append(guest)
+        self._register_guest(guest)
+        self.revision += 1
+
+    @traced(category="backend")
+    def add_guests(self, guests):
+        """Add many guests to the unassigned guests at once; returns how many were added"""
+        guests = list(guests)
+        self.unassigned_guests.extend(guests)
+        for guest in guests:
+            self._register_guest(guest)
+        self.revision += 1
+        return len(guests)
+
+    def get_guest(self, guest_id):
+        """Return the guest (seated or not) with the given id"""
+        return self.guests.get(guest_id)
+
+    @traced(category="backend")
+    def search_guests(self, query, limit=50):
+        """Find seated and unassigned guests by name, email or phone prefix.
+
+        Builds the index on the first call unless it was built in the
+        background (see prepare_search_index).
+        """
+        if self._search_index is None:
+            self.install_search_index(GuestSearchIndex(self.prepare_search_index()))
+        return self._search_index.search(query, limit)
+
+    def has_search_index(self):
+        return self._search_index is not None
+
+    def prepare_search_index(self):
+        """Return the guests to build a GuestSearchIndex from, e.g. in a worker thread.
+
+        Guests added or removed from now on are recorded and applied by
+        install_search_index.
+        """
+        self._search_journal = []
+        return list(self.guests.values())
+
+    def install_search_index(self, index):
+        """Use an index built from the guests of prepare_search_index, updated with the changes since"""
+        if self._search_journal is None:
+            return  # the index was already installed
+        for guest, added in self._search_journal:
+            if added:
+                index.add(guest)
+            else:
+                index.remove(guest)
+        self._search_journal = None
+        self._search_index = index
+
+    def remove_guest(self, guest: Guest):
+        """Remove a guest from the event, freeing its seat"""
+        self.guests.pop(guest.guest_id, None)
+        if self._search_index is not None:
+            self._search_index.remove(guest)
+        elif self._search_journal is not None:
+            self._search_journal.append((guest, False))
+        self.revision += 1
+        if guest.assigned_seat:
+            guest.assigned_seat.release()
+        elif guest in self.unassigned_guests:
+            self.unassigned_guests.remove(guest)
+
+    def move_guest(self, guest: Guest, target_seat):
+        """Move a seated guest to another available seat"""
+        source_seat = guest.assigned_seat
+        if source_seat is None or not target_seat.is_available():
+            return False
+        source_seat.release()
+        target_seat.assign_guest(guest)
+        return True
+
+    def assign_seat(self, row, number, guest: Guest):
+        """Seat an unassigned guest at a position; returns False if the seat is taken"""
+        seat = self.get_seat(row, number)
+        if seat is None or guest.assigned_seat is not None or not seat.is_available():
+            return False
+        if guest in self.unassigned_guests:
+            self.unassigned_guests.remove(guest)
+        return seat.assign_guest(guest)
+
+    @traced(category="backend")
+    def assign_guests(self, assignments):
+        """Seat many unassigned guests at once from (guest, seat) pairs; returns the seats changed"""
+        changed = []
+        for guest, seat in assignments:
+            if guest.assigned_seat is None and seat.assign_guest(guest):
+                changed.append(seat)
+        if changed:
+            self.unassigned_guests = [g for g in self.unassigned_guests if g.assigned_seat is None]
+        return changed
+
+    def transaction(self):
+        """Group seat operations so they are validated and applied together.
+
+            with event.transaction() as tx:
+                tx.release(seat)
+                tx.assign(guest, other_seat)
+            tx.changes.seats  # the seats to repaint
+        """
+        return SeatingTransaction(self)
+
+    def release_seat(self, row, number):
+        """Free a seat and move its guest back to the unassigned guests"""
+        seat = self.get_seat(row, number)
+        if seat is None or seat.guest is None:
+            return None
+        guest = seat.guest
+        seat.release()
+        self.unassigned_guests.append(guest)
+        return guest
+
+    def set_reserved(self, row, number, reserved=True):
+        seat = self.get_seat(row, number)
+        if seat is not None:
+            seat.reserved = reserved
 
     def get_seat(self, row, number):
         """Return the seat at the specified position"""
-        for seat in self.seats:
-            if seat.row == row and seat.number == number:
-                return seat
+        if 1 <= row <= self.num_rows and 1 <= number <= self.num_seats_per_row:
+            return self._seat_grid[row - 1][number - 1]
         return None
 
+    def get_adjacent_seat(self, seat, offset):
+        """Return the seat `offset` positions to the right (negative for left) in the same row"""
+        return self.get_seat(seat.row, seat.number + offset)
+
+    def get_row_seats(self, row, start=1):
+        """Return the seats of a row, starting from seat number `start`"""
+        if 1 <= row <= self.num_rows:
+            return self._seat_grid[row - 1][max(start, 1) - 1:]
+        return []
+
     def get_occupied_seats_count(self):
         """Return the number of occupied seats"""
-        return sum(1 for seat in self.seats if not seat.is_available())
+        return len(self.seats) - self._state_counts[AVAILABLE]
 
     def get_available_seats_count(self):
         """Return the number of available seats"""
-        return len(self.seats) - self.get_occupied_seats_count()
+        return self._state_counts[AVAILABLE]
+
+    def get_reserved_seats_count(self):
+        """Return the number of reserved seats without a guest"""
+        return self._state_counts[RESERVED]
+
+    def get_row_counts(self, row):
+        """Return the available/occupied/reserved counts of a row"""
+        if 1 <= row <= self.num_rows:
+            return dict(self._row_state_counts[row - 1])
+        return {state: 0 for state in SEAT_STATES}
 
+    @traced(category="backend")
     def to_dict(self):
         return {
+            'id': self.event_id,
             'name': self.name,
             'date_time': self.date_time.isoformat() if isinstance(self.date_time, datetime) else str(self.date_time),
             'location': self.location,
@@ -53,6 +359,7 @@ class Event:
         }
 
     @staticmethod
+    @traced(category="backend")
     def from_dict(data):
         date_time = datetime.fromisoformat(data['date_time']) if isinstance(data['date_time'], str) else data['date_time']
         event = Event(
@@ -62,6 +369,10 @@ class Event:
             data['num_rows'],
             data['num_seats_per_row']
         )
+        event.event_id = data.get('id') or event.event_id
         event.seats = [Seat.from_dict(s) for s in data['seats']]
+        event._build_seat_index()
         event.unassigned_guests = [Guest.from_dict(g) for g in data['unassigned_guests']]
+        for guest in event.unassigned_guests:
+            event._register_guest(guest)
         return event
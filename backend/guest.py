@@ -1,5 +1,10 @@
+import uuid
+
 class Guest:
-    def __init__(self, last_name, first_name, email="", phone=""):
+    __slots__ = ('guest_id', 'last_name', 'first_name', 'email', 'phone', 'assigned_seat')
+
+    def __init__(self, last_name, first_name, email="", phone="", guest_id=None):
+        self.guest_id = guest_id or uuid.uuid4().hex
         self.last_name = last_name
         self.first_name = first_name  # CORECTAT: era "fist_name"
         self.email = email
@@ -11,6 +16,7 @@ class Guest:
 
     def to_dict(self):
         return {
+            'id': self.guest_id,
             'last_name': self.last_name,
             'first_name': self.first_name,  # CORECTAT: era "fist_name"
             'email': self.email,
@@ -23,5 +29,6 @@ class Guest:
             data['last_name'],
             data['first_name'],
             data.get('email', ''),
-            data.get('phone', '')
+            data.get('phone', ''),
+            data.get('id')
         )
\ No newline at end of file
@@ -0,0 +1,80 @@
+import csv
+import json
+import os
+
+from .guest import Guest
+
+FIELDS = ('last_name', 'first_name', 'email', 'phone')
+
+
+def _iter_lines(f, progress, total):
+    """Decode a binary file line by line, reporting the bytes consumed"""
+    done = 0
+    for raw in f:
+        done += len(raw)
+        if progress:
+            progress(done, total)
+        yield raw.decode("utf-8-sig" if done == len(raw) else "utf-8")
+
+
+def read_guest_records(path, progress=None):
+    """Yield (line_number, record dict) from a CSV or JSONL guest file without reading it whole.
+
+    CSV files need a header row with the Guest field names (last_name,
+    first_name, email, phone); other columns are ignored. `progress` is
+    called with (bytes_read, total_bytes).
+    """
+    total = os.path.getsize(path)
+    with open(path, "rb") as f:
+        lines = _iter_lines(f, progress, total)
+        if path.lower().endswith((".jsonl", ".json")):
+            for line_number, line in enumerate(lines, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield line_number, ValueError(f"invalid JSON: {e.msg}")
+                    continue
+                yield line_number, record
+        else:
+            reader = csv.DictReader(lines)
+            if reader.fieldnames:
+                reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+            for record in reader:
+                yield reader.line_num, record
+
+
+def guest_from_record(record):
+    """Build a Guest from an imported record, raising ValueError if it is invalid"""
+    if isinstance(record, Exception):
+        raise record
+    if not isinstance(record, dict):
+        raise ValueError("record is not an object")
+    values = {field: str(record.get(field) or "").strip() for field in FIELDS}
+    if not values['last_name'] or not values['first_name']:
+        raise ValueError("first name and last name are required")
+    return Guest(values['last_name'], values['first_name'], values['email'], values['phone'],
+                 record.get('id') or None)
+
+
+def iter_guest_chunks(path, chunk_size=5000, progress=None, errors=None):
+    """Yield lists of at most `chunk_size` valid guests read from a file.
+
+    Invalid records are skipped and, if `errors` is a list, reported in it
+    as (line_number, message).
+    """
+    chunk = []
+    for line_number, record in read_guest_records(path, progress):
+        try:
+            chunk.append(guest_from_record(record))
+        except ValueError as e:
+            if errors is not None:
+                errors.append((line_number, str(e)))
+            continue
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
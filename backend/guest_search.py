@@ -0,0 +1,123 @@
+import bisect
+import heapq
+import re
+import unicodedata
+from functools import lru_cache
+
+_TOKEN_SPLIT = re.compile(r"[\s,;]+")
+_NON_DIGITS = re.compile(r"\D+")
+
+
+@lru_cache(maxsize=65536)
+def normalize(text):
+    """Lower-case text without diacritics, so "Ștefănescu" matches "stefanescu" """
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def guest_tokens(guest):
+    """Searchable tokens of a guest: name words, the email and the phone digits"""
+    tokens = set(_TOKEN_SPLIT.split(normalize(guest.last_name)))
+    tokens.update(_TOKEN_SPLIT.split(normalize(guest.first_name)))
+    email = normalize(guest.email.strip())
+    if email:
+        tokens.add(email)
+    phone = _NON_DIGITS.sub("", guest.phone)
+    if phone:
+        tokens.add(phone)
+    tokens.discard("")
+    return tokens
+
+
+class GuestSearchIndex:
+    """Prefix index over guest names, emails and phone numbers.
+
+    Tokens are kept in a sorted list so every token starting with a search
+    term is found with two bisections; adding or removing a guest only
+    touches that guest's tokens.
+    """
+
+    def __init__(self, guests=()):
+        self._postings = {}
+        self._tokens = []
+        self._guest_tokens = {}
+        self._guests = {}
+        self._sort_keys = {}
+        for guest in guests:
+            self._postings_add(guest)
+        self._tokens = sorted(self._postings)
+
+    def __len__(self):
+        return len(self._guests)
+
+    def _postings_add(self, guest):
+        tokens = guest_tokens(guest)
+        self._guests[guest.guest_id] = guest
+        self._guest_tokens[guest.guest_id] = tokens
+        self._sort_keys[guest.guest_id] = (normalize(guest.last_name), normalize(guest.first_name))
+        new_tokens = []
+        for token in tokens:
+            ids = self._postings.get(token)
+            if ids is None:
+                self._postings[token] = {guest.guest_id}
+                new_tokens.append(token)
+            else:
+                ids.add(guest.guest_id)
+        return new_tokens
+
+    def add(self, guest):
+        if guest.guest_id in self._guests:
+            self.remove(guest)
+        for token in self._postings_add(guest):
+            bisect.insort(self._tokens, token)
+
+    def remove(self, guest):
+        tokens = self._guest_tokens.pop(guest.guest_id, ())
+        self._guests.pop(guest.guest_id, None)
+        self._sort_keys.pop(guest.guest_id, None)
+        for token in tokens:
+            ids = self._postings[token]
+            ids.discard(guest.guest_id)
+            if not ids:
+                del self._postings[token]
+                i = bisect.bisect_left(self._tokens, token)
+                del self._tokens[i]
+
+    def _prefix_matches(self, term, limit):
+        """Guest ids having a token that starts with term (None if more than `limit` tokens match)"""
+        start = bisect.bisect_left(self._tokens, term)
+        end = bisect.bisect_left(self._tokens, term + "￿", start)
+        if end - start > limit:
+            return None
+        ids = set()
+        for token in self._tokens[start:end]:
+            ids.update(self._postings[token])
+        return ids
+
+    def search(self, query, limit=50):
+        """Return up to `limit` guests matching every word of the query as a prefix"""
+        terms = [t for t in _TOKEN_SPLIT.split(normalize(query)) if t]
+        if not terms:
+            return []
+        # Intersect the guests of every term; terms matching too many tokens are checked per candidate
+        result = None
+        deferred = []
+        for term in terms:
+            ids = self._prefix_matches(term, 2000)
+            if ids is None:
+                deferred.append(term)
+            else:
+                result = ids if result is None else result & ids
+        if result is None:
+            result = self._prefix_matches(deferred.pop(0), len(self._tokens))
+
+        sort_keys = self._sort_keys
+        if deferred:
+            result = [
+                guest_id for guest_id in result
+                if all(any(token.startswith(term) for token in self._guest_tokens[guest_id]) for term in deferred)
+            ]
+        guest_ids = heapq.nsmallest(limit, result, key=sort_keys.__getitem__)
+        return [self._guests[guest_id] for guest_id in guest_ids]
@@ -1,19 +1,53 @@
 from .guest import Guest
 
+AVAILABLE = "available"
+OCCUPIED = "occupied"
+RESERVED = "reserved"
+SEAT_STATES = (AVAILABLE, OCCUPIED, RESERVED)
+
 class Seat:
+    __slots__ = ('row', 'number', 'guest', '_reserved', 'event')
+
     def __init__(self, row, number):
         self.row = row
         self.number = number
         self.guest = None
-        self.reserved = False
+        self._reserved = False
+        self.event = None
+
+    @property
+    def reserved(self):
+        return self._reserved
+
+    @reserved.setter
+    def reserved(self, value):
+        value = bool(value)
+        if value == self._reserved:
+            return
+        old_state = self.get_state()
+        self._reserved = value
+        self._notify(old_state)
+
+    def get_state(self):
+        if self.guest is not None:
+            return OCCUPIED
+        if self._reserved:
+            return RESERVED
+        return AVAILABLE
+
+    def _notify(self, old_state):
+        """Let the owning event know the seat changed (its state may be the same)"""
+        if self.event is not None:
+            self.event._seat_state_changed(self, old_state)
     
     def is_available(self):
-        return self.guest is None and not self.reserved
+        return self.guest is None and not self._reserved
 
     def assign_guest(self, guest: Guest):
         if self.is_available():
             self.guest = guest
             guest.assigned_seat = self
+            self._notify(AVAILABLE)
             return True
         return False
 
@@ -21,6 +55,7 @@ class Seat:
         if self.guest:
             self.guest.assigned_seat = None
             self.guest = None
+            self._notify(OCCUPIED)
 
     def get_identifier(self):
         return f"R{self.row}-S{self.number}"
@@ -39,7 +74,5 @@ class Seat:
         seat.reserved = data.get('reserved', False)
         if data.get('guest'):
             seat.guest = Guest.from_dict(data['guest'])
+            seat.guest.assigned_seat = seat
         return seat
-
-
-
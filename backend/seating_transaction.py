@@ -0,0 +1,176 @@
+"""Grouped seat changes that are validated together and applied atomically."""
+
+ASSIGN = "assign"
+RELEASE = "release"
+RESERVE = "reserve"
+MOVE = "move"
+
+
+class SeatingConflict(ValueError):
+    """Raised when the operations of a transaction cannot all be applied"""
+
+    def __init__(self, conflicts):
+        super().__init__("; ".join(conflicts))
+        self.conflicts = conflicts
+
+
+class ChangeSet:
+    """The seats and guests a transaction changed"""
+
+    def __init__(self, seats=(), guests=(), unassigned_changed=False):
+        self.seats = list(seats)
+        self.guests = list(guests)
+        self.unassigned_changed = unassigned_changed
+
+    def __bool__(self):
+        return bool(self.seats or self.guests)
+
+
+class SeatingTransaction:
+    """Context manager collecting assign/release/reserve/move operations on an event.
+
+    Nothing changes until the block ends. The operations are then checked
+    in order against the seating as it would be at that point; if any of
+    them conflicts, none is applied and SeatingConflict is raised.
+    Otherwise they are applied and `changes` describes the result. Released
+    guests go back to the unassigned guests and newly seated ones leave it.
+    """
+
+    def __init__(self, event):
+        self.event = event
+        self.operations = []
+        self.changes = None
+
+    def assign(self, guest, seat):
+        self.operations.append((ASSIGN, guest, seat))
+
+    def release(self, seat):
+        self.operations.append((RELEASE, None, seat))
+
+    def reserve(self, seat, reserved=True):
+        self.operations.append((RESERVE, bool(reserved), seat))
+
+    def move(self, guest, seat):
+        self.operations.append((MOVE, guest, seat))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is None:
+            self.commit()
+        return False
+
+    def validate(self):
+        """Return the conflicts the operations would run into (empty if none)"""
+        seat_guest = {}
+        seat_reserved = {}
+        guest_seat = {}
+        conflicts = []
+
+        def guest_of(seat):
+            return seat_guest[id(seat)] if id(seat) in seat_guest else seat.guest
+
+        def seat_of(guest):
+            return guest_seat[id(guest)] if id(guest) in guest_seat else guest.assigned_seat
+
+        def is_free(seat):
+            reserved = seat_reserved[id(seat)] if id(seat) in seat_reserved else seat.reserved
+            return guest_of(seat) is None and not reserved
+
+        for op, value, seat in self.operations:
+            if seat.event is not self.event:
+                conflicts.append(f"{seat.get_identifier()} is not a seat of this event")
+                continue
+            if op == RESERVE:
+                seat_reserved[id(seat)] = value
+            elif op == RELEASE:
+                guest = guest_of(seat)
+                if guest is not None:
+                    seat_guest[id(seat)] = None
+                    guest_seat[id(guest)] = None
+            else:
+                guest = value
+                current = seat_of(guest)
+                if op == ASSIGN and current is not None:
+                    conflicts.append(f"{guest.get_full_name()} is already seated at {current.get_identifier()}")
+                elif op == MOVE and current is None:
+                    conflicts.append(f"{guest.get_full_name()} has no seat to move from")
+                elif not is_free(seat):
+                    conflicts.append(f"{seat.get_identifier()} is not available for {guest.get_full_name()}")
+                else:
+                    if current is not None:
+                        seat_guest[id(current)] = None
+                    seat_guest[id(seat)] = guest
+                    guest_seat[id(guest)] = seat
+        return conflicts
+
+    def commit(self):
+        """Validate and apply the operations; returns the ChangeSet"""
+        conflicts = self.validate()
+        if conflicts:
+            raise SeatingConflict(conflicts)
+
+        # Previous (guest, reserved) of every touched seat, to roll back on failure,
+        # and previous seat of every touched guest
+        undo = {}
+        seats = {}
+        guests = {}
+        try:
+            for op, value, seat in self.operations:
+                touched = [seat]
+                if op == MOVE:
+                    touched.append(value.assigned_seat)
+                for s in touched:
+                    if id(s) not in undo:
+                        undo[id(s)] = (s, s.guest, s.reserved)
+                    seats[id(s)] = s
+                    if s.guest is not None and id(s.guest) not in guests:
+                        guests[id(s.guest)] = (s.guest, s)
+
+                if op == RESERVE:
+                    seat.reserved = value
+                elif op == RELEASE:
+                    seat.release()
+                else:
+                    if op == MOVE:
+                        value.assigned_seat.release()
+                    if id(value) not in guests:
+                        guests[id(value)] = (value, value.assigned_seat)
+                    if not seat.assign_guest(value):
+                        raise SeatingConflict([f"{seat.get_identifier()} is not available"])
+        except Exception:
+            self._rollback(undo.values())
+            raise
+
+        changed_guests = [guest for guest, seat in guests.values() if guest.assigned_seat is not seat]
+        changed_seats = [seat for s_id, seat in seats.items()
+                         if (seat.guest, seat.reserved) != undo[s_id][1:]]
+        unassigned_changed = self._update_unassigned(changed_guests)
+        self.changes = ChangeSet(changed_seats, changed_guests, unassigned_changed)
+        return self.changes
+
+    def _rollback(self, snapshots):
+        snapshots = list(snapshots)
+        for seat, _, _ in snapshots:
+            seat.release()
+        for seat, guest, reserved in snapshots:
+            seat.reserved = False
+            if guest is not None:
+                seat.assign_guest(guest)
+            seat.reserved = reserved
+
+    def _update_unassigned(self, guests):
+        """Move the touched guests in or out of the unassigned guests; returns True if the list changed"""
+        event = self.event
+        seated = {id(g) for g in guests if g.assigned_seat is not None}
+        unseated = [g for g in guests if g.assigned_seat is None]
+        if not seated and not unseated:
+            return False
+        listed = {id(g) for g in event.unassigned_guests}
+        leaving = seated & listed
+        joining = [g for g in unseated if id(g) not in listed]
+        if leaving:
+            event.unassigned_guests = [g for g in event.unassigned_guests if id(g) not in leaving]
+        event.unassigned_guests.extend(joining)
+        return bool(leaving or joining)
@@ -0,0 +1,293 @@
+"""Compact binary snapshots of events, readable through mmap.
+
+Layout (all integers little-endian):
+
+    header      magic, version, hall size, counts and section offsets
+    metadata    UTF-8 JSON with id, name, date_time and location
+    states      one byte per seat in row-major order (OCCUPIED_FLAG | RESERVED_FLAG)
+    slots       uint32 per seat: index of the seated guest, NO_GUEST if empty
+    strings     uint32 end offsets into the pool, GUEST_FIELDS per guest
+    unassigned  uint32 guest indices of the unassigned guests
+    pool        UTF-8 bytes of all guest strings
+
+Seat states can be counted and rendered straight from the mapped file; a
+guest is only decoded when it is asked for. `to_event` builds the full
+Event, decoding every guest; the editor needs that (EventStorage.load_event),
+so only counts, analytics and single-seat lookups stay lazy. JSON
+(`Event.to_dict`/`from_dict`) stays the exchange format.
+"""
+import json
+import mmap
+import re
+import struct
+import sys
+from array import array
+from datetime import datetime
+from itertools import accumulate
+
+from .event import Event
+from .guest import Guest
+from .seat import AVAILABLE, OCCUPIED, RESERVED
+from .tracing import traced
+
+MAGIC = b"EVSNAP\r\n"
+VERSION = 1
+HEADER = struct.Struct("<8sHHIIII8Q")
+OCCUPIED_FLAG = 1
+RESERVED_FLAG = 2
+NO_GUEST = 0xFFFFFFFF
+GUEST_FIELDS = ('guest_id', 'last_name', 'first_name', 'email', 'phone')
+
+_NONZERO = re.compile(b"[^\x00]")
+
+
+class SnapshotError(ValueError):
+    """Raised when a file is not a readable event snapshot"""
+
+
+def _u32_array(values=()):
+    return array('I', values)
+
+
+def _u32_bytes(values):
+    if sys.byteorder == "big":
+        values = array('I', values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _u32_from_bytes(data):
+    values = array('I')
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _padding(length):
+    return b"\x00" * (-length % 8)
+
+
+@traced(category="storage")
+def encode_event(event):
+    """Serialise an Event to snapshot bytes"""
+    # Row by row from the grid, so the arrays are row-major whatever the order of event.seats
+    seats = [seat for row in range(1, event.num_rows + 1) for seat in event.get_row_seats(row)]
+    states = bytearray(len(seats))
+    slots = _u32_array([NO_GUEST]) * len(seats)
+    guests = []
+    guest_index = {}
+
+    def index_of(guest):
+        index = guest_index.get(id(guest))
+        if index is None:
+            index = guest_index[id(guest)] = len(guests)
+            guests.append(guest)
+        return index
+
+    for i, seat in enumerate(seats):
+        flags = 0
+        if seat.guest is not None:
+            flags = OCCUPIED_FLAG
+            slots[i] = index_of(seat.guest)
+        if seat.reserved:
+            flags |= RESERVED_FLAG
+        states[i] = flags
+    unassigned = _u32_array(index_of(guest) for guest in event.unassigned_guests)
+
+    parts = [(getattr(guest, field) or "").encode("utf-8") for guest in guests for field in GUEST_FIELDS]
+    ends = _u32_array(accumulate(len(part) for part in parts))
+    pool = b"".join(parts)
+    if len(pool) > NO_GUEST:
+        raise SnapshotError("Guest data too large for a snapshot")
+
+    date_time = event.date_time.isoformat() if isinstance(event.date_time, datetime) else str(event.date_time)
+    meta = json.dumps({'id': event.event_id, 'name': event.name, 'date_time': date_time,
+                       'location': event.location}, ensure_ascii=False).encode("utf-8")
+
+    sections = [meta, bytes(states), _u32_bytes(slots), _u32_bytes(ends), _u32_bytes(unassigned), pool]
+    offsets = []
+    body = []
+    position = HEADER.size
+    for section in sections:
+        offsets.append(position)
+        body.append(section)
+        body.append(_padding(len(section)))
+        position += len(section) + len(body[-1])
+    header = HEADER.pack(MAGIC, VERSION, 0, event.num_rows, event.num_seats_per_row, len(guests), len(unassigned),
+                         offsets[0], len(meta), offsets[1], offsets[2], offsets[3], offsets[4], offsets[5], len(pool))
+    return header + b"".join(body)
+
+
+def write_snapshot(event, path):
+    with open(path, "wb") as f:
+        f.write(encode_event(event))
+
+
+class EventSnapshot:
+    """Read-only view of a snapshot file (or bytes).
+
+    Files are memory-mapped, so opening one only reads the header and the
+    metadata; seat states and guests are read from the mapping on demand.
+    """
+
+    def __init__(self, path=None, data=None):
+        self._file = None
+        if data is None:
+            self._file = open(path, "rb")
+            try:
+                data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                self._file.close()
+                raise SnapshotError(f"{path} is empty")
+        self._data = data
+        if len(data) < HEADER.size:
+            self.close()
+            raise SnapshotError("Snapshot header is truncated")
+        (magic, version, _, self.num_rows, self.num_seats_per_row, self.guest_count, self.unassigned_count,
+         meta_offset, meta_length, self._states_offset, self._slots_offset, self._strings_offset,
+         self._unassigned_offset, self._pool_offset, pool_length) = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise SnapshotError("Not an event snapshot (or an unsupported version)")
+        if self._pool_offset + pool_length > len(data):
+            self.close()
+            raise SnapshotError("Snapshot is truncated")
+        meta = json.loads(bytes(data[meta_offset:meta_offset + meta_length]).decode("utf-8"))
+        self.event_id = meta['id']
+        self.name = meta['name']
+        self.location = meta['location']
+        try:
+            self.date_time = datetime.fromisoformat(meta['date_time'])
+        except (TypeError, ValueError):
+            self.date_time = meta['date_time']
+        self._guest_cache = {}
+
+    @property
+    def seat_count(self):
+        return self.num_rows * self.num_seats_per_row
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+        return False
+
+    def seat_states(self, start=0, end=None):
+        """Raw state flags of the seats [start, end) in row-major order, as bytes"""
+        end = self.seat_count if end is None else min(end, self.seat_count)
+        return self._data[self._states_offset + start:self._states_offset + end]
+
+    @staticmethod
+    def _state(flags):
+        if flags & OCCUPIED_FLAG:
+            return OCCUPIED
+        if flags & RESERVED_FLAG:
+            return RESERVED
+        return AVAILABLE
+
+    def get_seat_state(self, row, number):
+        if not (1 <= row <= self.num_rows and 1 <= number <= self.num_seats_per_row):
+            return None
+        return self._state(self._data[self._states_offset + (row - 1) * self.num_seats_per_row + number - 1])
+
+    def _counts(self, states):
+        occupied = len(states) - states.count(0) - states.count(RESERVED_FLAG)
+        reserved = states.count(RESERVED_FLAG)
+        return {AVAILABLE: len(states) - occupied - reserved, OCCUPIED: occupied, RESERVED: reserved}
+
+    def get_state_counts(self):
+        """Available/occupied/reserved counts of the whole hall (reserved means reserved without a guest)"""
+        return self._counts(self.seat_states())
+
+    def get_row_counts(self, row):
+        if not 1 <= row <= self.num_rows:
+            return {AVAILABLE: 0, OCCUPIED: 0, RESERVED: 0}
+        start = (row - 1) * self.num_seats_per_row
+        return self._counts(self.seat_states(start, start + self.num_seats_per_row))
+
+    def _guest_fields(self, index):
+        fields = len(GUEST_FIELDS)
+        first = index * fields
+        offset = self._strings_offset + first * 4
+        ends = struct.unpack_from(f"<{fields}I", self._data, offset)
+        start = struct.unpack_from("<I", self._data, offset - 4)[0] if first else 0
+        pool = bytes(self._data[self._pool_offset + start:self._pool_offset + ends[-1]])
+        values = []
+        position = 0
+        for end in ends:
+            values.append(pool[position:end - start].decode("utf-8"))
+            position = end - start
+        return values
+
+    def get_guest(self, index):
+        """Decode guest number `index` of the guest table (cached)"""
+        guest = self._guest_cache.get(index)
+        if guest is None:
+            if not 0 <= index < self.guest_count:
+                raise IndexError(index)
+            guest_id, last_name, first_name, email, phone = self._guest_fields(index)
+            guest = self._guest_cache[index] = Guest(last_name, first_name, email, phone, guest_id)
+        return guest
+
+    def get_seat_guest(self, row, number):
+        """Guest seated at a position, or None"""
+        if not (1 <= row <= self.num_rows and 1 <= number <= self.num_seats_per_row):
+            return None
+        i = (row - 1) * self.num_seats_per_row + number - 1
+        index = struct.unpack_from("<I", self._data, self._slots_offset + i * 4)[0]
+        return None if index == NO_GUEST else self.get_guest(index)
+
+    def _all_guests(self):
+        """Decode the whole guest table in one pass"""
+        fields = len(GUEST_FIELDS)
+        count = self.guest_count * fields
+        ends = _u32_from_bytes(self._data[self._strings_offset:self._strings_offset + count * 4])
+        pool = self._data[self._pool_offset:self._pool_offset + (ends[-1] if count else 0)]
+        strings = []
+        start = 0
+        for end in ends:
+            strings.append(pool[start:end].decode("utf-8"))
+            start = end
+        return [Guest(strings[i + 1], strings[i + 2], strings[i + 3], strings[i + 4], strings[i])
+                for i in range(0, count, fields)]
+
+    @traced(category="storage")
+    def to_event(self):
+        """Build the full Event (all seats and guests)"""
+        event = Event(self.name, self.date_time, self.location, self.num_rows, self.num_seats_per_row)
+        event.event_id = self.event_id
+        guests = self._all_guests()
+        states = self.seat_states()
+        slots = _u32_from_bytes(self._data[self._slots_offset:self._slots_offset + self.seat_count * 4])
+        seats_per_row = self.num_seats_per_row
+        # Only the seats that are not available need work
+        for match in _NONZERO.finditer(states):
+            i = match.start()
+            seat = event.get_seat(i // seats_per_row + 1, i % seats_per_row + 1)
+            if states[i] & OCCUPIED_FLAG:
+                seat.assign_guest(guests[slots[i]])
+            if states[i] & RESERVED_FLAG:
+                seat.reserved = True
+        unassigned = _u32_from_bytes(self._data[self._unassigned_offset:self._unassigned_offset + self.unassigned_count * 4])
+        event.add_guests(guests[i] for i in unassigned)
+        event.revision = 0
+        return event
+
+    def to_dict(self):
+        """The event in Event.to_dict format"""
+        return self.to_event().to_dict()
+
+
+def read_snapshot(path):
+    """Load the Event stored in a snapshot file"""
+    with EventSnapshot(path) as snapshot:
+        return snapshot.to_event()
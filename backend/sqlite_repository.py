@@ -0,0 +1,429 @@
+import sqlite3
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+from .event import Event
+from .guest import Guest
+from .seat import Seat, AVAILABLE, OCCUPIED, RESERVED
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    date_time TEXT NOT NULL,
+    location TEXT NOT NULL,
+    num_rows INTEGER NOT NULL,
+    num_seats_per_row INTEGER NOT NULL
+);
+-- Guest ids are only unique within an event, like in Event
+CREATE TABLE IF NOT EXISTS guests (
+    id TEXT NOT NULL,
+    event_id TEXT NOT NULL REFERENCES events(id) ON DELETE CASCADE,
+    last_name TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    email TEXT NOT NULL DEFAULT '',
+    phone TEXT NOT NULL DEFAULT '',
+    position INTEGER NOT NULL,
+    PRIMARY KEY (event_id, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS guests_event ON guests(event_id, position);
+CREATE INDEX IF NOT EXISTS guests_name ON guests(event_id, last_name, first_name);
+CREATE INDEX IF NOT EXISTS guests_email ON guests(email);
+-- Only seats that are occupied or reserved have a row
+CREATE TABLE IF NOT EXISTS seats (
+    event_id TEXT NOT NULL REFERENCES events(id) ON DELETE CASCADE,
+    row INTEGER NOT NULL,
+    number INTEGER NOT NULL,
+    guest_id TEXT,
+    reserved INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (event_id, row, number),
+    UNIQUE (event_id, guest_id),
+    FOREIGN KEY (event_id, guest_id) REFERENCES guests(event_id, id)
+) WITHOUT ROWID;
+"""
+
+
+def event_rows(event, stored_guests=None):
+    """The rows an in-memory Event is stored as.
+
+    Returns the events row, {(row, number): (guest_id, reserved)} for the
+    occupied and reserved seats and {guest_id: (last_name, first_name,
+    email, phone, position)}. Only the order of the unassigned guests'
+    positions matters; positions found in `stored_guests` (the guest rows
+    of the last save) are kept while they are still in order, so that
+    seating or releasing a guest changes only that guest's row.
+    """
+    stored_guests = stored_guests or {}
+    date_time = event.date_time.isoformat() if isinstance(event.date_time, datetime) else str(event.date_time)
+    event_row = (event.event_id, event.name, date_time, event.location, event.num_rows, event.num_seats_per_row)
+    seats = {}
+    guests = {}
+    for seat in event.seats:
+        guest = seat.guest
+        if guest is None and not seat.reserved:
+            continue
+        seats[(seat.row, seat.number)] = (guest.guest_id if guest else None, int(seat.reserved))
+        if guest is not None:
+            stored = stored_guests.get(guest.guest_id)
+            guests[guest.guest_id] = (guest.last_name, guest.first_name, guest.email or "", guest.phone or "",
+                                      stored[4] if stored else 0)
+    last = -1
+    for guest in event.unassigned_guests:
+        stored = stored_guests.get(guest.guest_id)
+        last = stored[4] if stored and stored[4] > last else last + 1
+        guests[guest.guest_id] = (guest.last_name, guest.first_name, guest.email or "", guest.phone or "", last)
+    return event_row, seats, guests
+
+
+class SQLiteEventStore:
+    """SQLite database holding any number of events.
+
+    The connection runs in WAL mode and in autocommit; wrap many operations
+    in `with store.transaction():` to commit them together.
+    """
+
+    def __init__(self, path, check_same_thread=True):
+        self.path = path
+        # check_same_thread=False lets a caller that serialises access share the store between threads
+        self.connection = sqlite3.connect(path, isolation_level=None, check_same_thread=check_same_thread)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+        self._transaction_depth = 0
+
+    @contextmanager
+    def transaction(self):
+        """Group several operations in a single transaction (nesting is allowed)"""
+        if self._transaction_depth == 0:
+            self.connection.execute("BEGIN")
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self.connection.execute("ROLLBACK")
+            raise
+        self._transaction_depth -= 1
+        if self._transaction_depth == 0:
+            self.connection.execute("COMMIT")
+
+    def create_event(self, name, date_time, location, num_rows=10, num_seats_per_row=10):
+        return self.import_event(Event(name, date_time, location, num_rows, num_seats_per_row))
+
+    def import_event(self, event: Event):
+        """Store an in-memory Event (seats and guests included) and return its SQLite counterpart"""
+        self.save_event_data(event.to_dict())
+        return self.open_event(event.event_id)
+
+    def save_event_data(self, data):
+        """Store an event given in Event.to_dict format, replacing any stored event with the same id"""
+        seats = data['seats']
+        guests = [seat['guest'] for seat in seats if seat.get('guest')] + list(data['unassigned_guests'])
+        event_row = (data['id'], data['name'], str(data['date_time']), data['location'],
+                     data['num_rows'], data['num_seats_per_row'])
+        self.save_event_rows(
+            event_row,
+            {(s['row'], s['number']): (s['guest']['id'] if s.get('guest') else None, int(bool(s.get('reserved'))))
+             for s in seats if s.get('guest') or s.get('reserved')},
+            {g['id']: (g['last_name'], g['first_name'], g.get('email', ''), g.get('phone', ''), position)
+             for position, g in enumerate(guests)})
+
+    def save_event_rows(self, event_row, seats, guests, stored=None):
+        """Store an event given as `event_rows` returns it.
+
+        With `stored`, the (event_row, seats, guests) of the last save, only
+        the rows that differ are written; otherwise the stored event is
+        replaced as a whole.
+        """
+        event_id = event_row[0]
+        db = self.connection
+        with self.transaction():
+            if stored is None:
+                db.execute("DELETE FROM events WHERE id = ?", (event_id,))
+                stored = (None, {}, {})
+            old_event_row, old_seats, old_guests = stored
+            if event_row != old_event_row:
+                db.execute(
+                    "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (id) DO UPDATE SET "
+                    "name = excluded.name, date_time = excluded.date_time, location = excluded.location, "
+                    "num_rows = excluded.num_rows, num_seats_per_row = excluded.num_seats_per_row", event_row)
+            db.executemany(
+                "INSERT INTO guests VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (event_id, id) DO UPDATE SET "
+                "last_name = excluded.last_name, first_name = excluded.first_name, email = excluded.email, "
+                "phone = excluded.phone, position = excluded.position",
+                ((guest_id, event_id) + values for guest_id, values in guests.items()
+                 if old_guests.get(guest_id) != values))
+            # Changed seats are deleted first, so a guest can move to a seat listed before its old one
+            db.executemany(
+                "DELETE FROM seats WHERE event_id = ? AND row = ? AND number = ?",
+                ((event_id, row, number) for (row, number), values in old_seats.items()
+                 if seats.get((row, number)) != values))
+            db.executemany(
+                "INSERT INTO seats VALUES (?, ?, ?, ?, ?)",
+                ((event_id, row, number) + values for (row, number), values in seats.items()
+                 if old_seats.get((row, number)) != values))
+            db.executemany(
+                "DELETE FROM guests WHERE event_id = ? AND id = ?",
+                ((event_id, guest_id) for guest_id in old_guests if guest_id not in guests))
+
+    def load_event_rows(self, event_id):
+        """The stored (event_row, seats, guests) of an event, as `save_event_rows` takes them; None if it is not stored"""
+        db = self.connection
+        event_row = db.execute(
+            "SELECT id, name, date_time, location, num_rows, num_seats_per_row FROM events WHERE id = ?",
+            (event_id,)).fetchone()
+        if event_row is None:
+            return None
+        seats = {(row, number): (guest_id, reserved) for row, number, guest_id, reserved in db.execute(
+            "SELECT row, number, guest_id, reserved FROM seats WHERE event_id = ?", (event_id,))}
+        guests = {row[0]: row[1:] for row in db.execute(
+            "SELECT id, last_name, first_name, email, phone, position FROM guests WHERE event_id = ?", (event_id,))}
+        return event_row, seats, guests
+
+    def open_event(self, event_id):
+        row = self.connection.execute(
+            "SELECT name, date_time, location, num_rows, num_seats_per_row FROM events WHERE id = ?",
+            (event_id,)).fetchone()
+        if row is None:
+            return None
+        return SQLiteEvent(self, event_id, *row)
+
+    def list_events(self):
+        """Return (event_id, name, date_time) for every stored event"""
+        return self.connection.execute("SELECT id, name, date_time FROM events ORDER BY rowid").fetchall()
+
+    def delete_event(self, event_id):
+        self.connection.execute("DELETE FROM events WHERE id = ?", (event_id,))
+
+    def close(self):
+        self.connection.close()
+
+
+class SQLiteEvent:
+    """An event stored in SQLite, with the same operations as the in-memory Event.
+
+    Every change is a single-row statement. Seats and guests returned by the
+    getters are detached snapshots; change them through the event methods.
+    """
+
+    def __init__(self, store, event_id, name, date_time, location, num_rows, num_seats_per_row):
+        self.store = store
+        self.db = store.connection
+        self.event_id = event_id
+        self.name = name
+        try:
+            self.date_time = datetime.fromisoformat(date_time)
+        except ValueError:
+            self.date_time = date_time
+        self.location = location
+        self.num_rows = num_rows
+        self.num_seats_per_row = num_seats_per_row
+
+    def _guest_from_row(self, row):
+        guest_id, last_name, first_name, email, phone = row
+        return Guest(last_name, first_name, email, phone, guest_id)
+
+    def _next_position(self):
+        return self.db.execute(
+            "SELECT COALESCE(MAX(position), -1) + 1 FROM guests WHERE event_id = ?",
+            (self.event_id,)).fetchone()[0]
+
+    def _renew_taken_ids(self, guests):
+        """Like Event, give new ids to guests whose id is already used in this event"""
+        seen = set()
+        for guest in guests:
+            if guest.guest_id in seen or self.db.execute(
+                    "SELECT 1 FROM guests WHERE event_id = ? AND id = ?", (self.event_id, guest.guest_id)).fetchone():
+                guest.guest_id = uuid.uuid4().hex
+            seen.add(guest.guest_id)
+
+    def add_guest(self, guest: Guest):
+        """Add a guest to the list of unassigned guests"""
+        self._renew_taken_ids([guest])
+        self._insert_guest(guest, "INSERT")
+
+    def add_guests(self, guests):
+        """Add many guests in one transaction; returns how many were added"""
+        guests = list(guests)
+        self._renew_taken_ids(guests)
+        position = self._next_position()
+        rows = [(g.guest_id, self.event_id, g.last_name, g.first_name, g.email, g.phone, position + i)
+                for i, g in enumerate(guests)]
+        with self.store.transaction():
+            self.db.executemany("INSERT INTO guests VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def _insert_guest(self, guest, verb):
+        self.db.execute(
+            verb + " INTO guests VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (guest.guest_id, self.event_id, guest.last_name, guest.first_name, guest.email, guest.phone,
+             self._next_position()))
+
+    def get_guest(self, guest_id):
+        row = self.db.execute(
+            "SELECT id, last_name, first_name, email, phone FROM guests WHERE event_id = ? AND id = ?",
+            (self.event_id, guest_id)).fetchone()
+        return self._guest_from_row(row) if row else None
+
+    def find_guests(self, last_name=None, first_name=None, email=None):
+        """Return the guests matching all the given fields exactly"""
+        query = "SELECT id, last_name, first_name, email, phone FROM guests WHERE event_id = ?"
+        params = [self.event_id]
+        for column, value in (("last_name", last_name), ("first_name", first_name), ("email", email)):
+            if value is not None:
+                query += f" AND {column} = ?"
+                params.append(value)
+        return [self._guest_from_row(row) for row in self.db.execute(query, params)]
+
+    def remove_guest(self, guest: Guest):
+        """Remove a guest from the event, freeing its seat"""
+        with self.store.transaction():
+            self._free_guest_seat(guest.guest_id)
+            self.db.execute("DELETE FROM guests WHERE event_id = ? AND id = ?", (self.event_id, guest.guest_id))
+
+    def _free_guest_seat(self, guest_id):
+        self.db.execute("DELETE FROM seats WHERE event_id = ? AND guest_id = ? AND reserved = 0",
+                        (self.event_id, guest_id))
+        self.db.execute("UPDATE seats SET guest_id = NULL WHERE event_id = ? AND guest_id = ?",
+                        (self.event_id, guest_id))
+
+    @property
+    def unassigned_guests(self):
+        rows = self.db.execute(
+            "SELECT g.id, g.last_name, g.first_name, g.email, g.phone FROM guests g "
+            "WHERE g.event_id = ? AND NOT EXISTS (SELECT 1 FROM seats s WHERE s.event_id = g.event_id AND s.guest_id = g.id) "
+            "ORDER BY g.position", (self.event_id,))
+        return [self._guest_from_row(row) for row in rows]
+
+    def _in_hall(self, row, number):
+        return 1 <= row <= self.num_rows and 1 <= number <= self.num_seats_per_row
+
+    def get_seat(self, row, number):
+        """Return a snapshot of the seat at the specified position"""
+        if not self._in_hall(row, number):
+            return None
+        seat = Seat(row, number)
+        record = self.db.execute(
+            "SELECT s.reserved, g.id, g.last_name, g.first_name, g.email, g.phone FROM seats s "
+            "LEFT JOIN guests g ON g.event_id = s.event_id AND g.id = s.guest_id "
+            "WHERE s.event_id = ? AND s.row = ? AND s.number = ?",
+            (self.event_id, row, number)).fetchone()
+        if record:
+            seat.reserved = bool(record[0])
+            if record[1]:
+                seat.guest = self._guest_from_row(record[1:])
+                seat.guest.assigned_seat = seat
+        return seat
+
+    def assign_seat(self, row, number, guest: Guest):
+        """Seat an unassigned guest at a position; returns False if the seat is taken"""
+        if not self._in_hall(row, number):
+            return False
+        with self.store.transaction():
+            if self.db.execute("SELECT 1 FROM seats WHERE event_id = ? AND guest_id = ?",
+                               (self.event_id, guest.guest_id)).fetchone():
+                return False
+            # Like Event, seating a guest that was never added registers it
+            self._insert_guest(guest, "INSERT OR IGNORE")
+            cursor = self.db.execute(
+                "INSERT INTO seats (event_id, row, number, guest_id) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (event_id, row, number) DO NOTHING",
+                (self.event_id, row, number, guest.guest_id))
+            return cursor.rowcount == 1
+
+    def release_seat(self, row, number):
+        """Free a seat and move its guest back to the unassigned guests"""
+        seat = self.get_seat(row, number)
+        if seat is None or seat.guest is None:
+            return None
+        guest = seat.guest
+        with self.store.transaction():
+            self._free_guest_seat(guest.guest_id)
+            # Released guests go to the end of the unassigned list, like Event.release_seat
+            self.db.execute("UPDATE guests SET position = ? WHERE event_id = ? AND id = ?",
+                            (self._next_position(), self.event_id, guest.guest_id))
+        guest.assigned_seat = None
+        return guest
+
+    def set_reserved(self, row, number, reserved=True):
+        if not self._in_hall(row, number):
+            return
+        if reserved:
+            self.db.execute(
+                "INSERT INTO seats (event_id, row, number, reserved) VALUES (?, ?, ?, 1) "
+                "ON CONFLICT (event_id, row, number) DO UPDATE SET reserved = 1",
+                (self.event_id, row, number))
+        else:
+            with self.store.transaction():
+                self.db.execute(
+                    "DELETE FROM seats WHERE event_id = ? AND row = ? AND number = ? AND guest_id IS NULL",
+                    (self.event_id, row, number))
+                self.db.execute(
+                    "UPDATE seats SET reserved = 0 WHERE event_id = ? AND row = ? AND number = ?",
+                    (self.event_id, row, number))
+
+    def move_guest(self, guest: Guest, target_seat):
+        """Move a seated guest to another available seat"""
+        with self.store.transaction():
+            cursor = self.db.execute(
+                "SELECT row, number, reserved FROM seats WHERE event_id = ? AND guest_id = ?",
+                (self.event_id, guest.guest_id))
+            source = cursor.fetchone()
+            if source is None or not self.get_seat(target_seat.row, target_seat.number).is_available():
+                return False
+            self._free_guest_seat(guest.guest_id)
+            self.db.execute(
+                "INSERT INTO seats (event_id, row, number, guest_id) VALUES (?, ?, ?, ?)",
+                (self.event_id, target_seat.row, target_seat.number, guest.guest_id))
+        return True
+
+    def _count(self, condition=""):
+        return self.db.execute(
+            "SELECT COUNT(*) FROM seats WHERE event_id = ?" + condition, (self.event_id,)).fetchone()[0]
+
+    def get_occupied_seats_count(self):
+        """Return the number of occupied seats"""
+        return self._count()
+
+    def get_available_seats_count(self):
+        """Return the number of available seats"""
+        return self.num_rows * self.num_seats_per_row - self._count()
+
+    def get_reserved_seats_count(self):
+        """Return the number of reserved seats without a guest"""
+        return self._count(" AND guest_id IS NULL")
+
+    def get_row_counts(self, row):
+        """Return the available/occupied/reserved counts of a row"""
+        if not 1 <= row <= self.num_rows:
+            return {AVAILABLE: 0, OCCUPIED: 0, RESERVED: 0}
+        occupied, reserved = self.db.execute(
+            "SELECT COUNT(guest_id), COUNT(*) - COUNT(guest_id) FROM seats "
+            "WHERE event_id = ? AND row = ?", (self.event_id, row)).fetchone()
+        return {AVAILABLE: self.num_seats_per_row - occupied - reserved, OCCUPIED: occupied, RESERVED: reserved}
+
+    def to_event(self):
+        """Load the whole event into an in-memory Event"""
+        event = Event(self.name, self.date_time, self.location, self.num_rows, self.num_seats_per_row)
+        event.event_id = self.event_id
+        guests = {}
+        for row in self.db.execute(
+                "SELECT id, last_name, first_name, email, phone FROM guests WHERE event_id = ? ORDER BY position",
+                (self.event_id,)):
+            guests[row[0]] = self._guest_from_row(row)
+        for row, number, guest_id, reserved in self.db.execute(
+                "SELECT row, number, guest_id, reserved FROM seats WHERE event_id = ?", (self.event_id,)):
+            seat = event.get_seat(row, number)
+            if guest_id:
+                seat.assign_guest(guests.pop(guest_id))
+            seat.reserved = bool(reserved)
+        for guest in guests.values():
+            event.add_guest(guest)
+        event.revision = 0
+        return event
+
+    def to_dict(self):
+        return self.to_event().to_dict()
@@ -0,0 +1,301 @@
+import json
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from .event import Event
+from .snapshot import EventSnapshot, encode_event
+from .sqlite_repository import SQLiteEventStore, event_rows
+from .tracing import traced
+
+
+class EventHeader:
+    """Summary of a stored event, enough to list it without loading its seats"""
+
+    def __init__(self, event_id, name, date_time, location, num_rows, num_seats_per_row):
+        self.event_id = event_id
+        self.name = name
+        self.date_time = date_time
+        self.location = location
+        self.num_rows = num_rows
+        self.num_seats_per_row = num_seats_per_row
+
+    @staticmethod
+    def from_event(event):
+        return EventHeader(event.event_id, event.name, event.date_time, event.location,
+                           event.num_rows, event.num_seats_per_row)
+
+    def to_dict(self):
+        return {
+            'id': self.event_id,
+            'name': self.name,
+            'date_time': self.date_time.isoformat() if isinstance(self.date_time, datetime) else str(self.date_time),
+            'location': self.location,
+            'num_rows': self.num_rows,
+            'num_seats_per_row': self.num_seats_per_row
+        }
+
+    @staticmethod
+    def from_dict(data):
+        date_time = data['date_time']
+        try:
+            date_time = datetime.fromisoformat(date_time)
+        except (TypeError, ValueError):
+            pass
+        return EventHeader(data['id'], data['name'], date_time, data['location'],
+                           data['num_rows'], data['num_seats_per_row'])
+
+
+class EventStorage:
+    """Stores a workspace of events as JSON files in a directory.
+
+    `index.json` holds the ordered list of event headers and each event is
+    saved in `events/<event_id>.json`, or in the binary snapshot format
+    (`events/<event_id>.evsnap`, see backend.snapshot) when `snapshots` is
+    set, or in the SQLite database `events.db` (see backend.sqlite_repository)
+    when `sqlite` is set. Events are read back from whichever of these holds
+    them, and writing an event removes its other copies. Only events whose
+    revision changed since they were loaded or last saved are rewritten,
+    and they are written by a single background thread. In the database
+    only the seat and guest rows that changed since the last save are
+    written.
+    """
+
+    INDEX_FILE = "index.json"
+    EVENTS_DIR = "events"
+    SNAPSHOT_EXTENSION = ".evsnap"
+    DATABASE_FILE = "events.db"
+
+    def __init__(self, directory, snapshots=False, sqlite=False):
+        self.directory = directory
+        self.snapshots = snapshots
+        self.sqlite = sqlite
+        self._database = None
+        self._database_lock = threading.Lock()
+        self._saved_revisions = {}
+        # event_id -> (event_row, seats, guests) as last sent to the database
+        self._stored_rows = {}
+        # Events whose last database write failed (storage thread only)
+        self._failed_writes = set()
+        self._saved_index = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="event-storage")
+        os.makedirs(os.path.join(directory, self.EVENTS_DIR), exist_ok=True)
+
+    @staticmethod
+    def default_directory():
+        """Workspace directory, overridable with the EVENT_PLANNER_DATA environment variable"""
+        return os.environ.get("EVENT_PLANNER_DATA") or os.path.join(os.path.expanduser("~"), ".event_planner")
+
+    @staticmethod
+    def default_snapshots():
+        """Save events as binary snapshots if EVENT_PLANNER_SNAPSHOTS=1"""
+        return os.environ.get("EVENT_PLANNER_SNAPSHOTS") == "1"
+
+    @staticmethod
+    def default_sqlite():
+        """Save events in an SQLite database if EVENT_PLANNER_SQLITE=1"""
+        return os.environ.get("EVENT_PLANNER_SQLITE") == "1"
+
+    def _database_path(self):
+        return os.path.join(self.directory, self.DATABASE_FILE)
+
+    def _open_database(self):
+        """The workspace database, opened on first use; None if it is not used and does not exist"""
+        if self._database is None and (self.sqlite or os.path.exists(self._database_path())):
+            # Shared by the GUI, storage and worker threads; every use holds _database_lock
+            self._database = SQLiteEventStore(self._database_path(), check_same_thread=False)
+        return self._database
+
+    def _load_from_database(self, event_id, keep_rows=False):
+        """Read an event from the database, or return None if it is not there.
+
+        With keep_rows, its rows are remembered so the next save only writes
+        what changed.
+        """
+        with self._database_lock:
+            database = self._open_database()
+            stored = database.open_event(event_id) if database else None
+            if stored is None:
+                return None
+            if keep_rows:
+                self._stored_rows[event_id] = database.load_event_rows(event_id)
+            return stored.to_event()
+
+    def _event_path(self, event_id):
+        return os.path.join(self.directory, self.EVENTS_DIR, f"{event_id}.json")
+
+    def _snapshot_path(self, event_id):
+        return os.path.join(self.directory, self.EVENTS_DIR, event_id + self.SNAPSHOT_EXTENSION)
+
+    def open_snapshot(self, event_id):
+        """Memory-map the snapshot of a stored event, or return None if it is stored as JSON"""
+        try:
+            return EventSnapshot(self._snapshot_path(event_id))
+        except FileNotFoundError:
+            return None
+
+    @traced(category="storage")
+    def load_headers(self):
+        """Return the headers of all stored events, in workspace order"""
+        try:
+            with open(os.path.join(self.directory, self.INDEX_FILE), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return []
+        headers = [EventHeader.from_dict(h) for h in data.get('events', [])]
+        self._saved_index = [h.to_dict() for h in headers]
+        return headers
+
+    @traced(category="storage")
+    def load_event_data(self, event_id):
+        """Read a stored event as a dict (safe from any thread)"""
+        if self.sqlite:
+            event = self._load_from_database(event_id)
+            if event is not None:
+                return event.to_dict()
+        snapshot = self.open_snapshot(event_id)
+        if snapshot is not None:
+            with snapshot:
+                return snapshot.to_dict()
+        try:
+            with open(self._event_path(event_id), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            event = None if self.sqlite else self._load_from_database(event_id)
+            if event is None:
+                raise
+            return event.to_dict()
+
+    def load_event(self, event_id):
+        """Read a full event from disk"""
+        event = self._load_from_database(event_id, keep_rows=True) if self.sqlite else None
+        if event is None:
+            snapshot = self.open_snapshot(event_id)
+            if snapshot is not None:
+                with snapshot:
+                    event = snapshot.to_event()
+            else:
+                event = Event.from_dict(self.load_event_data(event_id))
+        self._saved_revisions[event.event_id] = event.revision
+        return event
+
+    def is_dirty(self, event):
+        """Return True if a loaded event changed since it was last read or written"""
+        return self._saved_revisions.get(event.event_id) != event.revision
+
+    @traced(category="storage")
+    def save(self, events, wait=True):
+        """Write the modified events and the index.
+
+        `events` may mix Event objects and EventHeaders of events that were
+        never loaded. Events are serialised on the calling thread and written
+        by the storage thread; with wait=False the futures are returned
+        without blocking.
+        """
+        futures = []
+        for event in events:
+            if isinstance(event, Event) and self.is_dirty(event):
+                self._saved_revisions[event.event_id] = event.revision
+                if self.sqlite:
+                    stored = self._stored_rows.get(event.event_id)
+                    rows = event_rows(event, stored[2] if stored else None)
+                    self._stored_rows[event.event_id] = rows
+                    futures.append(self._executor.submit(self._write_database, rows, stored))
+                elif self.snapshots:
+                    futures.append(self._executor.submit(
+                        self._write_snapshot, event.event_id, encode_event(event)))
+                else:
+                    futures.append(self._executor.submit(
+                        self._write_json, self._event_path(event.event_id), event.to_dict(), event.event_id))
+
+        index = [
+            (EventHeader.from_event(e) if isinstance(e, Event) else e).to_dict()
+            for e in events
+        ]
+        if index != self._saved_index:
+            self._saved_index = index
+            futures.append(self._executor.submit(
+                self._write_json, os.path.join(self.directory, self.INDEX_FILE), {'version': 1, 'events': index}))
+
+        if wait:
+            for future in futures:
+                future.result()
+        return futures
+
+    def delete_event(self, event_id):
+        self._saved_revisions.pop(event_id, None)
+        self._stored_rows.pop(event_id, None)
+        self._executor.submit(self._remove_file, self._event_path(event_id))
+        self._executor.submit(self._remove_file, self._snapshot_path(event_id))
+        self._executor.submit(self._delete_from_database, event_id)
+
+    def close(self):
+        """Wait for pending writes and stop the storage thread"""
+        self._executor.shutdown(wait=True)
+        with self._database_lock:
+            if self._database is not None:
+                self._database.close()
+                self._database = None
+
+    @traced(category="storage")
+    def _write_json(self, path, data, event_id=None):
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            if event_id is not None:
+                # Keep the event dirty so the next save retries it
+                self._saved_revisions.pop(event_id, None)
+            raise
+        if event_id is not None:
+            # A snapshot from an earlier save would be read instead of this file
+            self._remove_file(self._snapshot_path(event_id))
+            self._delete_from_database(event_id)
+
+    @traced(category="storage")
+    def _write_snapshot(self, event_id, data):
+        path = self._snapshot_path(event_id)
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            self._saved_revisions.pop(event_id, None)
+            raise
+        self._remove_file(self._event_path(event_id))
+        self._delete_from_database(event_id)
+
+    @traced(category="storage")
+    def _write_database(self, rows, stored):
+        event_id = rows[0][0]
+        if event_id in self._failed_writes:
+            stored = None  # the database does not hold `stored`, rewrite the whole event
+        try:
+            with self._database_lock:
+                self._open_database().save_event_rows(*rows, stored=stored)
+        except sqlite3.Error:
+            # Keep the event dirty so the next save retries it
+            self._saved_revisions.pop(event_id, None)
+            self._failed_writes.add(event_id)
+            raise
+        self._failed_writes.discard(event_id)
+        self._remove_file(self._event_path(event_id))
+        self._remove_file(self._snapshot_path(event_id))
+
+    def _delete_from_database(self, event_id):
+        with self._database_lock:
+            database = self._open_database()
+            if database is not None:
+                database.delete_event(event_id)
+
+    @staticmethod
+    def _remove_file(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
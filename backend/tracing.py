@@ -0,0 +1,141 @@
+"""Timing spans for finding slow paths, exported as Chrome trace-event JSON.
+
+Tracing is off by default; `span()` and `@traced` then only check a flag.
+Enable it with the EVENT_PLANNER_TRACE=<file> environment variable or
+`main.py --trace <file>` and open the written file in chrome://tracing or
+https://ui.perfetto.dev.
+"""
+import functools
+import json
+import os
+import threading
+import time
+
+TRACE_ENV_VAR = "EVENT_PLANNER_TRACE"
+
+_enabled = False
+# (name, category, start_ns, duration_ns or None for instants, thread id, args)
+_events = []
+_origin_ns = time.perf_counter_ns()
+
+
+class _Span:
+    __slots__ = ('name', 'category', 'args', 'start')
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        _events.append((self.name, self.category, self.start, time.perf_counter_ns() - self.start,
+                        threading.get_ident(), self.args))
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def is_enabled():
+    return _enabled
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def clear():
+    """Drop the recorded events"""
+    _events.clear()
+
+
+def enable_from_environment():
+    """Enable tracing if EVENT_PLANNER_TRACE is set; returns the trace file path or None"""
+    path = os.environ.get(TRACE_ENV_VAR)
+    if path:
+        enable()
+    return path or None
+
+
+def span(name, category="app", **args):
+    """Context manager timing the enclosed block"""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, category, args or None)
+
+
+def instant(name, category="app", **args):
+    """Record a point-in-time event"""
+    if _enabled:
+        _events.append((name, category, time.perf_counter_ns(), None, threading.get_ident(), args or None))
+
+
+def traced(name=None, category="app"):
+    """Decorator timing every call of a function (named after its qualified name by default)"""
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _events.append((label, category, start, time.perf_counter_ns() - start,
+                                threading.get_ident(), None))
+        return wrapper
+    return decorate
+
+
+def chrome_trace():
+    """Return the recorded events in the Chrome trace-event format"""
+    pid = os.getpid()
+    thread_ids = {}
+    trace_events = []
+    for name, category, start, duration, ident, args in list(_events):
+        tid = thread_ids.setdefault(ident, len(thread_ids) + 1)
+        entry = {"name": name, "cat": category, "pid": pid, "tid": tid, "ts": (start - _origin_ns) / 1000}
+        if duration is None:
+            entry.update(ph="i", s="t")
+        else:
+            entry.update(ph="X", dur=duration / 1000)
+        if args:
+            entry["args"] = {key: str(value) for key, value in args.items()}
+        trace_events.append(entry)
+
+    thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+    for ident, tid in thread_ids.items():
+        trace_events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                             "args": {"name": thread_names.get(ident, f"thread-{tid}")}})
+    return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+
+def write_chrome_trace(path):
+    """Write the recorded events to a Chrome trace JSON file; returns the number of events"""
+    data = chrome_trace()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    return len(data["traceEvents"])
@@ -0,0 +1,49 @@
+"""Memory used per seat and per guest at several venue sizes.
+
+Run from the repository root:
+    python -m benchmarks.bench_memory
+"""
+import gc
+import tracemalloc
+from datetime import datetime
+
+from backend.event import Event
+from backend.guest import Guest
+
+HALL_SIZES = [10, 100, 316, 1000]
+GUEST_COUNTS = [1_000, 100_000]
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, after - before
+
+
+def main():
+    print(f"{'hall':>11} {'seats':>9} {'MiB':>8} {'bytes/seat':>11}")
+    for size in HALL_SIZES:
+        _, used = measure(lambda: Event("Bench", datetime(2025, 1, 1), "Hall", size, size))
+        seats = size * size
+        print(f"{size:>5}x{size:<5} {seats:>9} {used / 2**20:>8.1f} {used / seats:>11.1f}")
+
+    print()
+    print(f"{'guests':>9} {'MiB':>8} {'bytes/guest':>12}")
+    for count in GUEST_COUNTS:
+        event = Event("Bench", datetime(2025, 1, 1), "Hall", 1, 1)
+
+        def add_guests():
+            event.add_guests(Guest(f"Last{i}", f"First{i}", f"guest{i}@mail.ro", f"07{i:08d}")
+                             for i in range(count))
+            return event
+
+        _, used = measure(add_guests)
+        print(f"{count:>9} {used / 2**20:>8.1f} {used / count:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Microbenchmark for Event.get_seat lookup cost across hall sizes.
+
+Run from the repository root:
+    python -m benchmarks.bench_seat_lookup
+"""
+import random
+import timeit
+from datetime import datetime
+
+from backend.event import Event
+
+SIZES = [10, 100, 300, 1000]
+LOOKUPS = 100_000
+
+
+def bench_size(size):
+    event = Event("Bench", datetime(2025, 1, 1), "Hall", size, size)
+    rng = random.Random(size)
+    positions = [(rng.randint(1, size), rng.randint(1, size)) for _ in range(LOOKUPS)]
+    get_seat = event.get_seat
+
+    def run():
+        for row, number in positions:
+            get_seat(row, number)
+
+    best = min(timeit.repeat(run, number=1, repeat=5))
+    return best / LOOKUPS * 1e9
+
+
+def main():
+    print(f"{'hall':>11} {'seats':>9} {'ns/lookup':>10}")
+    for size in SIZES:
+        ns = bench_size(size)
+        print(f"{size:>5}x{size:<5} {size * size:>9} {ns:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
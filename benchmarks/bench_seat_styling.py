@@ -0,0 +1,76 @@
+"""Benchmark of SeatWidget state changes: per-widget setStyleSheet vs. the
+cached per-status brushes and palettes used by SeatWidget.set_status().
+
+Runs offscreen. From the repository root:
+    python -m benchmarks.bench_seat_styling
+"""
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QWidget, QGridLayout
+
+from backend.seat import Seat, AVAILABLE, OCCUPIED
+from ui.seat_widget import SeatWidget
+
+TOGGLES = 10_000
+WIDGETS = 1_000
+QSS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "ui", "resources.qss")
+
+# The stylesheets SeatWidget.update_appearance() used to set on every change
+LEGACY_STYLES = {
+    AVAILABLE: """
+        QFrame { background-color: #E0E0E0; border: 2px solid #9E9E9E; border-radius: 5px; }
+        QLabel { color: #333; }
+    """,
+    OCCUPIED: """
+        QFrame { background-color: #4CAF50; border: 2px solid #2E7D32; border-radius: 5px; }
+        QLabel { color: white; }
+    """,
+}
+
+
+def make_widgets():
+    container = QWidget()
+    with open(QSS_PATH) as f:
+        container.setStyleSheet(f.read())
+    layout = QGridLayout(container)
+    widgets = []
+    for i in range(WIDGETS):
+        widget = SeatWidget(Seat(i // 40 + 1, i % 40 + 1))
+        layout.addWidget(widget, i // 40, i % 40)
+        widgets.append(widget)
+    container.show()
+    QApplication.processEvents()
+    return container, widgets
+
+
+def toggle(widgets, apply):
+    states = (OCCUPIED, AVAILABLE)
+    start = time.perf_counter()
+    for i in range(TOGGLES):
+        apply(widgets[i % WIDGETS], states[(i // WIDGETS) % 2])
+    QApplication.processEvents()
+    return time.perf_counter() - start
+
+
+def main():
+    app = QApplication.instance() or QApplication([])
+
+    container, widgets = make_widgets()
+    before = toggle(widgets, lambda w, state: w.setStyleSheet(LEGACY_STYLES[state]))
+    container.close()
+
+    container, widgets = make_widgets()
+    after = toggle(widgets, lambda w, state: w.set_status(state))
+    container.close()
+
+    print(f"{TOGGLES} seat state toggles over {WIDGETS} widgets")
+    print(f"  setStyleSheet per change: {before * 1000:9.1f} ms")
+    print(f"  cached status styles:     {after * 1000:9.1f} ms")
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
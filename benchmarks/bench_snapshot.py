@@ -0,0 +1,77 @@
+"""File size and load time of the JSON format against binary snapshots.
+
+For each hall size (half the seats occupied, plus as many unassigned
+guests) it measures writing, the full load to an Event, and reading only
+the occupancy counts, which the snapshot does from the mapped state array.
+
+Run from the repository root:
+    python -m benchmarks.bench_snapshot
+    python -m benchmarks.bench_snapshot --sizes 100 316
+"""
+import argparse
+import json
+import os
+import tempfile
+
+from backend.event import Event
+from backend.snapshot import EventSnapshot, encode_event
+from benchmarks.run_backend import make_guests, measure, seated_event
+
+HALL_SIZES = [10, 100, 316]
+
+
+def json_load(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return Event.from_dict(json.load(f))
+
+
+def json_counts(path):
+    # The JSON format has no shortcut: the whole file is parsed
+    event = json_load(path)
+    return event.get_occupied_seats_count(), event.get_available_seats_count()
+
+
+def snapshot_load(path):
+    with EventSnapshot(path) as snapshot:
+        return snapshot.to_event()
+
+
+def snapshot_counts(path):
+    with EventSnapshot(path) as snapshot:
+        return snapshot.get_state_counts()
+
+
+def write_json(event, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(event.to_dict(), f, ensure_ascii=False)
+
+
+def write_snapshot(event, path):
+    with open(path, "wb") as f:
+        f.write(encode_event(event))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=HALL_SIZES, help="hall sizes (rows = seats per row)")
+    args = parser.parse_args(argv)
+
+    directory = tempfile.mkdtemp()
+    print(f"{'hall':>9} {'format':<9} {'KiB':>9} {'write ms':>9} {'load ms':>9} {'counts ms':>10}")
+    for size in args.sizes:
+        event = seated_event(size, 0.5)
+        event.add_guests(make_guests(size * size // 2))
+        for fmt, write, load, counts in (("json", write_json, json_load, json_counts),
+                                         ("snapshot", write_snapshot, snapshot_load, snapshot_counts)):
+            path = os.path.join(directory, f"{size}.{fmt}")
+            write_time = min(measure(lambda _: write(event, path)))
+            load_time = min(measure(lambda _: load(path)))
+            counts_time = min(measure(lambda _: counts(path)))
+            print(f"{size:>4}x{size:<4} {fmt:<9} {os.path.getsize(path) / 1024:>9.1f} {write_time * 1000:>9.2f} "
+                  f"{load_time * 1000:>9.2f} {counts_time * 1000:>10.3f}", flush=True)
+            os.remove(path)
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""Benchmark suite for the backend Event/Seat/Guest operations.
+
+Runs headless (no Qt) and writes the results as JSON so runs can be
+compared over time. From the repository root:
+
+    python -m benchmarks.run_backend                      # full run
+    python -m benchmarks.run_backend --quick              # small sizes only
+    python -m benchmarks.run_backend -o results.json
+    python -m benchmarks.run_backend --compare old.json   # print ratios against an earlier run
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from backend.event import Event
+from backend.guest import Guest
+
+HALL_SIZES = [10, 100, 316, 1000]
+GUEST_COUNTS = [1_000, 100_000, 1_000_000]
+QUICK_HALL_SIZES = [10, 100]
+QUICK_GUEST_COUNTS = [1_000, 10_000]
+LOOKUPS = 100_000
+
+
+def make_event(size):
+    return Event("Bench", datetime(2025, 1, 1, 18, 0), "Hall", size, size)
+
+
+def make_guests(count):
+    return [Guest(f"Last{i}", f"First{i}", f"guest{i}@mail.ro", f"07{i:08d}") for i in range(count)]
+
+
+def seated_event(size, fill=0.5):
+    """Event with the first `fill` share of its seats occupied"""
+    event = make_event(size)
+    guests = make_guests(int(size * size * fill))
+    event.add_guests(guests)
+    event.assign_guests(zip(guests, event.seats))
+    return event
+
+
+def measure(run, setup=None, repeat=3):
+    """Return the timings of `repeat` runs; setup() runs untimed before each and its result is passed to run"""
+    timings = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        gc.collect()
+        start = time.perf_counter()
+        run(state)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def bench_construct(size):
+    return measure(lambda _: make_event(size)), 1
+
+
+def bench_initialize_seats(size):
+    return measure(lambda event: event._initialize_seats(), setup=lambda: make_event(size)), size * size
+
+
+def bench_get_seat(size):
+    event = make_event(size)
+    rng = random.Random(size)
+    positions = [(rng.randint(1, size), rng.randint(1, size)) for _ in range(LOOKUPS)]
+    get_seat = event.get_seat
+
+    def run(_):
+        for row, number in positions:
+            get_seat(row, number)
+    return measure(run), LOOKUPS
+
+
+def bench_occupancy_counts(size):
+    event = seated_event(size, 0.1)
+
+    def run(_):
+        for _ in range(LOOKUPS):
+            event.get_occupied_seats_count()
+            event.get_available_seats_count()
+    return measure(run), LOOKUPS
+
+
+def bench_to_dict(size):
+    event = seated_event(size, 0.1)
+    return measure(lambda _: event.to_dict()), size * size
+
+
+def bench_from_dict(size):
+    data = seated_event(size, 0.1).to_dict()
+    return measure(lambda _: Event.from_dict(data)), size * size
+
+
+def bench_assign_release(size):
+    count = size * size
+
+    def setup():
+        event = make_event(size)
+        guests = make_guests(count)
+        event.add_guests(guests)
+        return event, guests
+
+    def run(state):
+        event, guests = state
+        for guest, seat in zip(guests, event.seats):
+            seat.assign_guest(guest)
+        for seat in event.seats:
+            seat.release()
+    return measure(run, setup), 2 * count
+
+
+def bench_move_guest(size):
+    half = size * size // 2
+
+    def run(event):
+        # Move every guest from the occupied first half to the free second half
+        for source, target in zip(event.seats[:half], event.seats[half:]):
+            event.move_guest(source.guest, target)
+    return measure(run, setup=lambda: seated_event(size, 0.5)), half
+
+
+def bench_add_guest(count):
+    def setup():
+        return make_event(10), make_guests(count)
+
+    def run(state):
+        event, guests = state
+        for guest in guests:
+            event.add_guest(guest)
+    return measure(run, setup), count
+
+
+def bench_add_guests_batch(count):
+    return measure(lambda state: state[0].add_guests(state[1]),
+                   setup=lambda: (make_event(10), make_guests(count))), count
+
+
+def bench_create_guests(count):
+    return measure(lambda _: make_guests(count)), count
+
+
+HALL_BENCHMARKS = [
+    ("event_construct", bench_construct),
+    ("initialize_seats", bench_initialize_seats),
+    ("get_seat", bench_get_seat),
+    ("occupancy_counts", bench_occupancy_counts),
+    ("to_dict", bench_to_dict),
+    ("from_dict", bench_from_dict),
+    ("assign_release", bench_assign_release),
+    ("move_guest", bench_move_guest),
+]
+
+GUEST_BENCHMARKS = [
+    ("create_guests", bench_create_guests),
+    ("add_guest", bench_add_guest),
+    ("add_guests_batch", bench_add_guests_batch),
+]
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(hall_sizes, guest_counts, only=None):
+    results = []
+    cases = [(name, fn, "hall", f"{size}x{size}", size) for size in hall_sizes for name, fn in HALL_BENCHMARKS]
+    cases += [(name, fn, "guests", str(count), count) for count in guest_counts for name, fn in GUEST_BENCHMARKS]
+    for name, fn, param_name, label, value in cases:
+        if only and name not in only:
+            continue
+        timings, ops = fn(value)
+        best = min(timings)
+        result = {
+            "benchmark": name,
+            param_name: label,
+            "ops": ops,
+            "seconds_min": best,
+            "seconds_median": statistics.median(timings),
+            "ns_per_op": best / ops * 1e9,
+        }
+        results.append(result)
+        print(f"{name:<18} {param_name}={label:<10} {best * 1000:>10.2f} ms {result['ns_per_op']:>12.1f} ns/op",
+              flush=True)
+    return results
+
+
+def compare(results, previous_path):
+    with open(previous_path, encoding="utf-8") as f:
+        previous = json.load(f)
+
+    def key(r):
+        return r["benchmark"], r.get("hall"), r.get("guests")
+    old = {key(r): r for r in previous["results"]}
+    print(f"\nCompared with {previous_path} ({previous.get('commit')}):")
+    for result in results:
+        before = old.get(key(result))
+        if before:
+            ratio = result["seconds_min"] / before["seconds_min"]
+            params = result.get("hall") or result.get("guests")
+            print(f"{result['benchmark']:<18} {params:<10} {ratio:>6.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="only small halls and guest lists")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="run only these benchmarks")
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", metavar="JSON", help="print time ratios against an earlier results file")
+    args = parser.parse_args(argv)
+
+    hall_sizes = QUICK_HALL_SIZES if args.quick else HALL_SIZES
+    guest_counts = QUICK_GUEST_COUNTS if args.quick else GUEST_COUNTS
+    results = run_suite(hall_sizes, guest_counts, args.only)
+
+    report = {
+        "suite": "backend",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
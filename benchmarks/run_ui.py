@@ -0,0 +1,260 @@
+"""Headless benchmarks for MainWindow and the seating map widgets.
+
+Drives MainWindow programmatically on the offscreen Qt platform (no
+display needed) and records wall time, live widget count, and the RSS
+change and peak RSS of each scenario. The per-scenario peak needs Linux,
+where it is reset through /proc/self/clear_refs before every scenario;
+elsewhere it is not recorded. From the repository root:
+
+    python -m benchmarks.run_ui                       # full run
+    python -m benchmarks.run_ui --quick
+    python -m benchmarks.run_ui -o ui.json --compare old_ui.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from app.main_window import MainWindow
+from backend.event import Event
+from backend.guest import Guest
+from backend.storage import EventStorage
+from benchmarks.run_backend import compare, git_commit
+
+HALL_SIZES = [10, 30, 50]
+GUEST_COUNTS = [10_000, 100_000]
+CANVAS_SIZE = 200
+QUICK_HALL_SIZES = [10, 30]
+QUICK_GUEST_COUNTS = [10_000]
+
+
+def rss_kib():
+    """Current resident set size in KiB (Linux), or None"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def reset_peak_rss():
+    """Restart the peak RSS (VmHWM) from the current RSS; returns False where that is not possible"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_kib():
+    """Peak resident set size in KiB since the last reset_peak_rss (Linux), or None"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def make_event(size, guests=0, seated=0):
+    event = Event(f"Hall {size}x{size}", datetime(2025, 1, 1, 18, 0), "Bench", size, size)
+    event.add_guests(Guest(f"Last{i}", f"First{i}", f"guest{i}@mail.ro") for i in range(guests + seated))
+    if seated:
+        event.assign_guests(zip(event.unassigned_guests[:seated], event.seats))
+    return event
+
+
+class UiBench:
+    def __init__(self, app):
+        self.app = app
+        self.storage = EventStorage(tempfile.mkdtemp(prefix="event-planner-bench-"))
+        self.window = MainWindow(self.storage)
+        self.window.show()
+        self.window.load_workspace()
+        self.window.autosave_timer.stop()
+        self.settle()
+        self.results = []
+
+    def settle(self):
+        """Flush pending refreshes and let Qt lay out and paint"""
+        self.window.refresh_scheduler.flush()
+        self.app.processEvents()
+
+    def show_events(self, *events):
+        self.window.current_event = None
+        self.window.events = list(events)
+        self.window.update_events_list()
+        self.settle()
+
+    def select(self, index):
+        self.window.select_event(self.window.events_list.item(index))
+        self.settle()
+
+    def record(self, name, param_name, label, run, ops=1):
+        rss_before = rss_kib()
+        peak_reset = reset_peak_rss()
+        start = time.perf_counter()
+        run()
+        self.settle()
+        elapsed = time.perf_counter() - start
+        rss_after = rss_kib()
+        result = {
+            "benchmark": name,
+            param_name: label,
+            "ops": ops,
+            "seconds_min": elapsed,
+            "ms_per_op": elapsed / ops * 1000,
+            "widgets": len(QApplication.allWidgets()),
+            "rss_kib": rss_after,
+            "rss_delta_kib": rss_after - rss_before if rss_after is not None and rss_before is not None else None,
+            # Peak while this scenario ran, not the process-wide ru_maxrss
+            "peak_rss_kib": peak_rss_kib() if peak_reset else None,
+        }
+        self.results.append(result)
+        delta = result['rss_delta_kib']
+        print(f"{name:<24} {param_name}={label:<8} {elapsed * 1000:>10.2f} ms "
+              f"{result['widgets']:>7} widgets  RSS {'?' if delta is None else f'{delta:+}'} KiB, "
+              f"peak {result['peak_rss_kib'] or '?'} KiB", flush=True)
+
+    def seating_scenarios(self, size):
+        label = f"{size}x{size}"
+        first = make_event(size, guests=200, seated=size * size // 4)
+        second = make_event(size, seated=size * size // 2)
+        self.show_events(first, second)
+        window = self.window
+
+        self.record("select_event", "hall", label, lambda: self.select(0))
+        self.record("switch_event_pooled", "hall", label, lambda: self.select(1))
+        self.select(0)
+        self.record("refresh_unchanged", "hall", label, window.update_seating_map)
+
+        free_seats = [seat for seat in first.seats if seat.is_available()][:200]
+
+        def assign():
+            for seat in free_seats:
+                guest = window.guest_model.take_guest(0)
+                seat.assign_guest(guest)
+                window.refresh_scheduler.mark_items_dirty("seating", [seat])
+                window.refresh_scheduler.mark_dirty("info")
+                self.settle()
+        self.record("assign_seat", "hall", label, assign, len(free_seats))
+
+        def release():
+            for seat in free_seats:
+                guest = seat.guest
+                seat.release()
+                window.guest_model.append_guest(guest)
+                window.refresh_scheduler.mark_items_dirty("seating", [seat])
+                window.refresh_scheduler.mark_dirty("info")
+                self.settle()
+        self.record("release_seat", "hall", label, release, len(free_seats))
+
+        seated = [seat.guest for seat in first.seats if seat.guest][:100]
+        targets = [seat for seat in first.seats if seat.is_available()][:len(seated)]
+
+        def move():
+            # Dropping a seated guest on a free seat, as the seat canvas does
+            for guest, target in zip(seated, targets):
+                window.drop_guests([guest.guest_id], target)
+                self.settle()
+        self.record("move_guest", "hall", label, move, len(seated))
+
+        def batch():
+            for seat in targets:
+                guest = window.guest_model.take_guest(0)
+                seat.assign_guest(guest)
+                window.refresh_scheduler.mark_items_dirty("seating", [seat])
+                window.refresh_scheduler.mark_dirty("info")
+            self.settle()
+        self.record("batch_assign_coalesced", "hall", label, batch, len(targets))
+
+    def guest_list_scenarios(self, count):
+        event = make_event(10, guests=count)
+        self.show_events(event)
+        window = self.window
+        self.record("guest_list_select", "guests", str(count), lambda: self.select(0))
+        self.record("guest_list_refresh", "guests", str(count), window.update_unassigned_guests_list)
+
+        def add_remove():
+            for i in range(100):
+                window.guest_model.append_guest(Guest(f"New{i}", "Guest"))
+                window.refresh_scheduler.mark_dirty("info")
+                self.settle()
+            for _ in range(100):
+                guest = window.guest_model.take_guest(len(event.unassigned_guests) - 1)
+                event.remove_guest(guest)
+                window.refresh_scheduler.mark_dirty("info")
+                self.settle()
+        self.record("guest_add_remove", "guests", str(count), add_remove, 200)
+
+    def canvas_scenarios(self, size):
+        label = f"{size}x{size}"
+        window = self.window
+        self.show_events(make_event(size, seated=size * size // 3))
+        window.seat_view_combo.setCurrentIndex(1)
+        self.settle()
+        self.record("canvas_select_event", "hall", label, lambda: self.select(0))
+
+        scroll = window.canvas_scroll.verticalScrollBar()
+
+        def scroll_through():
+            for value in range(0, scroll.maximum(), max(scroll.maximum() // 100, 1)):
+                scroll.setValue(value)
+                self.app.processEvents()
+        self.record("canvas_scroll_100_steps", "hall", label, scroll_through, 100)
+
+        def zoom_through_levels():
+            # Labels, dots and row bars, out and back in
+            for zoom in (1.0, 0.7, 0.5, 0.3, 0.15, 0.1, 0.05, 0.02, 0.05, 0.1, 0.15, 0.3, 0.5, 0.7, 1.0):
+                window.set_canvas_zoom(zoom)
+                self.app.processEvents()
+        self.record("canvas_zoom_15_steps", "hall", label, zoom_through_levels, 15)
+        window.seat_view_combo.setCurrentIndex(0)
+        self.show_events()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="only small halls and guest lists")
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", metavar="JSON", help="print time ratios against an earlier results file")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    bench = UiBench(app)
+    for size in QUICK_HALL_SIZES if args.quick else HALL_SIZES:
+        bench.seating_scenarios(size)
+    for count in QUICK_GUEST_COUNTS if args.quick else GUEST_COUNTS:
+        bench.guest_list_scenarios(count)
+    bench.canvas_scenarios(CANVAS_SIZE)
+
+    report = {
+        "suite": "ui",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "qt_platform": os.environ.get("QT_QPA_PLATFORM"),
+        "results": bench.results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        compare(bench.results, args.compare)
+    bench.window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,41 @@
 import sys
+import time
+
+STARTED = time.perf_counter()
+
+# Profilerul de importuri trebuie instalat inaintea importurilor de mai jos
+if "--startup-profile" in sys.argv:
+    from app.startup_profile import ImportProfiler
+    IMPORT_PROFILER = ImportProfiler().install()
+else:
+    IMPORT_PROFILER = None
+
+import argparse
 import traceback
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtGui import QPalette, QColor
 from PySide6.QtCore import qInstallMessageHandler, QtMsgType
 from app.main_window import MainWindow
+from backend import tracing
 
 def qt_message_handler(mode, context, message):
-    """Handler pentru mesajele Qt"""
+    """Handler pentru mesajele Qt: debug/info ajung doar in trace, avertismentele la stderr"""
+    tracing.instant(message, "qt")
     if mode == QtMsgType.QtCriticalMsg or mode == QtMsgType.QtFatalMsg:
-        print(f"Qt Critical/Fatal: {message}")
-        print(f"File: {context.file}, Line: {context.line}")
-    else:
-        print(f"Qt: {message}")
+        print(f"Qt Critical/Fatal: {message}", file=sys.stderr)
+        print(f"File: {context.file}, Line: {context.line}", file=sys.stderr)
+    elif mode == QtMsgType.QtWarningMsg:
+        print(f"Qt: {message}", file=sys.stderr)
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Event Planner")
+    parser.add_argument("--trace", metavar="FILE",
+                        help=f"record timing spans and write them as Chrome trace JSON on exit "
+                             f"(or set {tracing.TRACE_ENV_VAR}=FILE)")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print the time to the first frame and the cost of each module import")
+    # Restul argumentelor raman pentru Qt
+    return parser.parse_known_args(argv[1:])
 
 def exception_hook(exctype, value, tb):
     """Handler global pentru exceptii"""
@@ -27,7 +51,19 @@ def main():
     sys.excepthook = exception_hook
     qInstallMessageHandler(qt_message_handler)
 
-    app = QApplication(sys.argv)
+    args, qt_args = parse_args(sys.argv)
+    trace_path = args.trace or tracing.enable_from_environment()
+    if trace_path:
+        tracing.enable()
+
+    profile = None
+    if args.startup_profile:
+        from app.startup_profile import StartupProfile
+        IMPORT_PROFILER.uninstall()
+        profile = StartupProfile(STARTED, IMPORT_PROFILER)
+        profile.mark("imports done")
+
+    app = QApplication(sys.argv[:1] + qt_args)
     app.setStyle('Fusion')
 
     palette = QPalette()
@@ -44,11 +80,22 @@ def main():
     palette.setColor(QPalette.Highlight, QColor(33, 150, 243))
     palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
     app.setPalette(palette)
+    if profile:
+        profile.mark("QApplication ready")
 
-    fereastra = MainWindow()
+    with tracing.span("MainWindow.__init__", "startup"):
+        fereastra = MainWindow()
+    if profile:
+        profile.mark("main window created")
+        fereastra.first_frame_painted.connect(lambda: profile.mark("first frame painted"))
+        fereastra.workspace_loaded.connect(lambda: (profile.mark("workspace loaded"), profile.report()))
     fereastra.show()
-    
-    sys.exit(app.exec())
+
+    exit_code = app.exec()
+    if trace_path:
+        count = tracing.write_chrome_trace(trace_path)
+        print(f"Trace with {count} events written to {trace_path}", file=sys.stderr)
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
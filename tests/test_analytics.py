@@ -0,0 +1,24 @@
+from datetime import datetime
+
+import pytest
+
+from backend.event import Event
+from backend.guest import Guest
+
+np = pytest.importorskip("numpy")
+from backend.analytics import (AVAILABLE_CODE, OCCUPIED_CODE, RESERVED_CODE,  # noqa: E402
+                               seat_state_matrix, seat_state_matrix_from_dict)
+
+
+def test_seat_state_matrix_places_seats_by_position():
+    event = Event("Test", datetime(2025, 1, 1, 18, 0), "Hall", 2, 3)
+    guest = Guest("Pop", "Ana")
+    event.add_guest(guest)
+    event.assign_seat(1, 2, guest)
+    event.set_reserved(2, 3)
+    expected = np.array([[AVAILABLE_CODE, OCCUPIED_CODE, AVAILABLE_CODE],
+                         [AVAILABLE_CODE, AVAILABLE_CODE, RESERVED_CODE]], dtype=np.uint8)
+
+    event.seats.reverse()
+    np.testing.assert_array_equal(seat_state_matrix(event), expected)
+    np.testing.assert_array_equal(seat_state_matrix_from_dict(event.to_dict()), expected)
@@ -0,0 +1,119 @@
+from datetime import datetime
+
+import pytest
+
+from backend.auto_seating import CENTER_OUT, FRONT_TO_BACK, auto_assign, plan_seating
+from backend.event import Event
+from backend.guest import Guest
+
+
+def make_event(rows, seats_per_row, guests=0, last_name="Guest"):
+    event = Event("Test", datetime(2025, 1, 1, 18, 0), "Hall", rows, seats_per_row)
+    event.add_guests(Guest(last_name, f"First{i}", guest_id=f"{last_name}{i}") for i in range(guests))
+    return event
+
+
+def positions(assignments):
+    return [(seat.row, seat.number) for _, seat in assignments]
+
+
+def by_last_name(guest):
+    return guest.last_name
+
+
+def test_front_to_back_fills_rows_left_to_right():
+    event = make_event(2, 3, guests=5)
+    assignments, unplaced = plan_seating(event, strategy=FRONT_TO_BACK)
+    assert positions(assignments) == [(1, 1), (1, 2), (1, 3), (2, 1), (2, 2)]
+    assert [guest for guest, _ in assignments] == event.unassigned_guests
+    assert unplaced == []
+
+
+def test_center_out_starts_in_the_middle_of_each_row():
+    event = make_event(2, 5, guests=7)
+    assignments, _ = plan_seating(event, strategy=CENTER_OUT)
+    assert positions(assignments) == [(1, 3), (1, 2), (1, 4), (1, 1), (1, 5), (2, 3), (2, 2)]
+
+    event = make_event(1, 4, guests=4)
+    assignments, _ = plan_seating(event, strategy=CENTER_OUT)
+    assert positions(assignments) == [(1, 2), (1, 3), (1, 1), (1, 4)]
+
+
+def test_reserved_and_occupied_seats_are_skipped():
+    event = make_event(1, 5, guests=3)
+    event.set_reserved(1, 1)
+    event.assign_seat(1, 2, Guest("Seated", "Already"))
+    assignments, unplaced = plan_seating(event)
+    assert positions(assignments) == [(1, 3), (1, 4), (1, 5)]
+    assert unplaced == []
+
+
+def test_guests_beyond_capacity_are_unplaced_and_stay_unassigned():
+    event = make_event(1, 3, guests=5)
+    event.set_reserved(1, 2)
+    guests = list(event.unassigned_guests)
+
+    assignments, unplaced = auto_assign(event)
+    assert positions(assignments) == [(1, 1), (1, 3)]
+    assert unplaced == guests[2:]
+    assert event.unassigned_guests == guests[2:]
+    assert event.get_seat(1, 1).guest is guests[0]
+    assert event.get_seat(1, 3).guest is guests[1]
+
+
+def test_plan_seating_does_not_change_the_event():
+    event = make_event(2, 2, guests=3)
+    before = event.to_dict()
+    plan_seating(event, strategy=CENTER_OUT, group_key=by_last_name)
+    assert event.to_dict() == before
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        plan_seating(make_event(1, 1), strategy="back_to_front")
+
+
+def test_party_sits_together_in_the_first_gap_large_enough():
+    event = make_event(2, 5)
+    event.set_reserved(1, 2)
+    party = [Guest("Pop", name) for name in ("Ana", "Ion", "Dan")]
+    single = Guest("Stan", "Maria")
+    event.add_guests([single] + party)
+
+    assignments, unplaced = plan_seating(event, group_key=by_last_name)
+    seats = {guest.get_full_name(): (seat.row, seat.number) for guest, seat in assignments}
+    # R1-S1 is too small a gap for the party, R1-S3..S5 fits it
+    assert [seats[guest.get_full_name()] for guest in party] == [(1, 3), (1, 4), (1, 5)]
+    assert seats[single.get_full_name()] == (1, 1)
+    assert unplaced == []
+
+
+def test_largest_parties_are_seated_first():
+    event = make_event(2, 4)
+    pairs = [Guest("Pop", name) for name in ("Ana", "Ion")]
+    quartet = [Guest("Stan", name) for name in ("Maria", "Dan", "Eva", "Radu")]
+    event.add_guests(pairs + quartet)
+
+    assignments, _ = plan_seating(event, group_key=by_last_name)
+    # Seated first, the quartet takes a whole row; in list order the pair would have split it
+    assert {seat.row for guest, seat in assignments if guest in quartet} == {1}
+    assert {seat.row for guest, seat in assignments if guest in pairs} == {2}
+
+
+def test_a_party_that_fits_nowhere_is_split():
+    event = make_event(2, 2)
+    party = [Guest("Pop", name) for name in ("Ana", "Ion", "Dan")]
+    event.add_guests(party)
+    assignments, unplaced = plan_seating(event, group_key=by_last_name)
+    assert positions(assignments) == [(1, 1), (1, 2), (2, 1)]
+    assert unplaced == []
+
+
+def test_center_out_party_packs_towards_the_middle():
+    event = make_event(1, 9)
+    event.set_reserved(1, 5)
+    party = [Guest("Pop", name) for name in ("Ana", "Ion")]
+    event.add_guests(party)
+    assignments, _ = plan_seating(event, strategy=CENTER_OUT, group_key=by_last_name)
+    # The gap left of the reserved middle seat is used from its right end
+    assert positions(assignments) == [(1, 3), (1, 4)]
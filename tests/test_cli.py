@@ -0,0 +1,57 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from backend import cli
+from backend.event import Event
+from backend.guest import Guest
+from backend.snapshot import write_snapshot
+
+
+def seated_event():
+    event = Event("Test", datetime(2025, 1, 1, 18, 0), "Hall", 2, 3)
+    guest = Guest("Pop", "Ana")
+    event.add_guest(guest)
+    event.assign_seat(1, 2, guest)
+    return event
+
+
+@pytest.mark.parametrize("field, value", [
+    ("seats", ["bad"]),
+    ("seats", "bad"),
+    ("unassigned_guests", [42]),
+])
+def test_validate_reports_entries_that_are_not_objects(field, value):
+    data = dict(seated_event().to_dict(), **{field: value})
+    assert cli.validate_event_data(data)
+
+
+def test_validate_reports_a_guest_that_is_not_an_object():
+    data = seated_event().to_dict()
+    data['seats'][1]['guest'] = ["Pop", "Ana"]
+    assert cli.validate_event_data(data) == ["R1-S2: guest is not an object"]
+
+
+def test_a_broken_file_does_not_stop_the_batch(tmp_path):
+    broken = tmp_path / "broken.json"
+    broken.write_text(json.dumps(dict(seated_event().to_dict(), seats=["bad"])), encoding="utf-8")
+    good = tmp_path / "good.json"
+    good.write_text(json.dumps(seated_event().to_dict()), encoding="utf-8")
+
+    results = list(cli.run("validate", cli.find_event_files([str(tmp_path)]), {}, jobs=1))
+    assert [(r['file'], r['ok']) for r in results] == [(str(broken), False), (str(good), True)]
+
+
+def test_snapshots_are_processed_like_json(tmp_path):
+    event = seated_event()
+    write_snapshot(event, str(tmp_path / "event.evsnap"))
+    files = cli.find_event_files([str(tmp_path)])
+    assert files == [str(tmp_path / "event.evsnap")]
+
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    [result] = cli.run("export", files, {'output_dir': str(out_dir)}, jobs=1)
+    assert result['ok'] and result['stats']['occupied'] == 1
+    with open(result['written'], encoding="utf-8") as f:
+        assert json.load(f) == event.to_dict()
@@ -0,0 +1,177 @@
+import random
+from datetime import datetime
+
+import pytest
+
+from backend.event import Event
+from backend.guest import Guest
+from backend.seat import AVAILABLE, OCCUPIED, RESERVED, Seat
+from backend.seating_transaction import SeatingConflict
+
+
+def make_event(rows=3, seats_per_row=4):
+    return Event("Test", datetime(2025, 1, 1, 18, 0), "Hall", rows, seats_per_row)
+
+
+def assert_consistent(event):
+    """seats, the grid and the counters must describe the same hall"""
+    grid = [event.get_row_seats(row) for row in range(1, event.num_rows + 1)]
+    assert event.seats == [seat for row_seats in grid for seat in row_seats]
+    assert [(s.row, s.number) for s in event.seats] == [
+        (row, number) for row in range(1, event.num_rows + 1) for number in range(1, event.num_seats_per_row + 1)]
+    assert all(seat.event is event for seat in event.seats)
+    for row in range(1, event.num_rows + 1):
+        states = [seat.get_state() for seat in event.get_row_seats(row)]
+        assert event.get_row_counts(row) == {state: states.count(state) for state in (AVAILABLE, OCCUPIED, RESERVED)}
+    states = [seat.get_state() for seat in event.seats]
+    assert event.get_available_seats_count() == states.count(AVAILABLE)
+    assert event.get_reserved_seats_count() == states.count(RESERVED)
+
+
+def test_from_dict_orders_seats_row_major():
+    event = make_event(2, 3)
+    guest = Guest("Pop", "Ana")
+    event.add_guest(guest)
+    event.assign_seat(1, 1, guest)
+    data = event.to_dict()
+    data['seats'].reverse()
+
+    loaded = Event.from_dict(data)
+    assert_consistent(loaded)
+    assert loaded.get_seat(1, 1).guest.guest_id == guest.guest_id
+    assert loaded.to_dict() == event.to_dict()
+
+
+def test_from_dict_fills_missing_seats():
+    data = make_event(2, 3).to_dict()
+    del data['seats'][4]
+    loaded = Event.from_dict(data)
+    assert_consistent(loaded)
+    assert loaded.get_available_seats_count() == 6
+
+
+@pytest.mark.parametrize("position", [(3, 1), (1, 4), (0, 1)])
+def test_from_dict_rejects_seats_outside_the_hall(position):
+    data = make_event(2, 3).to_dict()
+    data['seats'][0]['row'], data['seats'][0]['number'] = position
+    with pytest.raises(ValueError):
+        Event.from_dict(data)
+
+
+def test_resize_keeps_seats_matching_the_grid():
+    rng = random.Random(19)
+    event = make_event(4, 4)
+    guests = [Guest(f"Last{i}", f"First{i}") for i in range(40)]
+    event.add_guests(guests)
+    for _ in range(200):
+        for guest in event.unassigned_guests[:3]:
+            event.assign_seat(rng.randint(1, event.num_rows), rng.randint(1, event.num_seats_per_row), guest)
+        event.set_reserved(rng.randint(1, event.num_rows), rng.randint(1, event.num_seats_per_row), rng.random() < 0.5)
+        seated_before = {g.guest_id for g in guests if g.assigned_seat is not None}
+
+        added, removed, displaced = event.resize(rng.randint(1, 8), rng.randint(1, 8))
+        assert_consistent(event)
+        assert {g.guest_id for g in displaced} == {g.guest_id for g in guests
+                                                   if g.guest_id in seated_before and g.assigned_seat is None}
+        assert all(g in event.unassigned_guests for g in displaced)
+        assert all(seat.event is None for seat in removed)
+
+
+def test_resize_after_loading_reversed_seats():
+    event = make_event(2, 3)
+    data = event.to_dict()
+    data['seats'].reverse()
+    loaded = Event.from_dict(data)
+    loaded.resize(1, 3)
+    assert_consistent(loaded)
+
+
+def seated_transaction_event():
+    """3x4 hall: g0 at R1-S1, g1 at R1-S2, R2-S1 reserved, g2 and g3 unassigned"""
+    event = make_event()
+    guests = [Guest(f"Last{i}", f"First{i}", guest_id=f"g{i}") for i in range(4)]
+    event.add_guests(guests)
+    event.assign_seat(1, 1, guests[0])
+    event.assign_seat(1, 2, guests[1])
+    event.set_reserved(2, 1)
+    return event, guests
+
+
+def test_transaction_conflict_leaves_the_event_unchanged():
+    event, (g0, g1, g2, g3) = seated_transaction_event()
+    before = event.to_dict()
+    revision = event.revision
+
+    with pytest.raises(SeatingConflict) as raised:
+        with event.transaction() as transaction:
+            transaction.release(event.get_seat(1, 1))
+            transaction.assign(g2, event.get_seat(1, 1))  # free once R1-S1 is released
+            transaction.assign(g3, event.get_seat(2, 1))  # reserved
+            transaction.move(g2, event.get_seat(1, 2))  # taken by g1
+    assert raised.value.conflicts == [
+        f"R2-S1 is not available for {g3.get_full_name()}",
+        f"R1-S2 is not available for {g2.get_full_name()}",
+    ]
+    assert event.to_dict() == before
+    assert event.revision == revision
+    assert_consistent(event)
+
+
+def test_transaction_failing_while_applied_is_rolled_back(monkeypatch):
+    event, (g0, g1, g2, g3) = seated_transaction_event()
+    before = event.to_dict()
+    unassigned = list(event.unassigned_guests)
+    counts = [event.get_row_counts(row) for row in range(1, event.num_rows + 1)]
+    broken_seat = event.get_seat(3, 3)
+    assign_guest = Seat.assign_guest
+
+    def failing_assign(seat, guest):
+        if seat is broken_seat:
+            raise RuntimeError("failed mid-commit")
+        return assign_guest(seat, guest)
+
+    monkeypatch.setattr(Seat, "assign_guest", failing_assign)
+    with pytest.raises(RuntimeError):
+        with event.transaction() as transaction:
+            transaction.release(event.get_seat(1, 1))
+            transaction.move(g1, event.get_seat(3, 1))
+            transaction.reserve(event.get_seat(2, 1), False)
+            transaction.assign(g2, event.get_seat(1, 1))
+            transaction.assign(g3, broken_seat)
+    monkeypatch.undo()
+
+    assert event.to_dict() == before
+    assert event.unassigned_guests == unassigned
+    assert [event.get_row_counts(row) for row in range(1, event.num_rows + 1)] == counts
+    assert g0.assigned_seat is event.get_seat(1, 1)
+    assert g1.assigned_seat is event.get_seat(1, 2)
+    assert g2.assigned_seat is None and g3.assigned_seat is None
+    assert_consistent(event)
+
+
+def test_transaction_change_set():
+    event, (g0, g1, g2, g3) = seated_transaction_event()
+    with event.transaction() as transaction:
+        transaction.release(event.get_seat(1, 1))
+        transaction.move(g1, event.get_seat(3, 4))
+        transaction.assign(g2, event.get_seat(1, 2))  # freed by the move
+        transaction.reserve(event.get_seat(2, 1))  # already reserved
+        transaction.reserve(event.get_seat(2, 2))
+    changes = transaction.changes
+
+    assert {seat.get_identifier() for seat in changes.seats} == {"R1-S1", "R1-S2", "R3-S4", "R2-S2"}
+    assert set(changes.guests) == {g0, g1, g2}
+    assert changes.unassigned_changed
+    assert [g.guest_id for g in event.unassigned_guests] == ["g3", "g0"]
+    assert event.get_seat(1, 2).guest is g2
+    assert event.get_seat(3, 4).guest is g1
+    assert_consistent(event)
+
+
+def test_transaction_without_changes():
+    event, (g0, g1, g2, g3) = seated_transaction_event()
+    with event.transaction() as transaction:
+        transaction.reserve(event.get_seat(2, 1))
+        transaction.release(event.get_seat(3, 3))
+    assert not transaction.changes
+    assert not transaction.changes.unassigned_changed
@@ -0,0 +1,138 @@
+"""The same behaviour suite run against the in-memory Event and SQLiteEvent."""
+from datetime import datetime
+
+import pytest
+
+from backend.event import Event
+from backend.guest import Guest
+from backend.seat import AVAILABLE, OCCUPIED, RESERVED
+from backend.sqlite_repository import SQLiteEventStore
+
+ROWS = 3
+SEATS_PER_ROW = 4
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def event(request, tmp_path):
+    event = Event("Test", datetime(2025, 1, 1, 18, 0), "Hall", ROWS, SEATS_PER_ROW)
+    if request.param == "memory":
+        yield event
+        return
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+    yield store.import_event(event)
+    store.close()
+
+
+def make_guests(count):
+    return [Guest(f"Last{i}", f"First{i}", f"guest{i}@mail.ro", guest_id=f"g{i}") for i in range(count)]
+
+
+def unassigned_ids(event):
+    return [guest.guest_id for guest in event.unassigned_guests]
+
+
+def counts(available, occupied, reserved):
+    return {AVAILABLE: available, OCCUPIED: occupied, RESERVED: reserved}
+
+
+def test_add_guests_keeps_order(event):
+    guests = make_guests(3)
+    event.add_guest(guests[0])
+    assert event.add_guests(guests[1:]) == 2
+    assert unassigned_ids(event) == ["g0", "g1", "g2"]
+    assert event.get_guest("g1").get_full_name() == "Last1 First1"
+    assert event.get_guest("missing") is None
+
+
+def test_add_guests_renews_ids_already_in_use(event):
+    event.add_guests(make_guests(2))
+    again = make_guests(3)
+    assert event.add_guests(again) == 3
+    event.add_guest(Guest("Pop", "Ana", guest_id="g0"))
+    ids = unassigned_ids(event)
+    assert len(ids) == len(set(ids)) == 6
+    assert ids[:2] == ["g0", "g1"] and ids[4] == "g2"
+    assert all(event.get_guest(guest_id) is not None for guest_id in ids)
+
+
+def test_seating_operations(event):
+    g0, g1, g2, g3 = make_guests(4)
+    event.add_guests([g0, g1, g2, g3])
+    capacity = ROWS * SEATS_PER_ROW
+
+    # assign
+    assert event.assign_seat(1, 1, g0)
+    assert event.assign_seat(1, 2, g1)
+    assert not event.assign_seat(1, 1, g2)  # taken
+    assert not event.assign_seat(ROWS + 1, 1, g2)  # outside the hall
+    assert unassigned_ids(event) == ["g2", "g3"]
+    assert event.get_seat(1, 1).guest.guest_id == "g0"
+    assert event.get_seat(1, 1).get_state() == OCCUPIED
+    assert event.get_occupied_seats_count() == 2
+    assert event.get_available_seats_count() == capacity - 2
+    assert event.get_row_counts(1) == counts(SEATS_PER_ROW - 2, 2, 0)
+
+    # reserve
+    event.set_reserved(2, 1)
+    assert not event.assign_seat(2, 1, g2)
+    assert event.get_seat(2, 1).get_state() == RESERVED
+    assert event.get_reserved_seats_count() == 1
+    assert event.get_occupied_seats_count() == 3
+    assert event.get_row_counts(2) == counts(SEATS_PER_ROW - 1, 0, 1)
+
+    # move
+    assert event.move_guest(event.get_guest("g1"), event.get_seat(3, 4))
+    assert not event.move_guest(event.get_guest("g0"), event.get_seat(2, 1))  # reserved
+    assert not event.move_guest(event.get_guest("g2"), event.get_seat(3, 1))  # not seated
+    assert event.get_seat(1, 2).get_state() == AVAILABLE
+    assert event.get_seat(3, 4).guest.guest_id == "g1"
+    assert event.get_row_counts(1) == counts(SEATS_PER_ROW - 1, 1, 0)
+    assert event.get_row_counts(3) == counts(SEATS_PER_ROW - 1, 1, 0)
+
+    # release goes to the end of the unassigned guests
+    released = event.release_seat(1, 1)
+    assert released.guest_id == "g0"
+    assert event.release_seat(1, 1) is None
+    assert unassigned_ids(event) == ["g2", "g3", "g0"]
+    assert event.get_occupied_seats_count() == 2
+
+    # a reserved seat keeps its reservation when its guest leaves
+    event.set_reserved(3, 4)
+    assert event.get_seat(3, 4).get_state() == OCCUPIED
+    assert event.get_reserved_seats_count() == 1
+    event.release_seat(3, 4)
+    assert event.get_seat(3, 4).get_state() == RESERVED
+    assert event.get_reserved_seats_count() == 2
+    assert unassigned_ids(event) == ["g2", "g3", "g0", "g1"]
+
+    # unreserve
+    event.set_reserved(2, 1, False)
+    event.set_reserved(3, 4, False)
+    assert event.get_reserved_seats_count() == 0
+    assert event.get_available_seats_count() == capacity
+    assert all(event.get_row_counts(row) == counts(SEATS_PER_ROW, 0, 0) for row in range(1, ROWS + 1))
+
+
+def test_remove_guest_frees_its_seat(event):
+    g0, g1 = make_guests(2)
+    event.add_guests([g0, g1])
+    event.assign_seat(2, 2, g0)
+    event.remove_guest(event.get_guest("g0"))
+    event.remove_guest(event.get_guest("g1"))
+    assert event.get_guest("g0") is None
+    assert event.get_seat(2, 2).get_state() == AVAILABLE
+    assert unassigned_ids(event) == []
+    assert event.get_available_seats_count() == ROWS * SEATS_PER_ROW
+
+
+def test_to_dict_round_trip(event):
+    g0, g1, g2 = make_guests(3)
+    event.add_guests([g0, g1, g2])
+    event.assign_seat(1, 3, g1)
+    event.set_reserved(2, 2)
+    data = event.to_dict()
+    loaded = Event.from_dict(data)
+    assert loaded.to_dict() == data
+    assert [g.guest_id for g in loaded.unassigned_guests] == ["g0", "g2"]
+    assert loaded.get_seat(1, 3).guest.guest_id == "g1"
+    assert loaded.get_seat(2, 2).reserved
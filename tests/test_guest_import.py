@@ -0,0 +1,87 @@
+import time
+
+import pytest
+
+QtCore = pytest.importorskip("PySide6.QtCore")
+from PySide6.QtCore import QCoreApplication, QEventLoop, QThread, QTimer, Qt  # noqa: E402
+
+from app.guest_import_worker import GuestImportWorker  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def guest_file(tmp_path):
+    path = tmp_path / "guests.csv"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("last_name,first_name\n")
+        for i in range(1000):
+            f.write(f"Last{i},First{i}\n")
+    return str(path)
+
+
+class Receiver(QtCore.QObject):
+    """Plays the GUI thread: takes chunks slowly and may cancel after the first"""
+
+    def __init__(self, worker, cancel_after=None):
+        super().__init__()
+        self.worker = worker
+        self.cancel_after = cancel_after
+        self.sent = 0
+        self.taken = []
+        self.waiting = []
+        self.result = None
+
+    def count_sent(self, chunk):  # runs in the worker thread
+        self.sent += 1
+
+    def take(self, chunk):
+        self.waiting.append(self.sent - len(self.taken))
+        time.sleep(0.01)
+        self.taken.append(chunk)
+        if len(self.taken) == self.cancel_after:
+            self.worker.cancel()
+        self.worker.chunk_taken()
+
+
+def run_import(app, path, cancel_after=None):
+    worker = GuestImportWorker(path)
+    worker.CHUNK_SIZE = 100
+    thread = QThread()
+    worker.moveToThread(thread)
+    receiver = Receiver(worker, cancel_after)
+    loop = QEventLoop()
+
+    def done(*result):
+        receiver.result = result
+        loop.quit()
+
+    thread.started.connect(worker.run)
+    worker.chunk_ready.connect(receiver.count_sent, Qt.DirectConnection)
+    worker.chunk_ready.connect(receiver.take)
+    worker.finished.connect(done)
+    worker.failed.connect(done)
+    thread.start()
+    QTimer.singleShot(10000, loop.quit)
+    loop.exec()
+    thread.quit()
+    thread.wait()
+    return receiver
+
+
+def test_import_sends_every_chunk_one_at_a_time(app, guest_file):
+    receiver = run_import(app, guest_file)
+    assert receiver.result[0] == 1000
+    assert len(receiver.taken) == 10
+    # The worker never ran ahead of the GUI by more than the chunk being taken
+    assert max(receiver.waiting) == 1
+
+
+def test_cancel_mid_file_stops_the_import(app, guest_file):
+    receiver = run_import(app, guest_file, cancel_after=3)
+    assert receiver.result is not None
+    assert len(receiver.taken) == 3
+    assert receiver.result[0] == 300
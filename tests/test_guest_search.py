@@ -0,0 +1,82 @@
+from datetime import datetime
+
+from backend.event import Event
+from backend.guest import Guest
+from backend.guest_search import GuestSearchIndex, normalize
+
+
+def names(guests):
+    return [guest.get_full_name() for guest in guests]
+
+
+def make_guests():
+    return [
+        Guest("Ștefănescu", "Ioana", "ioana@mail.ro", "0722 111 222", guest_id="g0"),
+        Guest("Stefanescu", "Andrei", "andrei@mail.ro", guest_id="g1"),
+        Guest("Popescu", "Ana Maria", "ana.p@mail.ro", "0733-444-555", guest_id="g2"),
+        Guest("Pop", "Ion", guest_id="g3"),
+    ]
+
+
+def test_normalize_folds_case_and_diacritics():
+    assert normalize("Ștefănescu") == "stefanescu"
+    assert normalize("ÎNTÂI") == "intai"
+
+
+def test_search_ignores_diacritics_both_ways():
+    index = GuestSearchIndex(make_guests())
+    assert names(index.search("stefan")) == ["Stefanescu Andrei", "Ștefănescu Ioana"]
+    assert names(index.search("Ștefănescu")) == names(index.search("stefanescu"))
+
+
+def test_search_intersects_every_term():
+    index = GuestSearchIndex(make_guests())
+    assert names(index.search("pop")) == ["Pop Ion", "Popescu Ana Maria"]
+    assert names(index.search("pop maria")) == ["Popescu Ana Maria"]
+    assert names(index.search("stefan io")) == ["Ștefănescu Ioana"]
+    assert index.search("pop andrei") == []
+    assert index.search("  ") == []
+
+
+def test_search_by_email_and_phone_digits():
+    index = GuestSearchIndex(make_guests())
+    assert names(index.search("ana.p")) == ["Popescu Ana Maria"]
+    assert names(index.search("0733444")) == ["Popescu Ana Maria"]
+
+
+def test_remove_and_add_again():
+    guests = make_guests()
+    index = GuestSearchIndex(guests)
+    index.remove(guests[2])
+    assert index.search("popescu") == []
+    assert names(index.search("pop")) == ["Pop Ion"]
+    assert len(index) == 3
+
+    index.add(guests[2])
+    index.add(guests[2])  # adding twice keeps one entry
+    assert names(index.search("pop")) == ["Pop Ion", "Popescu Ana Maria"]
+    assert len(index) == 4
+
+
+def test_search_limit_keeps_the_first_names_in_order():
+    index = GuestSearchIndex(Guest("Pop", f"Name{i:02d}") for i in range(30))
+    assert names(index.search("pop", limit=3)) == ["Pop Name00", "Pop Name01", "Pop Name02"]
+
+
+def test_index_built_elsewhere_catches_up_with_changes():
+    event = Event("Test", datetime(2025, 1, 1, 18, 0), "Hall", 2, 3)
+    guests = make_guests()
+    event.add_guests(guests)
+    index = GuestSearchIndex(event.prepare_search_index())
+    assert not event.has_search_index()
+
+    # Changes while the index is being built
+    event.remove_guest(guests[0])
+    event.add_guest(Guest("Stan", "Maria", guest_id="g4"))
+    event.install_search_index(index)
+    assert event.has_search_index()
+    assert names(event.search_guests("st")) == ["Stan Maria", "Stefanescu Andrei"]
+
+    # Once installed, the index is kept up to date directly
+    event.remove_guest(guests[1])
+    assert names(event.search_guests("st")) == ["Stan Maria"]
@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from backend.event import Event
+from backend.guest import Guest
+from backend.seat import OCCUPIED, RESERVED
+from backend.snapshot import EventSnapshot, encode_event
+
+
+def test_snapshot_is_row_major_whatever_the_seat_order():
+    event = Event("Test", datetime(2025, 1, 1, 18, 0), "Hall", 2, 3)
+    guest = Guest("Pop", "Ana")
+    event.add_guest(guest)
+    event.assign_seat(1, 2, guest)
+    event.set_reserved(2, 3)
+    event.seats.reverse()
+
+    with EventSnapshot(data=encode_event(event)) as snapshot:
+        assert snapshot.get_seat_guest(1, 2).guest_id == guest.guest_id
+        assert snapshot.get_seat_guest(2, 2) is None
+        assert snapshot.get_seat_state(1, 2) == OCCUPIED
+        assert snapshot.get_seat_state(2, 3) == RESERVED
+        loaded = snapshot.to_event()
+    assert loaded.get_seat(1, 2).guest.guest_id == guest.guest_id
+    assert loaded.get_seat(2, 3).reserved
+    assert sum(seat.guest is not None or seat.reserved for seat in loaded.seats) == 2
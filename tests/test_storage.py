@@ -0,0 +1,161 @@
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from backend.event import Event
+from backend.guest import Guest
+from backend.storage import EventStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = EventStorage(str(tmp_path))
+    yield storage
+    storage.close()
+
+
+def seated_event():
+    event = Event("Test", datetime(2025, 1, 1, 18, 0), "Hall", 2, 3)
+    guest = Guest("Pop", "Ana")
+    event.add_guest(guest)
+    event.assign_seat(1, 1, guest)
+    return event
+
+
+def test_reserving_an_occupied_seat_is_saved(storage):
+    event = seated_event()
+    storage.save([event])
+    assert not storage.is_dirty(event)
+
+    event.set_reserved(1, 1)
+    assert storage.is_dirty(event)
+    storage.save([event])
+    assert storage.load_event(event.event_id).get_seat(1, 1).reserved
+
+    event.set_reserved(1, 1, False)
+    storage.save([event])
+    assert not storage.load_event(event.event_id).get_seat(1, 1).reserved
+
+
+def test_setting_the_same_reservation_is_not_a_change(storage):
+    event = seated_event()
+    event.set_reserved(2, 2)
+    storage.save([event])
+    event.set_reserved(2, 2)
+    assert not storage.is_dirty(event)
+
+
+def test_sqlite_storage_round_trip(tmp_path):
+    storage = EventStorage(str(tmp_path), sqlite=True)
+    event = seated_event()
+    event.set_reserved(2, 3)
+    storage.save([event])
+    assert (tmp_path / EventStorage.DATABASE_FILE).exists()
+    assert not (tmp_path / EventStorage.EVENTS_DIR / f"{event.event_id}.json").exists()
+
+    loaded = storage.load_event(event.event_id)
+    assert loaded.to_dict() == event.to_dict()
+    assert storage.load_event_data(event.event_id) == event.to_dict()
+    assert not storage.is_dirty(loaded)
+
+    loaded.release_seat(1, 1)
+    storage.save([loaded])
+    assert storage.load_event(event.event_id).to_dict() == loaded.to_dict()
+    storage.delete_event(event.event_id)
+    storage.close()
+    storage = EventStorage(str(tmp_path), sqlite=True)
+    with pytest.raises(FileNotFoundError):
+        storage.load_event(event.event_id)
+    storage.close()
+
+
+def test_switching_storage_formats_keeps_the_latest_copy(tmp_path):
+    event = seated_event()
+    storage = EventStorage(str(tmp_path), sqlite=True)
+    storage.save([event])
+    storage.close()
+
+    # Saved as SQLite, still readable as a JSON workspace, which then takes over
+    storage = EventStorage(str(tmp_path))
+    loaded = storage.load_event(event.event_id)
+    assert loaded.to_dict() == event.to_dict()
+    loaded.set_reserved(2, 3)
+    storage.save([loaded])
+    storage.close()
+
+    storage = EventStorage(str(tmp_path), sqlite=True)
+    assert storage.load_event(event.event_id).to_dict() == loaded.to_dict()
+    storage.close()
+
+
+def test_sqlite_storage_allows_the_same_guest_ids_in_two_events(tmp_path):
+    storage = EventStorage(str(tmp_path), sqlite=True)
+    events = [seated_event(), seated_event()]
+    for event in events:
+        event.add_guests([Guest("Ionescu", "Dan", guest_id="imported-1")])
+    events[1].assign_seat(2, 2, events[1].get_guest("imported-1"))
+    storage.save(events)
+    storage.close()
+
+    storage = EventStorage(str(tmp_path), sqlite=True)
+    for event in events:
+        assert storage.load_event(event.event_id).to_dict() == event.to_dict()
+    storage.close()
+
+
+def test_sqlite_storage_writes_only_the_changed_rows(tmp_path):
+    storage = EventStorage(str(tmp_path), sqlite=True)
+    event = Event("Test", datetime(2025, 1, 1, 18, 0), "Hall", 20, 20)
+    event.add_guests(Guest(f"Last{i}", f"First{i}") for i in range(300))
+    for i, guest in enumerate(event.unassigned_guests[:100]):
+        event.assign_seat(i // 20 + 1, i % 20 + 1, guest)
+    storage.save([event])
+    storage.close()
+
+    storage = EventStorage(str(tmp_path), sqlite=True)
+    event = storage.load_event(event.event_id)
+    connection = storage._open_database().connection
+
+    def rows_written(change):
+        before = connection.total_changes
+        change()
+        storage.save([event])
+        return connection.total_changes - before
+
+    guest = event.unassigned_guests[0]
+    assert rows_written(lambda: event.assign_seat(20, 20, guest)) == 1
+    assert rows_written(lambda: event.set_reserved(20, 19)) == 1
+    assert rows_written(lambda: event.move_guest(guest, event.get_seat(19, 1))) == 2
+    assert rows_written(lambda: event.release_seat(19, 1)) == 2  # the seat, and the guest's position
+    assert rows_written(lambda: event.remove_guest(event.get_seat(1, 1).guest)) == 2
+    storage.close()
+
+    storage = EventStorage(str(tmp_path), sqlite=True)
+    assert storage.load_event(event.event_id).to_dict() == event.to_dict()
+    storage.close()
+
+
+def test_sqlite_storage_rewrites_an_event_after_a_failed_write(tmp_path, monkeypatch):
+    storage = EventStorage(str(tmp_path), sqlite=True)
+    event = seated_event()
+    storage.save([event])
+    database = storage._open_database()
+    save_event_rows = database.save_event_rows
+
+    def fail(*args, **kwargs):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(database, "save_event_rows", fail)
+    event.set_reserved(2, 3)
+    with pytest.raises(sqlite3.Error):
+        storage.save([event])
+    assert storage.is_dirty(event)
+
+    monkeypatch.setattr(database, "save_event_rows", save_event_rows)
+    event.release_seat(1, 1)
+    storage.save([event])
+    storage.close()
+    storage = EventStorage(str(tmp_path), sqlite=True)
+    assert storage.load_event(event.event_id).to_dict() == event.to_dict()
+    storage.close()
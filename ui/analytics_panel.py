@@ -0,0 +1,158 @@
+import numpy as np
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QDateEdit, QCheckBox,
+    QTabWidget, QTableWidget, QTableWidgetItem, QScrollArea, QAbstractItemView
+)
+from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtCore import Qt, QDate, Signal
+
+from backend.analytics import OccupancyPortfolio
+
+HEATMAP_EMPTY = (238, 238, 238)
+HEATMAP_OCCUPIED = (46, 125, 50)
+HEATMAP_RESERVED = (245, 124, 0)
+HEATMAP_MAX_CELL = 12
+
+
+def heatmap_pixmap(rates, color, max_size=480):
+    """Render a rate matrix (0..1, NaN for missing seats) from white to `color`"""
+    if rates.size == 0:
+        return QPixmap()
+    rates = np.nan_to_num(rates, nan=-1.0)
+    missing = rates < 0
+    weight = np.clip(rates, 0.0, 1.0)[..., None]
+    rgb = (255 - weight * (255 - np.array(color, dtype=np.float64))).astype(np.uint8)
+    rgb[missing] = HEATMAP_EMPTY
+    rgb = np.ascontiguousarray(rgb)
+    height, width = rates.shape
+    image = QImage(rgb.data, width, height, width * 3, QImage.Format_RGB888).copy()
+    cell = max(1, min(HEATMAP_MAX_CELL, max_size // max(width, height)))
+    return QPixmap.fromImage(image.scaled(width * cell, height * cell, Qt.IgnoreAspectRatio, Qt.FastTransformation))
+
+
+class AnalyticsPanel(QWidget):
+    """Portfolio occupancy dashboard; the portfolio itself is built by the main window in a worker"""
+
+    refresh_requested = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.portfolio = OccupancyPortfolio()
+
+        layout = QVBoxLayout()
+
+        controls = QHBoxLayout()
+        self.btn_refresh = QPushButton("Refresh")
+        self.btn_refresh.clicked.connect(self.refresh_requested)
+        controls.addWidget(self.btn_refresh)
+        self.date_filter = QCheckBox("From")
+        self.date_filter.toggled.connect(self.update_view)
+        controls.addWidget(self.date_filter)
+        self.date_from = QDateEdit(QDate.currentDate().addYears(-1))
+        self.date_from.setCalendarPopup(True)
+        self.date_from.dateChanged.connect(self.update_view)
+        controls.addWidget(self.date_from)
+        controls.addWidget(QLabel("to"))
+        self.date_to = QDateEdit(QDate.currentDate().addYears(1))
+        self.date_to.setCalendarPopup(True)
+        self.date_to.dateChanged.connect(self.update_view)
+        controls.addWidget(self.date_to)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self.summary_label = QLabel("Press Refresh to compute the statistics of all events")
+        self.summary_label.setWordWrap(True)
+        layout.addWidget(self.summary_label)
+
+        self.tabs = QTabWidget()
+        self.events_table = self._create_table(["Event", "Date", "Capacity", "Occupied", "Reserved", "Fill rate (%)"])
+        self.tabs.addTab(self.events_table, "Events")
+        self.months_table = self._create_table(["Month", "Events", "Fill rate (%)"])
+        self.tabs.addTab(self.months_table, "Months")
+        self.rows_table = self._create_table(["Row", "Fill rate (%)"])
+        self.tabs.addTab(self.rows_table, "Rows")
+
+        heatmaps = QWidget()
+        heatmaps_layout = QVBoxLayout()
+        heatmaps_layout.addWidget(QLabel("Occupied (share of events, per seat):"))
+        self.occupied_heatmap = QLabel()
+        heatmaps_layout.addWidget(self.occupied_heatmap)
+        heatmaps_layout.addWidget(QLabel("Reserved (share of events, per seat):"))
+        self.reserved_heatmap = QLabel()
+        heatmaps_layout.addWidget(self.reserved_heatmap)
+        heatmaps_layout.addStretch()
+        heatmaps.setLayout(heatmaps_layout)
+        heatmaps_scroll = QScrollArea()
+        heatmaps_scroll.setWidgetResizable(True)
+        heatmaps_scroll.setWidget(heatmaps)
+        self.tabs.addTab(heatmaps_scroll, "Heatmaps")
+        layout.addWidget(self.tabs)
+
+        self.setLayout(layout)
+
+    def _create_table(self, headers):
+        table = QTableWidget(0, len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+        table.setSortingEnabled(True)
+        return table
+
+    def set_busy(self, busy):
+        self.btn_refresh.setEnabled(not busy)
+        if busy:
+            self.summary_label.setText("Computing statistics...")
+
+    def set_portfolio(self, portfolio):
+        self.portfolio = portfolio
+        self.set_busy(False)
+        self.update_view()
+
+    def selected_portfolio(self):
+        if not self.date_filter.isChecked():
+            return self.portfolio
+        start = self.date_from.date().startOfDay().toPython()
+        end = self.date_to.date().endOfDay().toPython()
+        return self.portfolio.select(start, end)
+
+    def update_view(self):
+        portfolio = self.selected_portfolio()
+        summary = portfolio.summary()
+        self.summary_label.setText(
+            f"<b>{summary['events']}</b> events, <b>{summary['capacity']}</b> seats: "
+            f"{summary['occupied']} occupied ({summary['fill_rate']:.1%}), {summary['reserved']} reserved")
+
+        totals = portfolio.event_totals()
+        self._fill_table(self.events_table, [
+            (name, date_time.strftime("%d.%m.%Y %H:%M") if date_time else "",
+             int(capacity), int(occupied), int(reserved), float(rate))
+            for name, date_time, capacity, occupied, reserved, rate in zip(
+                portfolio.names, portfolio.dates, totals['capacity'], totals['occupied'],
+                totals['reserved'], totals['fill_rate'])
+        ])
+        months, rates, counts = portfolio.fill_rate_by_month()
+        self._fill_table(self.months_table, [
+            (month, int(count), float(rate)) for month, count, rate in zip(months, counts, rates)])
+        self._fill_table(self.rows_table, [
+            (f"R{row}", float(rate)) for row, rate in enumerate(portfolio.row_fill_rates(), start=1)])
+
+        occupied, reserved = portfolio.heatmaps()
+        self.occupied_heatmap.setPixmap(heatmap_pixmap(occupied, HEATMAP_OCCUPIED))
+        self.reserved_heatmap.setPixmap(heatmap_pixmap(reserved, HEATMAP_RESERVED))
+
+    def _fill_table(self, table, rows):
+        """Numbers are stored as data so sorting is numeric; the last column is a rate"""
+        table.setSortingEnabled(False)
+        table.setRowCount(len(rows))
+        for r, values in enumerate(rows):
+            for c, value in enumerate(values):
+                item = QTableWidgetItem()
+                if c == len(values) - 1 and isinstance(value, float):
+                    item.setData(Qt.DisplayRole, round(value * 100, 1) if value == value else 0.0)
+                elif isinstance(value, (int, float)):
+                    item.setData(Qt.DisplayRole, value)
+                else:
+                    item.setText(value)
+                table.setItem(r, c, item)
+        table.setSortingEnabled(True)
+        table.resizeColumnsToContents()
@@ -0,0 +1,111 @@
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+from ui.guest_mime import GUEST_MIME_TYPE, guest_mime_data
+
+
+class GuestListModel(QAbstractListModel):
+    """List model over the unassigned guests of an event.
+
+    Rows are exposed to the view in batches through canFetchMore/fetchMore,
+    and the mutators below emit row insert/remove signals for just the
+    affected row instead of resetting the whole list.
+    """
+
+    BATCH_SIZE = 500
+    GuestRole = Qt.UserRole
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._event = None
+        self._loaded = 0
+
+    def set_event(self, event):
+        self.beginResetModel()
+        self._event = event
+        self._loaded = 0
+        self.endResetModel()
+
+    def _guests(self):
+        return self._event.unassigned_guests if self._event else []
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._loaded
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        guest = self._guests()[index.row()]
+        if role == Qt.DisplayRole:
+            return guest.get_full_name()
+        if role == Qt.ToolTipRole:
+            return guest.email or None
+        if role == self.GuestRole:
+            return guest
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid():
+            flags |= Qt.ItemIsDragEnabled
+        return flags
+
+    def mimeTypes(self):
+        return [GUEST_MIME_TYPE]
+
+    def mimeData(self, indexes):
+        """Drag payload with the ids of the selected guests, in list order"""
+        guests = self._guests()
+        rows = sorted({index.row() for index in indexes if index.isValid() and index.row() < self._loaded})
+        return guest_mime_data([guests[row].guest_id for row in rows], self._event.event_id if self._event else "")
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._loaded < len(self._guests())
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        remaining = len(self._guests()) - self._loaded
+        count = min(self.BATCH_SIZE, remaining)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def append_guest(self, guest):
+        """Add a guest to the event's unassigned guests"""
+        guests = self._guests()
+        if self._loaded < len(guests):
+            # Not fetched yet, the view will get it through fetchMore
+            self._event.add_guest(guest)
+            return
+        row = len(guests)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._event.add_guest(guest)
+        self._loaded += 1
+        self.endInsertRows()
+
+    def guests_appended(self, count):
+        """Show guests that were appended to the event's unassigned guests directly"""
+        total = len(self._guests())
+        if count <= 0 or self._loaded < total - count:
+            # Not fetched yet, the view will get them through fetchMore
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, total - 1)
+        self._loaded = total
+        self.endInsertRows()
+
+    def take_guest(self, row):
+        """Remove and return the unassigned guest at a row"""
+        guests = self._guests()
+        if row >= self._loaded:
+            return guests.pop(row)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        guest = guests.pop(row)
+        self._loaded -= 1
+        self.endRemoveRows()
+        return guest
@@ -0,0 +1,35 @@
+"""Drag-and-drop payload carrying guest ids of one event.
+
+The payload is a private MIME type holding "<event_id>:<id>[,<id>...]" as
+UTF-8 bytes, so drops can reject guests dragged from another event.
+"""
+from PySide6.QtCore import QMimeData, QByteArray
+
+GUEST_MIME_TYPE = "application/x-event-planner-guests"
+
+
+def guest_mime_data(guest_ids, event_id=""):
+    mime_data = QMimeData()
+    mime_data.setData(GUEST_MIME_TYPE, QByteArray(f"{event_id}:{','.join(guest_ids)}".encode("utf-8")))
+    return mime_data
+
+
+def _payload(mime_data):
+    if not mime_data.hasFormat(GUEST_MIME_TYPE):
+        return None, ""
+    event_id, _, guest_ids = bytes(mime_data.data(GUEST_MIME_TYPE)).decode("utf-8").partition(":")
+    return event_id, guest_ids
+
+
+def has_guests(mime_data, event_id=None):
+    """True if the payload carries guests (of `event_id`, when given)"""
+    source, guest_ids = _payload(mime_data)
+    return bool(guest_ids) and (event_id is None or source == event_id)
+
+
+def guest_ids_from_mime(mime_data, event_id=None):
+    """Return the dragged guest ids, or an empty list for other payloads or events"""
+    source, guest_ids = _payload(mime_data)
+    if source is None or (event_id is not None and source != event_id):
+        return []
+    return [guest_id for guest_id in guest_ids.split(",") if guest_id]
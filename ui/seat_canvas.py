@@ -0,0 +1,356 @@
+import math
+
+from PySide6.QtWidgets import QWidget, QApplication
+from PySide6.QtGui import QDrag, QPainter, QColor, QFont, QStaticText, QTextOption
+from PySide6.QtCore import Qt, QRect, QRectF, QPoint, QPointF, Signal
+
+from backend.seat import AVAILABLE, OCCUPIED, RESERVED
+from ui.seat_widget import seat_style, drag_pixmap, SEAT_COLORS
+from ui.guest_mime import guest_mime_data, guest_ids_from_mime, has_guests
+
+SEAT_SIZE = 60
+SEAT_SPACING = 5
+ROW_LABEL_WIDTH = 45
+STAGE_HEIGHT = 50
+MARGIN = 10
+
+MIN_ZOOM = 0.02
+MAX_ZOOM = 2.0
+# Level of detail by zoom: full labels, colored dots, or one fill bar per row
+LABELS_ZOOM = 0.6
+DOTS_ZOOM = 0.12
+ROW_LABELS_MIN_STEP = 30
+LOD_LABELS = "labels"
+LOD_DOTS = "dots"
+LOD_BLOCKS = "blocks"
+
+
+def short_guest_name(guest):
+    text = guest.get_full_name()
+    if len(text) > 15:
+        text = text[:12] + "..."
+    return text
+
+
+class SeatCanvas(QWidget):
+    """Single widget that paints the whole seating map of an event.
+
+    Only the seats inside the exposed rectangle are painted and seats are
+    found from mouse positions arithmetically, so the cost of a frame
+    depends on the viewport size and not on the size of the venue.
+
+    The map is laid out at zoom 1 and painted through a scaled painter.
+    Below LABELS_ZOOM seats are drawn as plain colored dots and below
+    DOTS_ZOOM each row becomes a bar showing its occupied/reserved share,
+    taken from the event's row counters. Text is laid out once per guest
+    (QStaticText) and reused at every zoom level.
+    """
+
+    seat_clicked = Signal(object)
+    # Ctrl+wheel: requested zoom and the canvas position to keep under the cursor
+    zoom_requested = Signal(float, QPoint)
+
+    def __init__(self, controller=None, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+        self.current_event = None
+        self.zoom = 1.0
+        self._press_pos = None
+        self._press_seat = None
+        self._drop_seat = None
+        self._highlight_seat = None
+        self._guest_texts = {}
+        self._static_texts = {}
+        self.setAcceptDrops(True)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+        self._font_position = QFont()
+        self._font_position.setPixelSize(9)
+        self._font_position.setBold(True)
+        self._font_guest = QFont()
+        self._font_guest.setPixelSize(8)
+        self._font_row = QFont()
+        self._font_row.setBold(True)
+        self._state_colors = {status: QColor(colors[0]) for status, colors in SEAT_COLORS.items()}
+
+        self.set_event(None)
+
+    def set_event(self, event):
+        """Show another event (or refresh the current one)"""
+        if event is not self.current_event:
+            self._highlight_seat = None
+            self._guest_texts.clear()
+        self.current_event = event
+        self._drop_seat = None
+        self._update_size()
+        self.update()
+
+    def set_zoom(self, zoom):
+        """Change the scale of the map (clamped to MIN_ZOOM..MAX_ZOOM); returns the zoom applied"""
+        zoom = min(MAX_ZOOM, max(MIN_ZOOM, zoom))
+        if zoom != self.zoom:
+            self.zoom = zoom
+            self._update_size()
+            self.update()
+        return self.zoom
+
+    def level_of_detail(self):
+        if self.zoom >= LABELS_ZOOM:
+            return LOD_LABELS
+        if self.zoom >= DOTS_ZOOM:
+            return LOD_DOTS
+        return LOD_BLOCKS
+
+    def _update_size(self):
+        event = self.current_event
+        if event:
+            width = MARGIN * 2 + ROW_LABEL_WIDTH + event.num_seats_per_row * (SEAT_SIZE + SEAT_SPACING)
+            height = MARGIN * 2 + STAGE_HEIGHT + event.num_rows * (SEAT_SIZE + SEAT_SPACING)
+            self.setFixedSize(math.ceil(width * self.zoom), math.ceil(height * self.zoom))
+        else:
+            self.setFixedSize(300, 150)
+
+    def refresh_seats(self, seats):
+        """Repaint only the given seats (their whole rows when zoomed out to row bars)"""
+        blocks = self.level_of_detail() == LOD_BLOCKS
+        for seat in seats:
+            self.update(self._row_rect(seat.row) if blocks else self.seat_rect(seat.row, seat.number))
+
+    def highlight_seat(self, seat):
+        """Mark a seat as a search result (None clears the highlight)"""
+        previous = self._highlight_seat
+        self._highlight_seat = seat
+        self.refresh_seats([s for s in (previous, seat) if s is not None])
+
+    def _base_seat_rect(self, row, number):
+        x = MARGIN + ROW_LABEL_WIDTH + (number - 1) * (SEAT_SIZE + SEAT_SPACING)
+        y = MARGIN + STAGE_HEIGHT + (row - 1) * (SEAT_SIZE + SEAT_SPACING)
+        return QRect(x, y, SEAT_SIZE, SEAT_SIZE)
+
+    def _to_widget(self, rect):
+        """Widget pixels covered by a rectangle of the unscaled layout"""
+        zoom = self.zoom
+        return QRectF(rect.x() * zoom, rect.y() * zoom, rect.width() * zoom, rect.height() * zoom).toAlignedRect()
+
+    def seat_rect(self, row, number):
+        return self._to_widget(self._base_seat_rect(row, number))
+
+    def _row_rect(self, row):
+        rect = self._base_seat_rect(row, 1)
+        rect.setWidth(self.current_event.num_seats_per_row * (SEAT_SIZE + SEAT_SPACING))
+        return self._to_widget(rect)
+
+    def seat_at(self, pos):
+        """Return the seat under a widget position, or None"""
+        if not self.current_event:
+            return None
+        x = int(pos.x() / self.zoom) - MARGIN - ROW_LABEL_WIDTH
+        y = int(pos.y() / self.zoom) - MARGIN - STAGE_HEIGHT
+        if x < 0 or y < 0:
+            return None
+        step = SEAT_SIZE + SEAT_SPACING
+        # Zoomed out the gaps are under a pixel wide, so any point of the cell counts
+        if self.zoom >= DOTS_ZOOM and (x % step >= SEAT_SIZE or y % step >= SEAT_SIZE):
+            return None
+        return self.current_event.get_seat(y // step + 1, x // step + 1)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        # Inside a scroll area only the part in the viewport needs painting
+        exposed = event.rect().intersected(self.visibleRegion().boundingRect())
+        painter.fillRect(exposed, self.palette().window())
+
+        if not self.current_event:
+            painter.setPen(QColor("#757575"))
+            painter.drawText(self.rect(), Qt.AlignCenter, "No event selected")
+            return
+
+        # From here on everything is drawn in unscaled layout coordinates
+        zoom = self.zoom
+        painter.scale(zoom, zoom)
+        exposed = QRectF(exposed.x() / zoom, exposed.y() / zoom,
+                         exposed.width() / zoom, exposed.height() / zoom).toAlignedRect()
+        lod = self.level_of_detail()
+
+        stage = QRect(MARGIN, MARGIN, round(self.width() / zoom) - 2 * MARGIN, STAGE_HEIGHT - 15)
+        if stage.intersects(exposed):
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor("#212121"))
+            painter.drawRoundedRect(stage, 5, 5)
+            if lod != LOD_BLOCKS:
+                painter.setPen(Qt.white)
+                painter.setFont(self._font_row)
+                painter.drawText(stage, Qt.AlignCenter, "Stage / Podium")
+
+        step = SEAT_SIZE + SEAT_SPACING
+        origin_x = MARGIN + ROW_LABEL_WIDTH
+        origin_y = MARGIN + STAGE_HEIGHT
+        first_row = max(1, (exposed.top() - origin_y) // step + 1)
+        last_row = min(self.current_event.num_rows, (exposed.bottom() - origin_y) // step + 1)
+        first_number = max(1, (exposed.left() - origin_x) // step + 1)
+        last_number = min(self.current_event.num_seats_per_row, (exposed.right() - origin_x) // step + 1)
+
+        if exposed.left() < origin_x and step * zoom >= ROW_LABELS_MIN_STEP:
+            painter.setPen(QColor("#424242"))
+            painter.setFont(self._font_row)
+            for row in range(first_row, last_row + 1):
+                label_rect = QRect(MARGIN, origin_y + (row - 1) * step, ROW_LABEL_WIDTH, SEAT_SIZE)
+                painter.drawText(label_rect, Qt.AlignCenter, f"R{row}")
+
+        if lod == LOD_BLOCKS:
+            self._paint_row_bars(painter, first_row, last_row)
+            return
+        for row in range(first_row, last_row + 1):
+            for seat in self.current_event.get_row_seats(row, first_number)[:last_number - first_number + 1]:
+                if seat is None:
+                    continue
+                if lod == LOD_LABELS:
+                    self._paint_seat(painter, seat, self._base_seat_rect(seat.row, seat.number))
+                else:
+                    painter.fillRect(self._base_seat_rect(seat.row, seat.number),
+                                     self._state_colors[self._seat_status(seat)])
+
+    def _paint_row_bars(self, painter, first_row, last_row):
+        """One bar per row split by its occupied/reserved/available counts"""
+        event = self.current_event
+        width = event.num_seats_per_row * (SEAT_SIZE + SEAT_SPACING) - SEAT_SPACING
+        colors = self._state_colors
+        for row in range(first_row, last_row + 1):
+            counts = event.get_row_counts(row)
+            rect = self._base_seat_rect(row, 1)
+            x = rect.x()
+            total = sum(counts.values()) or 1
+            for state in (OCCUPIED, RESERVED, AVAILABLE):
+                segment = round(width * counts[state] / total)
+                if segment:
+                    painter.fillRect(QRect(x, rect.y(), segment, SEAT_SIZE), colors[state])
+                    x += segment
+        # A search result or drop target stays visible on top of its row
+        for seat in (self._highlight_seat, self._drop_seat):
+            if seat is not None and first_row <= seat.row <= last_row:
+                painter.fillRect(self._base_seat_rect(seat.row, seat.number), colors[self._seat_status(seat)])
+
+    def _seat_status(self, seat):
+        if seat is self._drop_seat:
+            return "drop"
+        if seat is self._highlight_seat:
+            return "highlight"
+        return seat.get_state()
+
+    def _static_text(self, text, font):
+        """Layout of a fixed label ("Available", "Reserved"), shared by all seats"""
+        key = (text, font.pixelSize())
+        static = self._static_texts.get(key)
+        if static is None:
+            static = self._static_texts[key] = self._make_static_text(text, font)
+        return static
+
+    def _guest_text(self, guest):
+        """Layout of a guest's name, kept per guest until the name changes"""
+        text = short_guest_name(guest)
+        cached = self._guest_texts.get(guest.guest_id)
+        if cached is None or cached[0] != text:
+            cached = self._guest_texts[guest.guest_id] = (text, self._make_static_text(text, self._font_guest))
+        return cached[1]
+
+    def _make_static_text(self, text, font):
+        static = QStaticText(text)
+        static.setTextFormat(Qt.PlainText)
+        static.setTextWidth(SEAT_SIZE - 4)
+        option = QTextOption(Qt.AlignCenter)
+        option.setWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
+        static.setTextOption(option)
+        static.prepare(font=font)
+        return static
+
+    def _draw_static(self, painter, static, area):
+        """Draw a laid out text centered vertically in `area`"""
+        y = area.y() + (area.height() - static.size().height()) / 2
+        painter.drawStaticText(QPointF(area.x(), y), static)
+
+    def _paint_seat(self, painter, seat, rect):
+        brush, pen, text_color = seat_style(self._seat_status(seat))[:3]
+        painter.setPen(pen)
+        painter.setBrush(brush)
+        painter.drawRoundedRect(rect.adjusted(1, 1, -1, -1), 5, 5)
+
+        painter.setPen(text_color)
+        painter.setFont(self._font_position)
+        painter.drawText(rect.adjusted(2, 4, -2, -SEAT_SIZE // 2), Qt.AlignCenter, seat.get_identifier())
+
+        if seat.guest:
+            static = self._guest_text(seat.guest)
+        else:
+            static = self._static_text("Reserved" if seat.reserved else "Available", self._font_guest)
+        painter.setFont(self._font_guest)
+        self._draw_static(painter, static, rect.adjusted(2, SEAT_SIZE // 2, -2, -2))
+
+    def wheelEvent(self, event):
+        if event.modifiers() & Qt.ControlModifier and self.current_event:
+            steps = event.angleDelta().y() / 120
+            if steps:
+                self.zoom_requested.emit(self.zoom * 1.25 ** steps, event.position().toPoint())
+            event.accept()
+        else:
+            event.ignore()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._press_pos = event.position().toPoint()
+            self._press_seat = self.seat_at(self._press_pos)
+
+    def mouseMoveEvent(self, event):
+        if self._press_seat is None or not self._press_seat.guest:
+            return
+        pos = event.position().toPoint()
+        if (pos - self._press_pos).manhattanLength() < QApplication.startDragDistance():
+            return
+
+        seat = self._press_seat
+        self._press_seat = None
+        rect = self.seat_rect(seat.row, seat.number)
+        drag = QDrag(self)
+        drag.setMimeData(guest_mime_data([seat.guest.guest_id], self.current_event.event_id))
+        drag.setPixmap(drag_pixmap(self._seat_status(seat), rect.width(), rect.height()))
+        drag.setHotSpot(self._press_pos - rect.topLeft())
+        drag.exec(Qt.MoveAction)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton and self._press_seat is not None:
+            seat = self._press_seat
+            self._press_seat = None
+            if seat is self.seat_at(event.position().toPoint()):
+                self.seat_clicked.emit(seat)
+
+    def _set_drop_seat(self, seat):
+        if seat is self._drop_seat:
+            return
+        previous = self._drop_seat
+        self._drop_seat = seat
+        self.refresh_seats([changed for changed in (previous, seat) if changed is not None])
+
+    def dragEnterEvent(self, event):
+        if self.current_event and has_guests(event.mimeData(), self.current_event.event_id):
+            event.acceptProposedAction()
+
+    def dragMoveEvent(self, event):
+        seat = self.seat_at(event.position().toPoint())
+        if seat is not None and seat.is_available():
+            self._set_drop_seat(seat)
+            event.acceptProposedAction()
+        else:
+            self._set_drop_seat(None)
+            event.ignore()
+
+    def dragLeaveEvent(self, event):
+        self._set_drop_seat(None)
+
+    def dropEvent(self, event):
+        seat = self.seat_at(event.position().toPoint())
+        self._set_drop_seat(None)
+        guest_ids = guest_ids_from_mime(event.mimeData(), self.current_event.event_id if self.current_event else None)
+        if seat is None or not guest_ids or not self.controller:
+            event.ignore()
+            return
+        self.controller.drop_guests(guest_ids, seat)
+        event.accept()
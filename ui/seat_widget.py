@@ -1,7 +1,54 @@
-from PySide6.QtWidgets import QFrame, QVBoxLayout, QLabel
-from PySide6.QtGui import QDrag
-from PySide6.QtCore import Qt, QMimeData, Signal
-from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QFrame, QVBoxLayout, QLabel, QApplication
+from PySide6.QtGui import QDrag, QPainter, QColor, QPen, QBrush, QPalette, QPixmap
+from PySide6.QtCore import Qt, Signal
+
+from backend.seat import AVAILABLE, OCCUPIED, RESERVED
+from ui.guest_mime import guest_mime_data, guest_ids_from_mime, has_guests
+
+# (background, border, text) per seat status
+SEAT_COLORS = {
+    AVAILABLE: ("#E0E0E0", "#9E9E9E", "#333333"),
+    OCCUPIED: ("#4CAF50", "#2E7D32", "#FFFFFF"),
+    RESERVED: ("#FFC107", "#F57C00", "#333333"),
+    "drop": ("#81C784", "#4CAF50", "#333333"),
+    "highlight": ("#2196F3", "#0D47A1", "#FFFFFF"),
+}
+
+_seat_styles = {}
+
+
+def seat_style(status):
+    """Return the cached (brush, pen, text color, label palette) for a seat status"""
+    style = _seat_styles.get(status)
+    if style is None:
+        background, border, text = SEAT_COLORS[status]
+        palette = QPalette()
+        palette.setColor(QPalette.WindowText, QColor(text))
+        style = (QBrush(QColor(background)), QPen(QColor(border), 2), QColor(text), palette)
+        _seat_styles[status] = style
+    return style
+
+
+_drag_pixmaps = {}
+
+
+def drag_pixmap(status, width, height):
+    """Return the cached drag image of a seat: its shape in the colors of a status"""
+    key = (status, width, height)
+    pixmap = _drag_pixmaps.get(key)
+    if pixmap is None:
+        brush, pen = seat_style(status)[:2]
+        pixmap = QPixmap(width, height)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(pen)
+        painter.setBrush(brush)
+        painter.drawRoundedRect(pixmap.rect().adjusted(1, 1, -1, -1), 5, 5)
+        painter.end()
+        _drag_pixmaps[key] = pixmap
+    return pixmap
+
 
 class SeatWidget(QFrame):
 
@@ -11,6 +58,10 @@ class SeatWidget(QFrame):
         super().__init__(parent)
         self.seat = seat
         self.controller = controller
+        self._rendered_state = None
+        self._press_pos = None
+        self.status = None
+        self.highlighted = False
         self.setAcceptDrops(True)
         self.setFixedSize(60, 60)
         self.setFrameStyle(QFrame.Box | QFrame.Raised)
@@ -21,12 +72,12 @@ class SeatWidget(QFrame):
 
         self.label_position = QLabel(seat.get_identifier())
         self.label_position.setAlignment(Qt.AlignCenter)
-        self.label_position.setStyleSheet("font-size: 9px; font-weight: bold;")
+        self.label_position.setObjectName("seatPosition")
 
         self.label_guest = QLabel("")
         self.label_guest.setAlignment(Qt.AlignCenter)
         self.label_guest.setWordWrap(True)
-        self.label_guest.setStyleSheet("font-size: 8px;")
+        self.label_guest.setObjectName("seatGuest")
 
         layout.addWidget(self.label_position)
         layout.addWidget(self.label_guest)
@@ -34,109 +85,99 @@ class SeatWidget(QFrame):
 
         self.update_appearance()
 
+    def set_seat(self, seat):
+        """Rebind a pooled widget to another seat"""
+        self.seat = seat
+        self.highlighted = False
+        self.label_position.setText(seat.get_identifier())
+        self.update_appearance()
+
+    def refresh(self):
+        """Repaint only if the seat changed since the last update_appearance()"""
+        if self._rendered_state != (self.seat.get_state(), self.seat.guest):
+            self.update_appearance()
+
+    def set_status(self, status):
+        """Switch to the cached colors of a status (available/occupied/reserved/drop)"""
+        if self.status == status:
+            return
+        self.status = status
+        palette = seat_style(status)[3]
+        self.label_position.setPalette(palette)
+        self.label_guest.setPalette(palette)
+        self.update()
+
+    def paintEvent(self, event):
+        brush, pen = seat_style(self.status)[:2]
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(pen)
+        painter.setBrush(brush)
+        painter.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), 5, 5)
+        painter.end()
+
+    def set_highlighted(self, highlighted):
+        """Mark the seat as a search result"""
+        self.highlighted = highlighted
+        self.update_appearance()
+
     def update_appearance(self):
+        self._rendered_state = (self.seat.get_state(), self.seat.guest)
+        self.set_status("highlight" if self.highlighted else self.seat.get_state())
         if self.seat.guest:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #4CAF50;
-                    border: 2px solid #2E7D32;
-                    border-radius: 5px;
-                }
-                QLabel {
-                    color: white;
-                }
-            """)
             short_name = self.seat.guest.get_full_name()
             if len(short_name) > 15:
                 short_name = short_name[:12] + "..."
             self.label_guest.setText(short_name)
         elif self.seat.reserved:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #FFC107;
-                    border: 2px solid #F57C00;
-                    border-radius: 5px;
-                }
-                QLabel {
-                    color: #333;
-                }
-            """)
             self.label_guest.setText("Reserved")
         else:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #E0E0E0;
-                    border: 2px solid #9E9E9E;
-                    border-radius: 5px;
-                }
-                QLabel {
-                    color: #333;
-                }
-            """)
             self.label_guest.setText("Available")
 
+    def _event_id(self):
+        return self.seat.event.event_id if self.seat.event else None
+
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
-            self.seat_clicked.emit(self.seat)
-
-            if self.seat.guest:
-                # Start drag operation
-                drag = QDrag(self)
-                mime_data = QMimeData()
-                mime_data.setText(f"guest:{id(self.seat.guest)}")
-                drag.setMimeData(mime_data)
-
-                # Create a pixmap for drag
-                pixmap = QPixmap(self.size())
-                self.render(pixmap)
-                drag.setPixmap(pixmap)
-                drag.setHotSpot(event.pos())
-
-                drag.exec(Qt.MoveAction)
+            self._press_pos = event.position().toPoint()
+
+    def mouseMoveEvent(self, event):
+        """Drag the seated guest once the mouse moved past the drag distance"""
+        if self._press_pos is None or self.seat.guest is None:
+            return
+        pos = event.position().toPoint()
+        if (pos - self._press_pos).manhattanLength() < QApplication.startDragDistance():
+            return
+        self._press_pos = None
+        drag = QDrag(self)
+        drag.setMimeData(guest_mime_data([self.seat.guest.guest_id], self._event_id()))
+        drag.setPixmap(drag_pixmap(self.status, self.width(), self.height()))
+        drag.setHotSpot(pos)
+        drag.exec(Qt.MoveAction)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton and self._press_pos is not None:
+            self._press_pos = None
+            if self.rect().contains(event.position().toPoint()):
+                self.seat_clicked.emit(self.seat)
 
     def dragEnterEvent(self, event):
-        if event.mimeData().hasText() and event.mimeData().text().startswith("guest:"):
+        if has_guests(event.mimeData(), self._event_id()):
             if self.seat.is_available():
                 event.acceptProposedAction()
-                self.setStyleSheet("""
-                    QFrame {
-                        background-color: #81C784;
-                        border: 2px solid #4CAF50;
-                        border-radius: 5px;
-                    }
-                """)
+                self.set_status("drop")
 
     def dragLeaveEvent(self, event):
         self.update_appearance()
 
     def dropEvent(self, event):
-        """Handle drop event when a guest is dropped on this seat"""
-        if event.mimeData().hasText():
-            try:
-                text = event.mimeData().text()
-                
-                # Parse the guest ID from "guest:12345" format
-                if text.startswith("guest:"):
-                    guest_id = text.split(":", 1)[1]  # Extract the ID part after "guest:"
-                    
-                    # Use the controller reference instead of navigating parents
-                    if self.controller and hasattr(self.controller, 'move_guest_to_seat'):
-                        self.controller.move_guest_to_seat(guest_id, self.seat)
-                        event.accept()
-                        self.update_appearance()  # Update the visual appearance
-                    else:
-                        print("ERROR: No controller available for move_guest_to_seat")
-                        event.ignore()
-                else:
-                    print(f"ERROR: Invalid MIME data format: {text}")
-                    event.ignore()
-                        
-            except (ValueError, AttributeError) as e:
-                print(f"Error in dropEvent: {e}")
-                traceback.print_exc()
-                event.ignore()
+        """Handle guests dropped on this seat"""
+        guest_ids = guest_ids_from_mime(event.mimeData(), self._event_id())
+        if guest_ids and self.controller:
+            self.controller.drop_guests(guest_ids, self.seat)
+            event.accept()
         else:
             event.ignore()
-            
+
         # Reset appearance after drag operation
         self.update_appearance()
\ No newline at end of file